@@ -0,0 +1,282 @@
+"""Throughput benchmarks for the game engine, featurizer, trainer and MCTS.
+
+Each benchmark's setup builds its inputs from a seeded Generator and returns
+a run() callable that does a fixed amount of work and returns how many units
+of it were done (games, calls, samples, simulations). run_benchmarks times
+run() a few times and keeps the best time, which filters out most scheduler
+noise. Results are plain dicts that serialize to JSON together with
+environment info, so runs from different machines and commits can be told
+apart; compare() checks a run against a stored baseline.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from datetime import UTC, datetime
+
+import numpy as np
+
+# setup(seed, quick) returns run(), which does a fixed amount of work and returns how many units it did
+BenchmarkCase = namedtuple("BenchmarkCase", ["setup", "unit", "higher_is_better", "description"])
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Relative slowdown beyond which compare() flags a regression
+DEFAULT_THRESHOLD = 0.25
+
+_NUM_TURNS = 10
+
+
+def _sample_states(num_states, rng):
+    """Play random games from rng and return num_states snapshots of positions along the way."""
+    from src.game import WingspanGame
+
+    states = []
+    while len(states) < num_states:
+        game = WingspanGame(num_players=2, num_turns=_NUM_TURNS, rng=rng)
+        while not game.game_state.is_game_over() and len(states) < num_states:
+            states.append(game.game_state.clone())
+            player = game.game_state.get_current_player()
+            action = player.request_action(game_state=game.game_state)
+            player.take_action(action=action, game_state=game.game_state)
+            game.game_state.end_player_turn(player=player)
+    return states
+
+
+def _trained_policy(rng):
+    """A LinearPolicy with small random weights, so its choices are not uniform."""
+    from src.rl.linear_policy import LinearPolicy
+
+    policy = LinearPolicy(rng=rng)
+    policy.weights[...] = rng.normal(scale=0.1, size=policy.weights.shape)
+    policy.sub_weights[...] = rng.normal(scale=0.1, size=policy.sub_weights.shape)
+    return policy
+
+
+def _setup_self_play(policy_name, backend):
+    def setup(seed, quick):
+        from src.rl.policy import RandomPolicy
+        from src.rl.self_play import SelfPlayRunner
+
+        rng = np.random.default_rng(seed)
+        policy = RandomPolicy(rng=rng) if policy_name == "random" else _trained_policy(rng)
+        if backend == "batch":
+            num_games = 16 if quick else 512
+        else:
+            num_games = 2 if quick else 50
+        runner = SelfPlayRunner()
+
+        def run():
+            runner.collect_experience(policy, num_games=num_games, num_turns=_NUM_TURNS, backend=backend, rng=rng)
+            return num_games
+
+        return run
+
+    return setup
+
+
+def _setup_featurize(seed, quick):
+    from src.rl.featurizer import featurize
+
+    states = _sample_states(50 if quick else 200, np.random.default_rng(seed))
+    passes = 1 if quick else 20
+
+    def run():
+        for _ in range(passes):
+            for state in states:
+                featurize(state)
+        return passes * len(states)
+
+    return run
+
+
+def _setup_train_batch(seed, quick):
+    from src.rl.self_play import SelfPlayRunner
+    from src.rl.trainer import train_batch
+
+    rng = np.random.default_rng(seed)
+    policy = _trained_policy(rng)
+    buffer, _ = SelfPlayRunner().collect_experience(policy, num_games=5 if quick else 50, num_turns=_NUM_TURNS, rng=rng)
+    action_experiences = buffer.action_experiences()
+    sub_experiences = buffer.sub_experiences()
+    updates = 1 if quick else 500
+
+    def run():
+        for _ in range(updates):
+            train_batch(policy, action_experiences, sub_experiences, learning_rate=1e-4)
+        return updates * (len(action_experiences) + len(sub_experiences))
+
+    return run
+
+
+def _setup_mcts(seed, quick):
+    from src.rl.policy import MCTSPolicy
+
+    states = _sample_states(2 if quick else 4, np.random.default_rng(seed))
+    num_simulations = 20 if quick else 200
+
+    def run():
+        # A fresh, identically seeded search per run keeps the repeats comparable
+        policy = MCTSPolicy(num_simulations=num_simulations, reuse_tree=False, seed=seed)
+        simulations = 0
+        for state in states:
+            policy(state, policy._get_legal_actions(state))
+            simulations += policy.last_search_stats["simulations"]
+        return simulations
+
+    return run
+
+
+def _setup_from_representation(seed, quick):
+    from src.entities.game_state import MCTSGameState
+
+    rng = np.random.default_rng(seed)
+    states = _sample_states(20 if quick else 200, rng)
+    representations = [MCTSGameState.from_game_state(state).to_representation() for state in states]
+    passes = 1 if quick else 20
+
+    def run():
+        for _ in range(passes):
+            for representation in representations:
+                MCTSGameState.from_representation(representation, rng=rng)
+        return passes * len(representations)
+
+    return run
+
+
+BENCHMARKS = {
+    "self_play_random": BenchmarkCase(
+        _setup_self_play("random", "object"), "games/s", True, "RandomPolicy self-play, one WingspanGame at a time"
+    ),
+    "self_play_linear": BenchmarkCase(
+        _setup_self_play("linear", "object"), "games/s", True, "LinearPolicy self-play, one WingspanGame at a time"
+    ),
+    "self_play_linear_batch": BenchmarkCase(
+        _setup_self_play("linear", "batch"), "games/s", True, "LinearPolicy self-play on the BatchGameEngine"
+    ),
+    "featurize": BenchmarkCase(_setup_featurize, "calls/s", True, "featurize() on sampled positions, no tracker"),
+    "train_batch": BenchmarkCase(_setup_train_batch, "samples/s", True, "REINFORCE updates with train_batch"),
+    "mcts": BenchmarkCase(_setup_mcts, "simulations/s", True, "Serial MCTSPolicy decisions from sampled positions"),
+    "from_representation": BenchmarkCase(
+        _setup_from_representation, "us/call", False, "MCTSGameState.from_representation determinization"
+    ),
+}
+
+
+def environment_info():
+    """Describe the machine and code a run was measured on."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_benchmark(name, seed=0, quick=False, repeat=5):
+    """Time one benchmark and return its result dict.
+
+    value is throughput (work per second) from the fastest of repeat runs, or
+    for latency benchmarks (higher_is_better False) microseconds per unit.
+    """
+    case = BENCHMARKS[name]
+    run = case.setup(seed, quick)
+    seconds = []
+    work = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        work = run()
+        seconds.append(time.perf_counter() - start)
+    best = min(seconds)
+    value = work / best if case.higher_is_better else best / work * 1e6
+    return {
+        "value": value,
+        "unit": case.unit,
+        "higher_is_better": case.higher_is_better,
+        "work": work,
+        "seconds": seconds,
+        "description": case.description,
+    }
+
+
+def run_benchmarks(names=None, seed=0, quick=False, repeat=5, progress=None):
+    """Run the named benchmarks (all by default) and return the JSON-ready results.
+
+    progress, if given, is called with (name, result) after each benchmark.
+    """
+    names = list(BENCHMARKS) if names is None else list(names)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks {unknown}. Choose from {list(BENCHMARKS)}.")
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+
+    benchmarks = {}
+    for name in names:
+        benchmarks[name] = run_benchmark(name, seed=seed, quick=quick, repeat=repeat)
+        if progress is not None:
+            progress(name, benchmarks[name])
+    return {
+        "environment": environment_info(),
+        "config": {"seed": seed, "quick": quick, "repeat": repeat},
+        "benchmarks": benchmarks,
+    }
+
+
+def save_results(results, path):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Compare a run against a baseline run, benchmark by benchmark.
+
+    Returns a list of dicts (name, value, baseline, change, regressed), one per
+    benchmark present in both. change is the relative speed-up over the
+    baseline (negative when slower, whatever the unit's direction), and a
+    benchmark has regressed when it is more than threshold slower.
+    """
+    if not 0 <= threshold < 1:
+        raise ValueError(f"threshold must be in [0, 1), got {threshold}")
+    rows = []
+    for name, result in results["benchmarks"].items():
+        reference = baseline["benchmarks"].get(name)
+        if reference is None:
+            continue
+        if result["higher_is_better"]:
+            speed_ratio = result["value"] / reference["value"]
+        else:
+            speed_ratio = reference["value"] / result["value"]
+        rows.append(
+            {
+                "name": name,
+                "value": result["value"],
+                "baseline": reference["value"],
+                "change": speed_ratio - 1,
+                "regressed": speed_ratio < 1 - threshold,
+            }
+        )
+    return rows
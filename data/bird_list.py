@@ -1,184 +1,186 @@
-from src.entities.bird import Bird
+from src.entities.bird import Bird, register_pool
 
-birds = [
-    Bird("Acorn Woodpecker", 5, 3),
-    Bird("American Avocet", 6, 3),
-    Bird("American Bittern", 7, 3),
-    Bird("American Coot", 3, 2),
-    Bird("American Crow", 4, 1),
-    Bird("American Goldfinch", 3, 2),
-    Bird("American Kestrel", 5, 2),
-    Bird("American Oystercatcher", 5, 2),
-    Bird("American Redstart", 4, 2),
-    Bird("American Robin", 1, 2),
-    Bird("American White Pelican", 5, 2),
-    Bird("American Woodcock", 9, 3),
-    Bird("Anhinga", 6, 2),
-    Bird("Annas Hummingbird", 4, 1),
-    Bird("Ash-Throated Flycatcher", 4, 3),
-    Bird("Atlantic Puffin", 8, 3),
-    Bird("Bairds Sparrow", 3, 2),
-    Bird("Bald Eagle", 9, 3),
-    Bird("Baltimore Oriole", 9, 3),
-    Bird("Barn Owl", 5, 2),
-    Bird("Barn Swallow", 1, 1),
-    Bird("Barred Owl", 3, 1),
-    Bird("Barrows Goldeneye", 5, 3),
-    Bird("Bells Vireo", 4, 2),
-    Bird("Belted Kingfisher", 4, 2),
-    Bird("Bewicks Wren", 4, 3),
-    Bird("Black Skimmer", 6, 2),
-    Bird("Black Tern", 4, 2),
-    Bird("Black Vulture", 2, 0),
-    Bird("Black-Bellied Whistling-Duck", 2, 2),
-    Bird("Black-Billed Magpie", 3, 2),
-    Bird("Black-Chinned Hummingbird", 4, 1),
-    Bird("Black-Crowned Night-Heron", 9, 3),
-    Bird("Black-Necked Stilt", 4, 2),
-    Bird("Blue Grosbeak", 4, 3),
-    Bird("Blue Jay", 3, 2),
-    Bird("Blue-Gray Gnatcatcher", 1, 1),
-    Bird("Blue-Winged Warbler", 8, 2),
-    Bird("Bobolink", 4, 3),
-    Bird("Brant", 3, 2),
-    Bird("Brewers Blackbird", 3, 2),
-    Bird("Broad-Winged Hawk", 4, 1),
-    Bird("Bronzed Cowbird", 5, 2),
-    Bird("Brown Pelican", 4, 2),
-    Bird("Brown-Headed Cowbird", 3, 1),
-    Bird("Burrowing Owl", 5, 2),
-    Bird("Bushtit", 2, 2),
-    Bird("California Condor", 1, 0),
-    Bird("California Quail", 3, 3),
-    Bird("Canada Goose", 3, 2),
-    Bird("Canvasback", 4, 2),
-    Bird("Carolina Chickadee", 2, 2),
-    Bird("Carolina Wren", 1, 2),
-    Bird("Cassins Finch", 4, 2),
-    Bird("Cassins Sparrow", 3, 2),
-    Bird("Cedar Waxwing", 3, 2),
-    Bird("Cerulean Warbler", 4, 2),
-    Bird("Chestnut-Collared Longspur", 5, 3),
-    Bird("Chihuahuan Raven", 4, 3),
-    Bird("Chimney Swift", 3, 2),
-    Bird("Chipping Sparrow", 1, 2),
-    Bird("Clarks Grebe", 5, 1),
-    Bird("Clarks Nutcracker", 5, 3),
-    Bird("Common Grackle", 3, 2),
-    Bird("Common Loon", 6, 2),
-    Bird("Common Merganser", 5, 2),
-    Bird("Common Nighthawk", 3, 2),
-    Bird("Common Raven", 5, 3),
-    Bird("Common Yellowthroat", 1, 1),
-    Bird("Coopers Hawk", 3, 1),
-    Bird("Dark-Eyed Junco", 3, 2),
-    Bird("Dickcissel", 4, 3),
-    Bird("Double-Crested Cormorant", 3, 2),
-    Bird("Downy Woodpecker", 3, 3),
-    Bird("Eastern Bluebird", 4, 2),
-    Bird("Eastern Kingbird", 2, 2),
-    Bird("Eastern Phoebe", 3, 2),
-    Bird("Eastern Screech-Owl", 4, 2),
-    Bird("Ferruginous Hawk", 6, 2),
-    Bird("Fish Crow", 6, 2),
-    Bird("Forsters Tern", 4, 2),
-    Bird("Franklins Gull", 3, 2),
-    Bird("Golden Eagle", 8, 3),
-    Bird("Grasshopper Sparrow", 2, 2),
-    Bird("Gray Catbird", 5, 3),
-    Bird("Great Blue Heron", 5, 2),
-    Bird("Great Crested Flycatcher", 5, 2),
-    Bird("Great Egret", 7, 3),
-    Bird("Great Horned Owl", 8, 3),
-    Bird("Greater Prairie-Chicken", 5, 3),
-    Bird("Greater Roadrunner", 7, 3),
-    Bird("Green Heron", 4, 2),
-    Bird("Hermit Thrush", 7, 3),
-    Bird("Hooded Merganser", 5, 2),
-    Bird("Hooded Warbler", 7, 2),
-    Bird("Horned Lark", 5, 2),
-    Bird("House Finch", 3, 2),
-    Bird("House Wren", 1, 1),
-    Bird("Inca Dove", 2, 2),
-    Bird("Indigo Bunting", 5, 3),
-    Bird("Juniper Titmouse", 4, 2),
-    Bird("Killdeer", 1, 2),
-    Bird("King Rail", 4, 3),
-    Bird("Lazuli Bunting", 4, 3),
-    Bird("Lincolns Sparrow", 3, 2),
-    Bird("Loggerhead Shrike", 3, 2),
-    Bird("Mallard", 0, 2),
-    Bird("Mississippi Kite", 4, 2),
-    Bird("Mountain Bluebird", 4, 2),
-    Bird("Mountain Chickadee", 2, 2),
-    Bird("Mourning Dove", 0, 1),
-    Bird("Northern Bobwhite", 5, 3),
-    Bird("Northern Cardinal", 3, 2),
-    Bird("Northern Flicker", 2, 3),
-    Bird("Northern Harrier", 3, 1),
-    Bird("Northern Mockingbird", 2, 2),
-    Bird("Northern Shoveler", 7, 3),
-    Bird("Osprey", 5, 1),
-    Bird("Painted Bunting", 5, 3),
-    Bird("Painted Whitestart", 1, 1),
-    Bird("Peregrine Falcon", 5, 2),
-    Bird("Pied-Billed Grebe", 0, 2),
-    Bird("Pileated Woodpecker", 4, 2),
-    Bird("Pine Siskin", 3, 2),
-    Bird("Prothonotary Warbler", 8, 3),
-    Bird("Purple Gallinule", 7, 3),
-    Bird("Purple Martin", 2, 1),
-    Bird("Pygmy Nuthatch", 2, 2),
-    Bird("Red Crossbill", 6, 2),
-    Bird("Red-Bellied Woodpecker", 1, 2),
-    Bird("Red-Breasted Merganser", 3, 2),
-    Bird("Red-Breasted Nuthatch", 2, 2),
-    Bird("Red-Cockaded Woodpecker", 4, 2),
-    Bird("Red-Eyed Vireo", 3, 2),
-    Bird("Red-Headed Woodpecker", 4, 3),
-    Bird("Red-Shouldered Hawk", 3, 1),
-    Bird("Red-Tailed Hawk", 5, 2),
-    Bird("Red-Winged Blackbird", 2, 1),
-    Bird("Ring-Billed Gull", 4, 2),
-    Bird("Rose-Breasted Grosbeak", 6, 3),
-    Bird("Roseate Spoonbill", 6, 3),
-    Bird("Ruby-Crowned Kinglet", 2, 3),
-    Bird("Ruby-Throated Hummingbird", 4, 1),
-    Bird("Ruddy Duck", 0, 2),
-    Bird("Sandhill Crane", 5, 3),
-    Bird("Savannah Sparrow", 2, 2),
-    Bird("Says Phoebe", 5, 3),
-    Bird("Scaled Quail", 0, 1),
-    Bird("Scissor-Tailed Flycatcher", 8, 3),
-    Bird("Snowy Egret", 4, 2),
-    Bird("Song Sparrow", 0, 3),
-    Bird("Spotted Owl", 5, 2),
-    Bird("Spotted Sandpiper", 5, 1),
-    Bird("Spotted Towhee", 0, 3),
-    Bird("Spragues Pipit", 3, 2),
-    Bird("Stellers Jay", 5, 3),
-    Bird("Swainsons Hawk", 5, 2),
-    Bird("Tree Swallow", 3, 2),
-    Bird("Trumpeter Swan", 9, 3),
-    Bird("Tufted Titmouse", 2, 3),
-    Bird("Turkey Vulture", 1, 0),
-    Bird("Vauxs Swift", 2, 1),
-    Bird("Violet-Green Swallow", 3, 2),
-    Bird("Western Meadowlark", 2, 2),
-    Bird("Western Tanager", 6, 3),
-    Bird("White-Breasted Nuthatch", 2, 2),
-    Bird("White-Crowned Sparrow", 2, 2),
-    Bird("White-Faced Ibis", 8, 3),
-    Bird("White-Throated Swift", 2, 1),
-    Bird("Whooping Crane", 6, 3),
-    Bird("Wild Turkey", 8, 3),
-    Bird("Willet", 4, 2),
-    Bird("Wilsons Snipe", 5, 1),
-    Bird("Wood Duck", 4, 3),
-    Bird("Wood Stork", 6, 3),
-    Bird("Yellow-Bellied Sapsucker", 3, 2),
-    Bird("Yellow-Billed Cuckoo", 5, 3),
-    Bird("Yellow-Breasted Chat", 5, 3),
-    Bird("Yellow-Headed Blackbird", 4, 2),
-    Bird("Yellow-Rumped Warbler", 1, 3),
-]
+birds = register_pool(
+    [
+        Bird("Acorn Woodpecker", 5, 3),
+        Bird("American Avocet", 6, 3),
+        Bird("American Bittern", 7, 3),
+        Bird("American Coot", 3, 2),
+        Bird("American Crow", 4, 1),
+        Bird("American Goldfinch", 3, 2),
+        Bird("American Kestrel", 5, 2),
+        Bird("American Oystercatcher", 5, 2),
+        Bird("American Redstart", 4, 2),
+        Bird("American Robin", 1, 2),
+        Bird("American White Pelican", 5, 2),
+        Bird("American Woodcock", 9, 3),
+        Bird("Anhinga", 6, 2),
+        Bird("Annas Hummingbird", 4, 1),
+        Bird("Ash-Throated Flycatcher", 4, 3),
+        Bird("Atlantic Puffin", 8, 3),
+        Bird("Bairds Sparrow", 3, 2),
+        Bird("Bald Eagle", 9, 3),
+        Bird("Baltimore Oriole", 9, 3),
+        Bird("Barn Owl", 5, 2),
+        Bird("Barn Swallow", 1, 1),
+        Bird("Barred Owl", 3, 1),
+        Bird("Barrows Goldeneye", 5, 3),
+        Bird("Bells Vireo", 4, 2),
+        Bird("Belted Kingfisher", 4, 2),
+        Bird("Bewicks Wren", 4, 3),
+        Bird("Black Skimmer", 6, 2),
+        Bird("Black Tern", 4, 2),
+        Bird("Black Vulture", 2, 0),
+        Bird("Black-Bellied Whistling-Duck", 2, 2),
+        Bird("Black-Billed Magpie", 3, 2),
+        Bird("Black-Chinned Hummingbird", 4, 1),
+        Bird("Black-Crowned Night-Heron", 9, 3),
+        Bird("Black-Necked Stilt", 4, 2),
+        Bird("Blue Grosbeak", 4, 3),
+        Bird("Blue Jay", 3, 2),
+        Bird("Blue-Gray Gnatcatcher", 1, 1),
+        Bird("Blue-Winged Warbler", 8, 2),
+        Bird("Bobolink", 4, 3),
+        Bird("Brant", 3, 2),
+        Bird("Brewers Blackbird", 3, 2),
+        Bird("Broad-Winged Hawk", 4, 1),
+        Bird("Bronzed Cowbird", 5, 2),
+        Bird("Brown Pelican", 4, 2),
+        Bird("Brown-Headed Cowbird", 3, 1),
+        Bird("Burrowing Owl", 5, 2),
+        Bird("Bushtit", 2, 2),
+        Bird("California Condor", 1, 0),
+        Bird("California Quail", 3, 3),
+        Bird("Canada Goose", 3, 2),
+        Bird("Canvasback", 4, 2),
+        Bird("Carolina Chickadee", 2, 2),
+        Bird("Carolina Wren", 1, 2),
+        Bird("Cassins Finch", 4, 2),
+        Bird("Cassins Sparrow", 3, 2),
+        Bird("Cedar Waxwing", 3, 2),
+        Bird("Cerulean Warbler", 4, 2),
+        Bird("Chestnut-Collared Longspur", 5, 3),
+        Bird("Chihuahuan Raven", 4, 3),
+        Bird("Chimney Swift", 3, 2),
+        Bird("Chipping Sparrow", 1, 2),
+        Bird("Clarks Grebe", 5, 1),
+        Bird("Clarks Nutcracker", 5, 3),
+        Bird("Common Grackle", 3, 2),
+        Bird("Common Loon", 6, 2),
+        Bird("Common Merganser", 5, 2),
+        Bird("Common Nighthawk", 3, 2),
+        Bird("Common Raven", 5, 3),
+        Bird("Common Yellowthroat", 1, 1),
+        Bird("Coopers Hawk", 3, 1),
+        Bird("Dark-Eyed Junco", 3, 2),
+        Bird("Dickcissel", 4, 3),
+        Bird("Double-Crested Cormorant", 3, 2),
+        Bird("Downy Woodpecker", 3, 3),
+        Bird("Eastern Bluebird", 4, 2),
+        Bird("Eastern Kingbird", 2, 2),
+        Bird("Eastern Phoebe", 3, 2),
+        Bird("Eastern Screech-Owl", 4, 2),
+        Bird("Ferruginous Hawk", 6, 2),
+        Bird("Fish Crow", 6, 2),
+        Bird("Forsters Tern", 4, 2),
+        Bird("Franklins Gull", 3, 2),
+        Bird("Golden Eagle", 8, 3),
+        Bird("Grasshopper Sparrow", 2, 2),
+        Bird("Gray Catbird", 5, 3),
+        Bird("Great Blue Heron", 5, 2),
+        Bird("Great Crested Flycatcher", 5, 2),
+        Bird("Great Egret", 7, 3),
+        Bird("Great Horned Owl", 8, 3),
+        Bird("Greater Prairie-Chicken", 5, 3),
+        Bird("Greater Roadrunner", 7, 3),
+        Bird("Green Heron", 4, 2),
+        Bird("Hermit Thrush", 7, 3),
+        Bird("Hooded Merganser", 5, 2),
+        Bird("Hooded Warbler", 7, 2),
+        Bird("Horned Lark", 5, 2),
+        Bird("House Finch", 3, 2),
+        Bird("House Wren", 1, 1),
+        Bird("Inca Dove", 2, 2),
+        Bird("Indigo Bunting", 5, 3),
+        Bird("Juniper Titmouse", 4, 2),
+        Bird("Killdeer", 1, 2),
+        Bird("King Rail", 4, 3),
+        Bird("Lazuli Bunting", 4, 3),
+        Bird("Lincolns Sparrow", 3, 2),
+        Bird("Loggerhead Shrike", 3, 2),
+        Bird("Mallard", 0, 2),
+        Bird("Mississippi Kite", 4, 2),
+        Bird("Mountain Bluebird", 4, 2),
+        Bird("Mountain Chickadee", 2, 2),
+        Bird("Mourning Dove", 0, 1),
+        Bird("Northern Bobwhite", 5, 3),
+        Bird("Northern Cardinal", 3, 2),
+        Bird("Northern Flicker", 2, 3),
+        Bird("Northern Harrier", 3, 1),
+        Bird("Northern Mockingbird", 2, 2),
+        Bird("Northern Shoveler", 7, 3),
+        Bird("Osprey", 5, 1),
+        Bird("Painted Bunting", 5, 3),
+        Bird("Painted Whitestart", 1, 1),
+        Bird("Peregrine Falcon", 5, 2),
+        Bird("Pied-Billed Grebe", 0, 2),
+        Bird("Pileated Woodpecker", 4, 2),
+        Bird("Pine Siskin", 3, 2),
+        Bird("Prothonotary Warbler", 8, 3),
+        Bird("Purple Gallinule", 7, 3),
+        Bird("Purple Martin", 2, 1),
+        Bird("Pygmy Nuthatch", 2, 2),
+        Bird("Red Crossbill", 6, 2),
+        Bird("Red-Bellied Woodpecker", 1, 2),
+        Bird("Red-Breasted Merganser", 3, 2),
+        Bird("Red-Breasted Nuthatch", 2, 2),
+        Bird("Red-Cockaded Woodpecker", 4, 2),
+        Bird("Red-Eyed Vireo", 3, 2),
+        Bird("Red-Headed Woodpecker", 4, 3),
+        Bird("Red-Shouldered Hawk", 3, 1),
+        Bird("Red-Tailed Hawk", 5, 2),
+        Bird("Red-Winged Blackbird", 2, 1),
+        Bird("Ring-Billed Gull", 4, 2),
+        Bird("Rose-Breasted Grosbeak", 6, 3),
+        Bird("Roseate Spoonbill", 6, 3),
+        Bird("Ruby-Crowned Kinglet", 2, 3),
+        Bird("Ruby-Throated Hummingbird", 4, 1),
+        Bird("Ruddy Duck", 0, 2),
+        Bird("Sandhill Crane", 5, 3),
+        Bird("Savannah Sparrow", 2, 2),
+        Bird("Says Phoebe", 5, 3),
+        Bird("Scaled Quail", 0, 1),
+        Bird("Scissor-Tailed Flycatcher", 8, 3),
+        Bird("Snowy Egret", 4, 2),
+        Bird("Song Sparrow", 0, 3),
+        Bird("Spotted Owl", 5, 2),
+        Bird("Spotted Sandpiper", 5, 1),
+        Bird("Spotted Towhee", 0, 3),
+        Bird("Spragues Pipit", 3, 2),
+        Bird("Stellers Jay", 5, 3),
+        Bird("Swainsons Hawk", 5, 2),
+        Bird("Tree Swallow", 3, 2),
+        Bird("Trumpeter Swan", 9, 3),
+        Bird("Tufted Titmouse", 2, 3),
+        Bird("Turkey Vulture", 1, 0),
+        Bird("Vauxs Swift", 2, 1),
+        Bird("Violet-Green Swallow", 3, 2),
+        Bird("Western Meadowlark", 2, 2),
+        Bird("Western Tanager", 6, 3),
+        Bird("White-Breasted Nuthatch", 2, 2),
+        Bird("White-Crowned Sparrow", 2, 2),
+        Bird("White-Faced Ibis", 8, 3),
+        Bird("White-Throated Swift", 2, 1),
+        Bird("Whooping Crane", 6, 3),
+        Bird("Wild Turkey", 8, 3),
+        Bird("Willet", 4, 2),
+        Bird("Wilsons Snipe", 5, 1),
+        Bird("Wood Duck", 4, 3),
+        Bird("Wood Stork", 6, 3),
+        Bird("Yellow-Bellied Sapsucker", 3, 2),
+        Bird("Yellow-Billed Cuckoo", 5, 3),
+        Bird("Yellow-Breasted Chat", 5, 3),
+        Bird("Yellow-Headed Blackbird", 4, 2),
+        Bird("Yellow-Rumped Warbler", 1, 3),
+    ]
+)
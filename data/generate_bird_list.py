@@ -13,5 +13,8 @@ with open("data/bird_data.csv") as file:
 
 with open("data/bird_list.py", "w") as output_file:
     output_file.write(
-        "from src.entities.bird import Bird\n\n" + "birds = " + repr(bird_list).replace("'", "").replace("), ", "),\n")
+        "from src.entities.bird import Bird, register_pool\n\n"
+        + "birds = register_pool("
+        + repr(bird_list).replace("'", "").replace("), ", "),\n")
+        + ")\n"
     )
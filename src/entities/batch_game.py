@@ -0,0 +1,218 @@
+"""Vectorized engine that advances many games in lockstep.
+
+BatchGameEngine stores N games as stacked arrays (the same layout as
+CompactGame with a leading game axis) and applies one decision per game per
+call, so the per-decision cost is a few NumPy operations over the whole batch
+instead of Python object manipulation per game. Rules follow CompactGame.
+
+Choices passed to the apply_* methods must be legal; take them from the
+corresponding *_mask method.
+"""
+
+import numpy as np
+
+from src.entities.compact_game import (
+    BIRD_COSTS,
+    BIRD_POINTS,
+    BOARD_CAPACITY,
+    CHOOSE_A_BIRD_TO_DRAW_PHASE,
+    CHOOSE_A_BIRD_TO_PLAY_PHASE,
+    CHOOSE_ACTION_PHASE,
+    DRAW_A_BIRD,
+    EMPTY_SLOT,
+    FEEDER_CAPACITY,
+    GAIN_FOOD,
+    NUM_BIRDS,
+    PLAY_A_BIRD,
+    TOTAL_ALLOWED_IN_STARTING_HAND,
+    TRAY_CAPACITY,
+)
+
+
+class BatchGameEngine:
+    """N games stored as arrays with a leading game axis.
+
+    Attributes:
+        deck (np.ndarray): Int (N, NUM_BIRDS) draw order per game, padded with -1 after deck_size.
+        deck_top (np.ndarray): Int (N,) index of the next card to draw.
+        tray (np.ndarray): Int (N, TRAY_CAPACITY) bird id per slot, EMPTY_SLOT when empty.
+        hand (np.ndarray): Bool (N, num_players, NUM_BIRDS).
+        board (np.ndarray): Bool (N, num_players, NUM_BIRDS).
+        food, board_count, turns_remaining, scores (np.ndarray): Int (N, num_players).
+        bird_feeder, game_turn, phase (np.ndarray): Int (N,).
+    """
+
+    def __init__(self, num_games, num_players=2, num_turns=10, num_starting_cards=2, rng=None, decks=None):
+        if num_games < 1:
+            raise ValueError("Number of games must be at least 1.")
+        elif num_players < 1:
+            raise ValueError("Number of players must be at least 1.")
+        elif num_turns < 1:
+            raise ValueError("Number of turns must be at least 1.")
+        elif num_starting_cards < 0:
+            raise ValueError("Number of starting cards cannot be negative.")
+
+        if rng is None:
+            rng = np.random
+
+        self.num_games = num_games
+        self.num_players = num_players
+        self.num_turns = num_turns
+
+        # Independent shuffle per game, unless the deck orders are given
+        if decks is None:
+            decks = self.shuffled_decks(num_games, rng)
+        elif np.shape(decks) != (num_games, NUM_BIRDS):
+            raise ValueError(f"decks must have shape ({num_games}, {NUM_BIRDS}), got {np.shape(decks)}.")
+        self.deck = np.array(decks, dtype=np.int16)
+        self.deck_size = np.full(num_games, NUM_BIRDS, dtype=np.int64)
+
+        games = np.arange(num_games)[:, None]
+        self.hand = np.zeros((num_games, num_players, NUM_BIRDS), dtype=bool)
+        top = 0
+        for player in range(num_players):
+            self.hand[games, player, self.deck[:, top : top + num_starting_cards]] = True
+            top += num_starting_cards
+        self.deck_top = np.full(num_games, top, dtype=np.int64)
+
+        self.board = np.zeros((num_games, num_players, NUM_BIRDS), dtype=bool)
+        self.board_count = np.zeros((num_games, num_players), dtype=np.int64)
+        self.food = np.full((num_games, num_players), TOTAL_ALLOWED_IN_STARTING_HAND - num_starting_cards)
+        self.turns_remaining = np.full((num_games, num_players), num_turns, dtype=np.int64)
+        self.scores = np.zeros((num_games, num_players), dtype=np.int64)
+        self.tray = np.full((num_games, TRAY_CAPACITY), EMPTY_SLOT, dtype=np.int16)
+        self.bird_feeder = np.full(num_games, FEEDER_CAPACITY, dtype=np.int64)
+        self.game_turn = np.zeros(num_games, dtype=np.int64)
+        self.phase = np.full(num_games, CHOOSE_ACTION_PHASE, dtype=np.int64)
+
+        self._refill_tray(np.arange(num_games))
+
+    @staticmethod
+    def shuffled_decks(num_games, rng=None):
+        """Return (num_games, NUM_BIRDS) independent deck orders (bird ids, top first)."""
+        if rng is None:
+            rng = np.random
+        return np.argsort(rng.random((num_games, NUM_BIRDS)), axis=1).astype(np.int16)
+
+    @classmethod
+    def from_compact_games(cls, games):
+        """Stack CompactGames that share num_players and num_turns into one batch."""
+        first = games[0]
+        if any(g.num_players != first.num_players or g.num_turns != first.num_turns for g in games):
+            raise ValueError("All games must have the same number of players and turns.")
+
+        engine = cls.__new__(cls)
+        engine.num_games = len(games)
+        engine.num_players = first.num_players
+        engine.num_turns = first.num_turns
+
+        engine.deck = np.full((len(games), NUM_BIRDS), EMPTY_SLOT, dtype=np.int16)
+        for i, g in enumerate(games):
+            engine.deck[i, : len(g.deck)] = g.deck
+        engine.deck_size = np.array([len(g.deck) for g in games], dtype=np.int64)
+        engine.deck_top = np.array([g.deck_top for g in games], dtype=np.int64)
+        engine.tray = np.stack([g.tray for g in games]).astype(np.int16)
+        engine.hand = np.stack([g.hand for g in games])
+        engine.board = np.stack([g.board for g in games])
+        engine.board_count = engine.board.sum(axis=2).astype(np.int64)
+        engine.food = np.stack([g.food for g in games]).astype(np.int64)
+        engine.turns_remaining = np.stack([g.turns_remaining for g in games]).astype(np.int64)
+        engine.scores = np.stack([g.scores for g in games]).astype(np.int64)
+        engine.bird_feeder = np.array([g.bird_feeder for g in games], dtype=np.int64)
+        engine.game_turn = np.array([g.game_turn for g in games], dtype=np.int64)
+        engine.phase = np.array([g.phase for g in games], dtype=np.int64)
+        return engine
+
+    # --- Queries (per game) ---
+
+    def current_player(self, games=None):
+        """Index of the player to move in each game."""
+        turn = self.game_turn if games is None else self.game_turn[games]
+        return turn % self.num_players
+
+    def is_game_over(self):
+        return self.game_turn == self.num_turns * self.num_players
+
+    def deck_count(self, games=None):
+        if games is None:
+            return self.deck_size - self.deck_top
+        return self.deck_size[games] - self.deck_top[games]
+
+    def board_scores(self):
+        """Live board score for every game and player, shape (N, num_players)."""
+        return self.board @ BIRD_POINTS.astype(np.int64)
+
+    def playable_mask(self, games):
+        """Bool (n, NUM_BIRDS): affordable birds in the current player's hand."""
+        player = self.current_player(games)
+        return self.hand[games, player] & (BIRD_COSTS <= self.food[games, player][:, None])
+
+    def action_mask(self, games):
+        """Bool (n, 3): legal CHOOSE_ACTION codes for the current player."""
+        player = self.current_player(games)
+        mask = np.zeros((len(games), 3), dtype=bool)
+        mask[:, PLAY_A_BIRD] = (self.board_count[games, player] < BOARD_CAPACITY) & self.playable_mask(games).any(
+            axis=1
+        )
+        mask[:, GAIN_FOOD] = True
+        mask[:, DRAW_A_BIRD] = (self.deck_count(games) > 0) | (self.tray[games] != EMPTY_SLOT).any(axis=1)
+        return mask
+
+    def draw_mask(self, games):
+        """Bool (n, TRAY_CAPACITY + 1): occupied tray slots, then the deck."""
+        return np.column_stack([self.tray[games] != EMPTY_SLOT, self.deck_count(games) > 0])
+
+    # --- Mutations (one decision per listed game) ---
+
+    def apply_choose_action(self, games, actions):
+        """Apply CHOOSE_ACTION codes; gain_food completes the turn, the others move to a sub-decision."""
+        gain = games[actions == GAIN_FOOD]
+        self._gain_food(gain)
+        self._end_turn(gain)
+        self.phase[games[actions == PLAY_A_BIRD]] = CHOOSE_A_BIRD_TO_PLAY_PHASE
+        self.phase[games[actions == DRAW_A_BIRD]] = CHOOSE_A_BIRD_TO_DRAW_PHASE
+
+    def apply_play(self, games, bird_ids):
+        """Play one bird per game from the current player's hand and end the turn."""
+        player = self.current_player(games)
+        self.food[games, player] -= BIRD_COSTS[bird_ids]
+        self.hand[games, player, bird_ids] = False
+        self.board[games, player, bird_ids] = True
+        self.board_count[games, player] += 1
+        self._end_turn(games)
+
+    def apply_draw(self, games, slots):
+        """Draw from a tray slot, or from the deck when slot == TRAY_CAPACITY, and end the turn."""
+        player = self.current_player(games)
+        from_deck = slots == TRAY_CAPACITY
+
+        deck_games = games[from_deck]
+        self.hand[deck_games, player[from_deck], self.deck[deck_games, self.deck_top[deck_games]]] = True
+        self.deck_top[deck_games] += 1
+
+        tray_games = games[~from_deck]
+        tray_slots = slots[~from_deck]
+        self.hand[tray_games, player[~from_deck], self.tray[tray_games, tray_slots]] = True
+        self.tray[tray_games, tray_slots] = EMPTY_SLOT
+
+        self._end_turn(games)
+
+    def _gain_food(self, games):
+        player = self.current_player(games)
+        feeder = self.bird_feeder[games] - 1
+        self.bird_feeder[games] = np.where(feeder <= 0, FEEDER_CAPACITY, feeder)
+        self.food[games, player] += 1
+
+    def _refill_tray(self, games):
+        for slot in range(TRAY_CAPACITY):
+            refill = games[(self.tray[games, slot] == EMPTY_SLOT) & (self.deck_count(games) > 0)]
+            self.tray[refill, slot] = self.deck[refill, self.deck_top[refill]]
+            self.deck_top[refill] += 1
+
+    def _end_turn(self, games):
+        player = self.current_player(games)
+        self._refill_tray(games)
+        self.turns_remaining[games, player] -= 1
+        self.scores[games, player] = self.board[games, player] @ BIRD_POINTS.astype(np.int64)
+        self.game_turn[games] += 1
+        self.phase[games] = CHOOSE_ACTION_PHASE
@@ -1,10 +1,40 @@
 class Bird:
-    """A bird card with a name, victory point value, and food cost to play."""
+    """A bird card with a name, victory point value, and food cost to play.
 
-    def __init__(self, common_name, points, food_cost):
-        self.common_name = common_name
-        self.points = points
-        self.food_cost = food_cost
+    Birds are immutable. The birds of the game's pool (data.bird_list) are
+    interned: each is created once, carries a stable integer bird_id (its
+    position in the list) and can be looked up with get_bird. Birds built
+    elsewhere, e.g. in tests, have bird_id None.
+    """
+
+    __slots__ = ("common_name", "points", "food_cost", "bird_id")
+
+    def __init__(self, common_name, points, food_cost, bird_id=None):
+        object.__setattr__(self, "common_name", common_name)
+        object.__setattr__(self, "points", points)
+        object.__setattr__(self, "food_cost", food_cost)
+        object.__setattr__(self, "bird_id", bird_id)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Bird is immutable; cannot set '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Bird is immutable; cannot delete '{name}'")
+
+    def __reduce__(self):
+        # Pool birds unpickle to the interned instance of the receiving process
+        if self.bird_id is not None:
+            return get_bird, (self.bird_id,)
+        return Bird, (self.common_name, self.points, self.food_cost)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"Bird({self.common_name!r}, {self.points}, {self.food_cost})"
 
     def get_name(self):
         return self.common_name
@@ -15,6 +45,9 @@ class Bird:
     def get_food_cost(self):
         return self.food_cost
 
+    def get_id(self):
+        return self.bird_id
+
     def to_representation(self):
         """Return (points, food_cost) tuple for use in state representations."""
         return (self.points, self.food_cost)
@@ -22,3 +55,94 @@ class Bird:
     def activate(self):
         # Add code for activation behavior here
         pass
+
+
+# --- Registry of the interned bird pool (filled by data.bird_list) ---
+
+_BIRDS_BY_ID = []
+# _AFFORDABLE_MASKS[food]: bitmask (bit bird_id) of the pool birds costing at most food
+_AFFORDABLE_MASKS = []
+
+
+def register_pool(birds):
+    """Intern the bird pool: give every bird its list position as bird_id and return them as a list.
+
+    Called once by data.bird_list.
+    """
+    if _BIRDS_BY_ID:
+        raise RuntimeError("The bird pool is already registered.")
+    for bird_id, bird in enumerate(birds):
+        object.__setattr__(bird, "bird_id", bird_id)
+        _BIRDS_BY_ID.append(bird)
+    max_cost = max((bird.food_cost for bird in _BIRDS_BY_ID), default=0)
+    mask = 0
+    for food in range(max_cost + 1):
+        for bird in _BIRDS_BY_ID:
+            if bird.food_cost == food:
+                mask |= 1 << bird.bird_id
+        _AFFORDABLE_MASKS.append(mask)
+    return list(_BIRDS_BY_ID)
+
+
+def get_bird(bird_id):
+    """Return the interned pool bird with the given id."""
+    if not _BIRDS_BY_ID:
+        import data.bird_list  # noqa: F401  (registers the pool)
+    return _BIRDS_BY_ID[bird_id]
+
+
+def bird_mask(birds):
+    """Bitmask with bit bird_id set for each bird, or None if any bird is outside the pool."""
+    mask = 0
+    for bird in birds:
+        bird_id = getattr(bird, "bird_id", None)
+        if bird_id is None:
+            return None
+        mask |= 1 << bird_id
+    return mask
+
+
+class BirdMaskMixin:
+    """Keeps a container's bitmask (bit Bird.bird_id) of its birds current as birds come and go.
+
+    Containers call _reset_mask when their contents are replaced and
+    _mark/_unmark as single birds move in and out. Birds without a pool
+    bird_id (e.g. test birds, bonus cards) cannot be masked; while any is
+    held, _current_mask returns None.
+    """
+
+    def _reset_mask(self, birds):
+        self._mask = 0
+        self._num_unmasked = 0
+        for bird in birds:
+            self._mark(bird)
+
+    def _copy_mask(self, other):
+        self._mask = other._mask
+        self._num_unmasked = other._num_unmasked
+
+    def _mark(self, bird):
+        bird_id = getattr(bird, "bird_id", None)
+        if bird_id is None:
+            self._num_unmasked += 1
+        else:
+            self._mask |= 1 << bird_id
+
+    def _unmark(self, bird):
+        bird_id = getattr(bird, "bird_id", None)
+        if bird_id is None:
+            self._num_unmasked -= 1
+        else:
+            self._mask &= ~(1 << bird_id)
+
+    def _current_mask(self):
+        return self._mask if self._num_unmasked == 0 else None
+
+
+def affordable_mask(food):
+    """Bitmask of the pool birds a player with the given food can pay for."""
+    if not _AFFORDABLE_MASKS:
+        import data.bird_list  # noqa: F401  (registers the pool)
+    if food < 0:
+        return 0
+    return _AFFORDABLE_MASKS[min(food, len(_AFFORDABLE_MASKS) - 1)]
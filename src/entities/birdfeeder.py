@@ -4,6 +4,9 @@ class BirdFeeder:
     def __init__(self, food_count=0):
         self.food_count = food_count
 
+    def clone(self):
+        return BirdFeeder(food_count=self.food_count)
+
     class NotEmptyError(Exception):
         pass
 
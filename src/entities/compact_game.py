@@ -0,0 +1,328 @@
+"""Array-backed game engine for headless self-play.
+
+CompactGame represents a whole game as a handful of small integer NumPy arrays
+indexed by bird id (the bird's position in data.bird_list) instead of Deck,
+BirdHand, Tray, GameBoard, FoodSupply and Player objects. It follows the same
+rules as WingspanGame: the legal actions match Player._enumerate_legal_actions
+and MCTSPolicy._get_legal_actions, and apply_action matches
+MCTSPolicy._apply_action (one decision per call, turn ends after the final
+decision of an action).
+
+Sub-decisions are expressed as bird ids; DECK stands for "draw from the deck".
+"""
+
+import numpy as np
+
+from data.bird_list import birds as _ALL_BIRDS
+from src.constants import VALID_PHASES
+
+# --- Bird pool (bird id = index into data.bird_list) ---
+
+NUM_BIRDS = len(_ALL_BIRDS)
+BIRD_NAMES = [b.get_name() for b in _ALL_BIRDS]
+BIRD_POINTS = np.array([b.get_points() for b in _ALL_BIRDS], dtype=np.int16)
+BIRD_COSTS = np.array([b.get_food_cost() for b in _ALL_BIRDS], dtype=np.int16)
+BIRD_NAME_TO_ID = {name: i for i, name in enumerate(BIRD_NAMES)}
+
+# --- Action and phase codes ---
+
+# CHOOSE_ACTION codes, same order as Player.actions and featurizer.ACTION_INDEX
+PLAY_A_BIRD, GAIN_FOOD, DRAW_A_BIRD = 0, 1, 2
+ACTION_NAMES = ["play_a_bird", "gain_food", "draw_a_bird"]
+
+# Phase codes, indices into constants.VALID_PHASES
+CHOOSE_ACTION_PHASE, CHOOSE_A_BIRD_TO_PLAY_PHASE, CHOOSE_A_BIRD_TO_DRAW_PHASE = 0, 1, 2
+
+# Sub-decision code for drawing the top card of the deck
+DECK = -1
+# Marker for an empty tray slot
+EMPTY_SLOT = -1
+
+TRAY_CAPACITY = 3
+BOARD_CAPACITY = 5
+FEEDER_CAPACITY = 5
+TOTAL_ALLOWED_IN_STARTING_HAND = 5
+
+
+class CompactGame:
+    """A single game stored as integer arrays.
+
+    Attributes:
+        deck (np.ndarray): Bird ids in draw order; cards before deck_top have been drawn.
+        tray (np.ndarray): Bird id per tray slot, EMPTY_SLOT when empty.
+        hand (np.ndarray): Bool (num_players, NUM_BIRDS) hand membership.
+        board (np.ndarray): Bool (num_players, NUM_BIRDS) board membership.
+        food (np.ndarray): Food tokens per player.
+        board_count (np.ndarray): Birds on each player's board.
+        turns_remaining (np.ndarray): Turns left per player.
+        scores (np.ndarray): Score per player, updated at the end of each turn like Player.score.
+    """
+
+    def __init__(
+        self,
+        num_turns,
+        deck,
+        tray,
+        hand,
+        board,
+        food,
+        turns_remaining,
+        bird_feeder=FEEDER_CAPACITY,
+        game_turn=0,
+        phase=CHOOSE_ACTION_PHASE,
+        deck_top=0,
+        num_discarded=0,
+        scores=None,
+    ):
+        self.num_turns = num_turns
+        self.num_players = hand.shape[0]
+        self.deck = deck
+        self.deck_top = deck_top
+        self.num_discarded = num_discarded
+        self.tray = tray
+        self.hand = hand
+        self.board = board
+        self.board_count = board.sum(axis=1).astype(np.int16)
+        self.food = food
+        self.turns_remaining = turns_remaining
+        if scores is None:
+            scores = (board * BIRD_POINTS).sum(axis=1).astype(np.int16)
+        self.scores = scores
+        self.bird_feeder = bird_feeder
+        self.game_turn = game_turn
+        self.phase = phase
+
+    @classmethod
+    def new(cls, num_players=2, num_turns=10, num_starting_cards=2, rng=None):
+        """Deal a fresh game the same way WingspanGame._initialize_game_state does."""
+        if num_players < 1:
+            raise ValueError("Number of players must be at least 1.")
+        elif num_turns < 1:
+            raise ValueError("Number of turns must be at least 1.")
+        elif num_starting_cards < 0:
+            raise ValueError("Number of starting cards cannot be negative.")
+
+        if rng is None:
+            rng = np.random
+        deck = rng.permutation(NUM_BIRDS).astype(np.int16)
+
+        hand = np.zeros((num_players, NUM_BIRDS), dtype=bool)
+        deck_top = 0
+        for player in range(num_players):
+            hand[player, deck[deck_top : deck_top + num_starting_cards]] = True
+            deck_top += num_starting_cards
+
+        food = np.full(num_players, TOTAL_ALLOWED_IN_STARTING_HAND - num_starting_cards, dtype=np.int16)
+        tray = np.full(TRAY_CAPACITY, EMPTY_SLOT, dtype=np.int16)
+        game = cls(
+            num_turns=num_turns,
+            deck=deck,
+            tray=tray,
+            hand=hand,
+            board=np.zeros((num_players, NUM_BIRDS), dtype=bool),
+            food=food,
+            turns_remaining=np.full(num_players, num_turns, dtype=np.int16),
+            deck_top=deck_top,
+        )
+        game._refill_tray()
+        return game
+
+    @classmethod
+    def from_game_state(cls, game_state):
+        """Pack an object GameState (whose birds come from data.bird_list) into arrays."""
+        players = game_state.get_players()
+        num_players = len(players)
+
+        def ids(birds):
+            return [b.bird_id for b in birds]
+
+        hand = np.zeros((num_players, NUM_BIRDS), dtype=bool)
+        board = np.zeros((num_players, NUM_BIRDS), dtype=bool)
+        for i, player in enumerate(players):
+            hand[i, ids(player.get_bird_hand().get_cards_in_hand())] = True
+            board[i, ids(player.get_game_board().get_birds())] = True
+
+        tray_state = game_state.get_tray()
+        tray = np.full(tray_state.capacity, EMPTY_SLOT, dtype=np.int16)
+        tray_ids = ids(tray_state.get_birds_in_tray())
+        tray[: len(tray_ids)] = tray_ids
+
+        return cls(
+            num_turns=game_state.num_turns,
+            deck=np.array(ids(game_state.get_bird_deck().cards), dtype=np.int16),
+            tray=tray,
+            hand=hand,
+            board=board,
+            food=np.array([p.get_food_supply().amount for p in players], dtype=np.int16),
+            turns_remaining=np.array([p.get_turns_remaining() for p in players], dtype=np.int16),
+            bird_feeder=game_state.get_bird_feeder().food_count,
+            game_turn=game_state.game_turn,
+            phase=VALID_PHASES.index(game_state.phase),
+            num_discarded=game_state.get_discard_pile().get_count(),
+            scores=np.array([p.get_score() for p in players], dtype=np.int16),
+        )
+
+    def copy(self):
+        """Return an independent copy (arrays are copied, not shared)."""
+        game = CompactGame.__new__(CompactGame)
+        game.__dict__.update(self.__dict__)
+        for attr in ("tray", "hand", "board", "board_count", "food", "turns_remaining", "scores"):
+            setattr(game, attr, getattr(self, attr).copy())
+        # The deck order is never mutated, only the cursor moves
+        return game
+
+    # --- Queries ---
+
+    def get_current_player(self):
+        """Return the index of the player whose turn it is."""
+        return self.game_turn % self.num_players
+
+    def get_phase(self):
+        return VALID_PHASES[self.phase]
+
+    def get_deck_count(self):
+        return len(self.deck) - self.deck_top
+
+    def get_tray_birds(self):
+        """Return the ids of birds in the tray, in slot order."""
+        return self.tray[self.tray != EMPTY_SLOT]
+
+    def get_hand_birds(self, player):
+        return np.flatnonzero(self.hand[player])
+
+    def get_board_birds(self, player):
+        return np.flatnonzero(self.board[player])
+
+    def is_game_over(self):
+        return self.game_turn == self.num_turns * self.num_players
+
+    def get_scores(self):
+        return self.scores.tolist()
+
+    def determine_winners(self):
+        """Return the indices of players tied for the highest score."""
+        return np.flatnonzero(self.scores == self.scores.max()).tolist()
+
+    def playable_birds(self, player=None):
+        """Ids of birds in hand the player can afford (board capacity is not checked)."""
+        if player is None:
+            player = self.get_current_player()
+        return np.flatnonzero(self.hand[player] & (BIRD_COSTS <= self.food[player]))
+
+    def can_play_a_bird(self, player=None):
+        if player is None:
+            player = self.get_current_player()
+        if self.board_count[player] >= BOARD_CAPACITY:
+            return False
+        return bool((self.hand[player] & (BIRD_COSTS <= self.food[player])).any())
+
+    def can_draw_a_bird(self):
+        return self.get_deck_count() > 0 or bool((self.tray != EMPTY_SLOT).any())
+
+    def legal_actions(self):
+        """Legal decisions for the current phase.
+
+        CHOOSE_ACTION: action codes (PLAY_A_BIRD / GAIN_FOOD / DRAW_A_BIRD).
+        CHOOSE_A_BIRD_TO_PLAY: ids of affordable birds in hand.
+        CHOOSE_A_BIRD_TO_DRAW: tray bird ids, plus DECK when the deck is not empty.
+        """
+        if self.phase == CHOOSE_ACTION_PHASE:
+            actions = []
+            if self.can_play_a_bird():
+                actions.append(PLAY_A_BIRD)
+            actions.append(GAIN_FOOD)
+            if self.can_draw_a_bird():
+                actions.append(DRAW_A_BIRD)
+            return actions
+        elif self.phase == CHOOSE_A_BIRD_TO_PLAY_PHASE:
+            return self.playable_birds().tolist()
+        else:
+            choices = self.get_tray_birds().tolist()
+            if self.get_deck_count() > 0:
+                choices.append(DECK)
+            return choices
+
+    # --- Mutations ---
+
+    def apply_action(self, action):
+        """Apply one decision for the current player, ending the turn when the action completes."""
+        player = self.get_current_player()
+
+        if self.phase == CHOOSE_ACTION_PHASE:
+            if action == GAIN_FOOD:
+                self._gain_food(player)
+                self.end_player_turn()
+            elif action == PLAY_A_BIRD:
+                self.phase = CHOOSE_A_BIRD_TO_PLAY_PHASE
+            elif action == DRAW_A_BIRD:
+                self.phase = CHOOSE_A_BIRD_TO_DRAW_PHASE
+            else:
+                raise ValueError(f"Unexpected action '{action}' for phase {self.get_phase()}")
+        elif self.phase == CHOOSE_A_BIRD_TO_PLAY_PHASE:
+            self._play_bird(player, action)
+            self.end_player_turn()
+        else:
+            if action == DECK:
+                self._draw_from_deck(player)
+            else:
+                self._draw_from_tray(player, action)
+            self.end_player_turn()
+
+    def _gain_food(self, player):
+        """Take one food from the bird feeder, rerolling it when emptied (see BirdFeeder.take_food)."""
+        self.bird_feeder -= 1
+        if self.bird_feeder <= 0:
+            self.bird_feeder = FEEDER_CAPACITY
+        self.food[player] += 1
+
+    def _play_bird(self, player, bird_id):
+        if not self.hand[player, bird_id]:
+            raise ValueError(f"Card {BIRD_NAMES[bird_id]} not in hand")
+        if self.food[player] < BIRD_COSTS[bird_id]:
+            raise ValueError("Not enough food supply!")
+        if self.board_count[player] >= BOARD_CAPACITY:
+            raise ValueError("Game board is full. Cannot add more birds.")
+        self.food[player] -= BIRD_COSTS[bird_id]
+        self.hand[player, bird_id] = False
+        self.board[player, bird_id] = True
+        self.board_count[player] += 1
+
+    def _draw_from_deck(self, player):
+        if self.get_deck_count() == 0:
+            raise ValueError("Deck is empty")
+        self.hand[player, self.deck[self.deck_top]] = True
+        self.deck_top += 1
+
+    def _draw_from_tray(self, player, bird_id):
+        slots = np.flatnonzero(self.tray == bird_id)
+        if bird_id == EMPTY_SLOT or len(slots) == 0:
+            raise ValueError(f"{bird_id} does not exist in the tray.")
+        self.tray[slots[0]] = EMPTY_SLOT
+        self.hand[player, bird_id] = True
+
+    def _refill_tray(self):
+        """Fill empty tray slots from the top of the deck (see Tray.refill)."""
+        for slot in np.flatnonzero(self.tray == EMPTY_SLOT):
+            if self.get_deck_count() == 0:
+                break
+            self.tray[slot] = self.deck[self.deck_top]
+            self.deck_top += 1
+
+    def end_player_turn(self):
+        """Refill the tray, update the player's score and turn count, and advance the turn."""
+        player = self.get_current_player()
+        if (self.tray == EMPTY_SLOT).any():
+            self._refill_tray()
+        self.turns_remaining[player] -= 1
+        self.scores[player] = BIRD_POINTS[self.board[player]].sum()
+        self.game_turn += 1
+        self.phase = CHOOSE_ACTION_PHASE
+
+    def rollout(self, rng=None):
+        """Play to the end choosing uniformly among legal decisions (like RandomPolicy). Returns scores."""
+        if rng is None:
+            rng = np.random
+        while not self.is_game_over():
+            actions = self.legal_actions()
+            self.apply_action(actions[int(rng.random() * len(actions))])
+        return self.get_scores()
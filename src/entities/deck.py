@@ -2,41 +2,137 @@ import random
 
 
 class Deck:
-    """An ordered collection of cards. Draws from the top (index 0)."""
+    """An ordered collection of cards. Draws from the top.
 
-    def __init__(self, cards=None):
-        if cards is None:
-            self.cards = []
-        else:
-            self.cards = cards
+    Cards live in a buffer with a cursor at the top of the deck: the cards
+    still in the deck are buffer[top:], and drawing just advances the cursor.
+    The slots before the cursor are free and may be overwritten.
+
+    Targeted removals (remove_and_return_bird, remove_bird_with_representation)
+    swap the removed card with the top card and advance the cursor, so they
+    are O(1) but move the former top card to the removed card's place in the
+    deck order.
+
+    Shuffles use rng, a numpy Generator, or the global random module if None.
+    """
+
+    def __init__(self, cards=None, rng=None):
+        self._buffer = [] if cards is None else list(cards)
+        self.rng = rng
+        self._top = 0
+        # Lazily built bird representation -> set of buffer positions in the
+        # deck, for remove_bird_with_representation
+        self._positions = None
+
+    @property
+    def cards(self):
+        """The cards still in the deck, top first (a new list)."""
+        return self._buffer[self._top :]
+
+    @cards.setter
+    def cards(self, cards):
+        self._buffer = list(cards)
+        self._top = 0
+        self._positions = None
 
     def get_count(self):
-        return len(self.cards)
+        return len(self._buffer) - self._top
+
+    def clone(self):
+        """Return a copy with its own card list, sharing the (immutable) cards."""
+        return Deck(self._buffer[self._top :], rng=self.rng)
 
     def add_card(self, card):
-        self.cards.append(card)
+        """Add a card to the bottom of the deck."""
+        if self._positions is not None:
+            self._positions.setdefault(card.to_representation(), set()).add(len(self._buffer))
+        self._buffer.append(card)
 
     def prepare_deck(self, cards):
         """Add cards to the deck and shuffle."""
-        self.cards.extend(cards)
+        self._buffer.extend(cards)
         self._shuffle()
 
+    def peek(self, n):
+        """Return (without drawing) up to n cards from the top, top first."""
+        return self._buffer[self._top : self._top + n]
+
+    def return_to_top(self, cards):
+        """Put cards back on top of the deck in the given order (top first), e.g. to undo draws."""
+        n = len(cards)
+        if n <= self._top:
+            # Reuse the buffer slots before the cursor, which hold only drawn cards
+            self._top -= n
+            self._buffer[self._top : self._top + n] = cards
+            self._positions = None
+        else:
+            self.cards = list(cards) + self.cards
+
+    def _take(self, i):
+        """Remove the card at buffer position i (in the deck) by swapping it with the top card."""
+        top = self._top
+        buffer = self._buffer
+        card = buffer[i]
+        if self._positions is not None:
+            self._positions[card.to_representation()].remove(i)
+        if i != top:
+            moved = buffer[top]
+            buffer[i], buffer[top] = moved, card
+            if self._positions is not None:
+                positions = self._positions[moved.to_representation()]
+                positions.remove(top)
+                positions.add(i)
+        self._top = top + 1
+        return card
+
     def remove_and_return_bird(self, condition):
-        """Remove and return the first bird meeting the condition.
+        """Remove and return the first bird meeting the condition. The top card takes its place.
 
         Raises:
             ValueError: If no bird meets the condition.
         """
-        for i, bird in enumerate(self.cards):
-            if condition(bird):
-                return self.cards.pop(i)
+        buffer = self._buffer
+        for i in range(self._top, len(buffer)):
+            if condition(buffer[i]):
+                return self._take(i)
         raise ValueError("No bird in the deck meets the condition")
 
+    def remove_bird_with_representation(self, representation):
+        """Remove and return a bird whose to_representation() is representation. The top card takes its place.
+
+        Uses a position index built on the first call and kept current in O(1)
+        per draw, add or removal, so repeated removals (e.g. rebuilding a hand,
+        board and tray from their representations) don't rescan the deck.
+
+        Raises:
+            ValueError: If no bird has that representation.
+        """
+        if self._positions is None:
+            self._positions = {}
+            for i in range(self._top, len(self._buffer)):
+                self._positions.setdefault(self._buffer[i].to_representation(), set()).add(i)
+        positions = self._positions.get(representation)
+        if not positions:
+            raise ValueError(f"No bird in the deck has representation {representation}")
+        return self._take(next(iter(positions)))
+
     def draw_card(self):
         """Draw and return the top card. Raises ValueError if empty."""
-        if self.get_count() == 0:
+        if self._top == len(self._buffer):
             raise ValueError("Deck is empty")
-        return self.cards.pop(0)
+        card = self._buffer[self._top]
+        if self._positions is not None:
+            self._positions[card.to_representation()].remove(self._top)
+        self._top += 1
+        return card
 
     def _shuffle(self):
-        random.shuffle(self.cards)
+        """Shuffle the cards still in the deck in place."""
+        shuffle = random.shuffle if self.rng is None else self.rng.shuffle
+        if self._top == 0:
+            shuffle(self._buffer)
+        else:
+            live = self._buffer[self._top :]
+            shuffle(live)
+            self._buffer[self._top :] = live
+        self._positions = None
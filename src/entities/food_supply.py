@@ -4,6 +4,9 @@ class FoodSupply:
     def __init__(self, initial_amount=0):
         self.amount = initial_amount
 
+    def clone(self):
+        return FoodSupply(initial_amount=self.amount)
+
     def increment(self, amount):
         self.amount += amount
 
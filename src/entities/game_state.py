@@ -1,4 +1,81 @@
-from src.constants import VALID_PHASES
+import copy
+import random
+from collections import namedtuple
+
+from src.constants import CHOOSE_A_BIRD_TO_DRAW, CHOOSE_A_BIRD_TO_PLAY, CHOOSE_ACTION, VALID_PHASES
+
+# Everything MCTSGameState.apply_move can change, captured so undo_move can restore it.
+# Containers are shallow copies: birds are never mutated, only moved between containers.
+MoveRecord = namedtuple(
+    "MoveRecord",
+    [
+        "game_turn",
+        "phase",
+        "player_index",
+        "food",
+        "turns_remaining",
+        "score",
+        "hand_cards",
+        "board_birds",
+        "tray_birds",
+        "bird_feeder",
+        "deck_top",
+        "deck_count",
+    ],
+)
+
+
+# Empty tray/board slot in representations
+_EMPTY_SLOT_REPRESENTATION = (0, 0)
+
+# Bird pool grouped by (points, food_cost) representation, built on first use
+_POOL_BY_REPRESENTATION = None
+
+
+def _pool_by_representation():
+    global _POOL_BY_REPRESENTATION
+    if _POOL_BY_REPRESENTATION is None:
+        from data.bird_list import birds as bird_list
+
+        buckets = {}
+        for bird in bird_list:
+            buckets.setdefault(bird.to_representation(), []).append(bird)
+        _POOL_BY_REPRESENTATION = {rep: tuple(birds) for rep, birds in buckets.items()}
+    return _POOL_BY_REPRESENTATION
+
+
+class _BirdSampler:
+    """Draws birds from the pool without replacement, by (points, food_cost) representation.
+
+    Each bucket keeps its remaining birds in the front of a list; taking a bird
+    swaps a uniformly chosen one to the end of the live region, so every draw
+    is O(1). Choices come from rng, a numpy Generator, or the global random
+    module if None.
+    """
+
+    def __init__(self, rng=None):
+        self.buckets = {rep: list(birds) for rep, birds in _pool_by_representation().items()}
+        self.sizes = {rep: len(birds) for rep, birds in self.buckets.items()}
+        self.rng = rng
+
+    def take(self, representation):
+        size = self.sizes.get(representation, 0)
+        if size == 0:
+            raise ValueError("No bird in the deck meets the condition")
+        bucket = self.buckets[representation]
+        i = random.randrange(size) if self.rng is None else int(self.rng.random() * size)
+        size -= 1
+        bucket[i], bucket[size] = bucket[size], bucket[i]
+        self.sizes[representation] = size
+        return bucket[size]
+
+    def take_all(self, representations):
+        """Take one bird per non-empty slot representation, in order."""
+        return [self.take(rep) for rep in representations if rep != _EMPTY_SLOT_REPRESENTATION]
+
+    def remaining(self):
+        """Birds not yet taken, as a new list."""
+        return [bird for rep, bucket in self.buckets.items() for bird in bucket[: self.sizes[rep]]]
 
 
 class GameState:
@@ -34,6 +111,32 @@ class GameState:
         self.bird_feeder = bird_feeder
         self.players = players
 
+        # Optional FeatureTracker kept in sync with card moves (see src.rl.feature_tracker)
+        self.feature_tracker = None
+
+    def clone(self, with_tracker=True):
+        """Return an independent copy for search, without deep-copying.
+
+        Copies only the mutable containers (deck, tray, hands, boards, food
+        supplies, feeder); birds and player policies are shared. An attached
+        FeatureTracker is cloned and re-hooked to the copied hands, unless
+        with_tracker is False (e.g. for search tree states, which are never
+        featurized).
+        """
+        state = copy.copy(self)
+        state.bird_deck = self.bird_deck.clone()
+        state.discard_pile = self.discard_pile.clone()
+        state.tray = self.tray.clone()
+        state.bird_feeder = self.bird_feeder.clone()
+        state.players = [player.clone() for player in self.players]
+        state.feature_tracker = None
+        if with_tracker and self.feature_tracker is not None:
+            hands = [player.get_bird_hand() for player in state.players]
+            state.feature_tracker = self.feature_tracker.clone(hands)
+            for hand in hands:
+                hand.feature_tracker = state.feature_tracker
+        return state
+
     def get_num_turns(self):
         return self.num_turns
 
@@ -75,6 +178,8 @@ class GameState:
         """Ends the given player's turn: refills tray, updates turn accounting."""
         if self.tray.is_not_full():
             self.tray.refill(self.bird_deck)
+        if self.feature_tracker is not None:
+            self.feature_tracker.on_end_turn(self)
 
         player.end_turn()
         self.game_turn += 1
@@ -137,15 +242,30 @@ class MCTSGameState(GameState):
         return num_turns - (game_turn // num_players)
 
     def _construct_player(
-        self, hand, representation, deck, game_turn, num_turns, num_players, name, playout_policy=None
+        self,
+        hand,
+        representation,
+        deck,
+        game_turn,
+        num_turns,
+        num_players,
+        name,
+        playout_policy=None,
+        game_board=None,
+        rng=None,
     ):
-        """Construct a BotPlayer from a state representation."""
+        """Construct a BotPlayer from a state representation.
+
+        The board is drawn from deck to match the representation unless an
+        already-built game_board is passed.
+        """
         from src.entities.food_supply import FoodSupply
         from src.entities.gameboard import GameBoard
         from src.utilities.player_factory import create_bot_player
 
         food_supply = FoodSupply(initial_amount=representation["food_supply"])
-        game_board = GameBoard.from_representation(representation["game_board"], deck)
+        if game_board is None:
+            game_board = GameBoard.from_representation(representation["game_board"], deck)
         num_turns_remaining = self._get_turns_remaining(
             num_turns=num_turns, game_turn=game_turn, num_players=num_players
         )
@@ -158,7 +278,78 @@ class MCTSGameState(GameState):
         }
         if playout_policy is not None:
             kwargs["policy"] = playout_policy
-        return create_bot_player(**kwargs)
+        return create_bot_player(rng=rng, **kwargs)
+
+    def apply_move(self, action):
+        """Apply one decision in place and return a MoveRecord for undo_move.
+
+        action is a CHOOSE_ACTION action name, or a bird name (or "deck" when
+        drawing) in the bird sub-phases. Turn-ending decisions run
+        end_player_turn, including the tray refill.
+        """
+        player_index = self.game_turn % self.num_players
+        player = self.players[player_index]
+        record = MoveRecord(
+            game_turn=self.game_turn,
+            phase=self.phase,
+            player_index=player_index,
+            food=player.food_supply.amount,
+            turns_remaining=player.turns_remaining,
+            score=player.score,
+            hand_cards=dict(player.bird_hand.cards),
+            board_birds=list(player.game_board.birds),
+            tray_birds=dict(self.tray.birds),
+            bird_feeder=self.bird_feeder.food_count,
+            # A move draws at most one card to hand plus a full tray refill
+            deck_top=self.bird_deck.peek(self.tray.capacity + 1),
+            deck_count=self.bird_deck.get_count(),
+        )
+
+        if self.phase == CHOOSE_ACTION:
+            if action == "gain_food":
+                player.gain_food(self.bird_feeder)
+                self.end_player_turn(player)
+            elif action == "play_a_bird":
+                self.set_phase(CHOOSE_A_BIRD_TO_PLAY)
+            elif action == "draw_a_bird":
+                self.set_phase(CHOOSE_A_BIRD_TO_DRAW)
+            else:
+                raise ValueError(f"Unexpected action '{action}' for phase {self.phase}")
+        elif self.phase == CHOOSE_A_BIRD_TO_PLAY:
+            food_cost = player.bird_hand.get_card(action).get_food_cost()
+            player.food_supply.decrement(food_cost)
+            player.bird_hand.play_bird(action, player.game_board)
+            self.end_player_turn(player)
+        elif self.phase == CHOOSE_A_BIRD_TO_DRAW:
+            if action == "deck":
+                player.bird_hand.draw_card_from_deck(self.bird_deck)
+            else:
+                player.bird_hand.draw_bird_from_tray(self.tray, action)
+            self.end_player_turn(player)
+        else:
+            raise ValueError(f"Unexpected phase: {self.phase}")
+
+        return record
+
+    def undo_move(self, record):
+        """Restore the state to just before the apply_move that returned record."""
+        player = self.players[record.player_index]
+        drawn = record.deck_count - self.bird_deck.get_count()
+        self.bird_deck.return_to_top(record.deck_top[:drawn])
+
+        self.game_turn = record.game_turn
+        self.phase = record.phase
+        player.food_supply.amount = record.food
+        player.turns_remaining = record.turns_remaining
+        player.score = record.score
+        player.bird_hand.cards = record.hand_cards
+        player.game_board.birds = record.board_birds
+        self.tray.birds = record.tray_birds
+        self.bird_feeder.food_count = record.bird_feeder
+
+        if self.feature_tracker is not None:
+            # Tracker updates are not reversible; rebuild it from the restored state
+            self.feature_tracker = self.feature_tracker.attach(self, check=self.feature_tracker.check)
 
     def to_representation(self):
         """Serialize the full game state as a hashable frozenset."""
@@ -176,75 +367,116 @@ class MCTSGameState(GameState):
         return frozenset(state_dict.items())
 
     @classmethod
-    def from_representation(cls, representation, playout_policy=None):
+    def from_representation(cls, representation, playout_policy=None, rng=None):
         """Reconstruct an MCTSGameState from a hashable representation.
 
+        Known cards (tray, current hand, all boards) are sampled uniformly from
+        the matching (points, food_cost) bucket of the bird pool; opponent hands
+        and the drawable top of the deck are sampled uniformly from the rest.
+
         If playout_policy is provided, all reconstructed BotPlayers use it
         instead of the default RandomPolicy.
+
+        Sampling and the default RandomPolicy bots draw from rng, a numpy
+        Generator, or the global random state if None.
         """
-        from data.bird_list import birds as bird_list
         from src.entities.birdfeeder import BirdFeeder
         from src.entities.deck import Deck
+        from src.entities.gameboard import GameBoard
         from src.entities.hand import BirdHand
         from src.entities.tray import Tray
 
         state_dict = dict(representation)
-
-        bird_feeder = BirdFeeder(food_count=state_dict["bird_feeder"])
+        sampler = _BirdSampler(rng=rng)
 
         num_opponents = len(state_dict["opponents"])
         game_state = cls(
             num_turns=state_dict["num_turns"],
             game_turn=state_dict["game_turn"],
             phase=state_dict["phase"],
-            bird_feeder=bird_feeder,
-            bird_deck=Deck(),
-            discard_pile=Deck(),
+            bird_feeder=BirdFeeder(food_count=state_dict["bird_feeder"]),
+            bird_deck=Deck(rng=rng),
+            discard_pile=Deck(rng=rng),
             tray=None,
             players=[None] * (num_opponents + 1),
         )
 
-        # Start with a full deck, then remove birds as we reconstruct state
-        valid_bird_deck = game_state.get_bird_deck()
-        valid_bird_deck.prepare_deck(bird_list)
+        # Place every known card before dealing hidden ones, so a hidden opponent
+        # hand can never take the only bird matching a board slot
+        tray = Tray(capacity=len(state_dict["tray"]))
+        for bird in sampler.take_all(state_dict["tray"]):
+            tray.add_bird(bird)
+        game_state.set_tray(tray)
 
-        # Reconstruct tray
-        game_state.set_tray(Tray.from_representation(state_dict["tray"], valid_bird_deck))
-
-        # Reconstruct current player
         rep_current = dict(state_dict["current_player"])
-        hand_current = BirdHand.from_representation(rep_current["hand"], valid_bird_deck)
+        hand_current = BirdHand()
+        for bird in sampler.take_all(rep_current["hand"]):
+            hand_current.add_card(bird, bird.get_name())
+
+        rep_opponents = [dict(rep) for rep in state_dict["opponents"]]
+        boards = []
+        for rep in [rep_current] + rep_opponents:
+            board = GameBoard(capacity=len(rep["game_board"]))
+            board.birds = sampler.take_all(rep["game_board"])
+            boards.append(board)
+
+        # Deal hidden cards from the rest of the pool. Only the opponent hands and
+        # the part of the deck that can still be drawn (at most one card per
+        # remaining turn, plus a tray refill) need a random order; the other
+        # cards stay in pool order at the bottom of the deck and in the discard pile.
+        hidden = sampler.remaining()
+        num_hidden_hand = sum(rep["hand"] for rep in rep_opponents)
+        num_deck = state_dict["bird_deck"]
+        cards_to_discard = len(hidden) - num_hidden_hand - num_deck
+        if cards_to_discard != state_dict["discard_pile"]:
+            raise ValueError(
+                f"Cards to discard ({cards_to_discard}) doesn't match "
+                f"discard pile representation ({state_dict['discard_pile']})"
+            )
+        turns_left = state_dict["num_turns"] * (num_opponents + 1) - state_dict["game_turn"]
+        num_drawable = min(num_deck, turns_left + tray.capacity)
+        # Partial Fisher-Yates shuffle of the prefix
+        for i in range(num_hidden_hand + num_drawable):
+            if rng is None:
+                j = random.randrange(i, len(hidden))
+            else:
+                j = i + int(rng.random() * (len(hidden) - i))
+            hidden[i], hidden[j] = hidden[j], hidden[i]
+        top = 0
+
         current_player = game_state._construct_player(
             hand=hand_current,
             representation=rep_current,
-            deck=valid_bird_deck,
+            deck=None,
             game_turn=state_dict["game_turn"],
             num_turns=state_dict["num_turns"],
             num_players=num_opponents + 1,
             name="current_player",
             playout_policy=playout_policy,
+            game_board=boards[0],
+            rng=rng,
         )
 
-        # Reconstruct opponents
         opponents = []
         opponent_game_turn = state_dict["game_turn"]
-        for i in range(num_opponents):
-            rep_opponent = dict(state_dict["opponents"][i])
+        for i, rep_opponent in enumerate(rep_opponents):
             hand_opponent = BirdHand()
-            for _ in range(rep_opponent["hand"]):
-                bird = valid_bird_deck.draw_card()
+            for bird in hidden[top : top + rep_opponent["hand"]]:
                 hand_opponent.add_card(bird, bird.get_name())
+            top += rep_opponent["hand"]
             opponent_game_turn += 1
             opponents.append(
                 game_state._construct_player(
                     hand=hand_opponent,
                     representation=rep_opponent,
-                    deck=valid_bird_deck,
+                    deck=None,
                     game_turn=opponent_game_turn,
                     num_turns=state_dict["num_turns"],
                     num_players=num_opponents + 1,
                     name=f"opponent_{i}",
                     playout_policy=playout_policy,
+                    game_board=boards[i + 1],
+                    rng=rng,
                 )
             )
 
@@ -257,23 +489,15 @@ class MCTSGameState(GameState):
             )
         )
 
-        # Validate and fill discard pile
-        valid_discard_pile = game_state.get_discard_pile()
-        cards_to_discard = valid_bird_deck.get_count() - state_dict["bird_deck"]
-        if cards_to_discard != state_dict["discard_pile"]:
-            raise ValueError(
-                f"Cards to discard ({cards_to_discard}) doesn't match "
-                f"discard pile representation ({state_dict['discard_pile']})"
-            )
-        for _ in range(cards_to_discard):
-            valid_discard_pile.add_card(valid_bird_deck.draw_card())
+        game_state.get_bird_deck().cards = hidden[top : top + num_deck]
+        game_state.get_discard_pile().cards = hidden[top + num_deck :]
 
         return game_state
 
     @classmethod
     def from_game_state(cls, game_state):
         """Convert a GameState to an MCTSGameState."""
-        return cls(
+        state = cls(
             num_turns=game_state.num_turns,
             bird_deck=game_state.bird_deck,
             discard_pile=game_state.discard_pile,
@@ -283,3 +507,6 @@ class MCTSGameState(GameState):
             game_turn=game_state.game_turn,
             phase=game_state.phase,
         )
+        # The players (and their hands' tracker hooks) are shared, so share the tracker too
+        state.feature_tracker = getattr(game_state, "feature_tracker", None)
+        return state
@@ -1,15 +1,41 @@
+from src.entities.bird import BirdMaskMixin
 from src.utilities.utils import render_bird_container
 
 
-class GameBoard:
+class GameBoard(BirdMaskMixin):
     def __init__(self, capacity=5):
         self.capacity = capacity
         self.birds = []
 
+    @property
+    def birds(self):
+        """List of birds on the board. Change it through the board's methods so the bird mask stays current."""
+        return self._birds
+
+    @birds.setter
+    def birds(self, birds):
+        self._birds = birds
+        self._reset_mask(birds)
+
+    def clone(self):
+        """Return a copy with its own slots, sharing the (immutable) birds."""
+        game_board = GameBoard(capacity=self.capacity)
+        game_board._birds = list(self._birds)
+        game_board._copy_mask(self)
+        return game_board
+
     def get_birds(self):
         """Public getter for the birds on the game board."""
         return self.birds
 
+    def get_bird_ids(self):
+        """Pool ids (Bird.bird_id) of the birds on the board, None for birds outside the pool."""
+        return [bird.bird_id for bird in self.birds]
+
+    def get_bird_mask(self):
+        """Bitmask (bit Bird.bird_id) of the birds on the board, or None if a bird is outside the pool."""
+        return self._current_mask()
+
     def check_if_full(self):
         """Returns True if the game board is full, False otherwise."""
         return len(self.birds) == self.capacity
@@ -23,7 +49,8 @@ class GameBoard:
         """
         if self.check_if_full():
             raise ValueError("Game board is full. Cannot add more birds.")
-        self.birds.append(bird)
+        self._birds.append(bird)
+        self._mark(bird)
 
     def render(self):
         """Renders the game board."""
@@ -48,6 +75,6 @@ class GameBoard:
         gameboard = cls(capacity=capacity)
         for bird_rep in representation:
             if bird_rep != (0, 0):
-                bird = deck.remove_and_return_bird(lambda b, rep=bird_rep: b.to_representation() == rep)
+                bird = deck.remove_bird_with_representation(bird_rep)
                 gameboard.add_bird(bird)
         return gameboard
@@ -1,15 +1,50 @@
+from src.entities.bird import BirdMaskMixin
+from src.utilities.events import DECK_EMPTY, NULL_SINK
 from src.utilities.utils import render_bird_container
 
 
-class Hand:
+class Hand(BirdMaskMixin):
     """A generic hand of cards, that can be used for both the player's bird cards and the player's bonus cards."""
 
     def __init__(self):
         self.cards = {}
+        # Optional FeatureTracker notified when cards move (see src.rl.feature_tracker)
+        self.feature_tracker = None
+        # Receives game events such as an empty deck (see src.utilities.events)
+        self.event_sink = NULL_SINK
+
+    @property
+    def cards(self):
+        """Dict of card name -> card. Change it through the hand's methods so bird_mask stays current."""
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards):
+        self._cards = cards
+        self._reset_mask(cards.values())
+
+    @property
+    def bird_mask(self):
+        """Bitmask (bit Bird.bird_id) of the birds in hand, or None if a card is outside the pool."""
+        return self._current_mask()
+
+    def clone(self):
+        """Return a copy of the same hand type with its own card dict, sharing the cards.
+
+        The copy is not hooked to a FeatureTracker; GameState.clone re-attaches one.
+        """
+        hand = self.__class__()
+        hand._cards = dict(self._cards)
+        hand._copy_mask(self)
+        return hand
 
     def add_card(self, card, card_name):
         """Add a card to the hand"""
-        self.cards[card_name] = card
+        replaced = self._cards.get(card_name)
+        if replaced is not None:
+            self._unmark(replaced)
+        self._cards[card_name] = card
+        self._mark(card)
 
     def get_card(self, card_name):
         """Get a card from the hand"""
@@ -29,19 +64,25 @@ class Hand:
 
     def remove_card(self, card_name):
         """Remove a card from the hand and return it"""
-        if card_name not in self.cards:
+        if card_name not in self._cards:
             raise ValueError(f"Card {card_name} not in hand")
-        return self.cards.pop(card_name)
+        card = self._cards.pop(card_name)
+        self._unmark(card)
+        return card
 
     def draw_card_from_deck(self, deck):
-        """Draw a card from the deck and add it to the hand"""
+        """Draw a card from the deck and add it to the hand. Returns the card, or None if the deck is empty."""
         try:
             card = deck.draw_card()
-            card_name = card.get_name()
-            self.add_card(card, card_name)  # Pass the card_name parameter when calling add_card
         except ValueError as e:
             # Handle the case where the deck is empty
-            print(f"Error: {str(e)}")
+            self.event_sink.emit(DECK_EMPTY, error=e)
+            return None
+        card_name = card.get_name()
+        self.add_card(card, card_name)  # Pass the card_name parameter when calling add_card
+        if self.feature_tracker is not None:
+            self.feature_tracker.on_add_to_hand(self, card)
+        return card
 
     def discard_card(self, card_name):
         """Discard a card from the hand"""
@@ -55,14 +96,23 @@ class Hand:
 class BirdHand(Hand):
     """A hand specifically for bird cards"""
 
+    def get_bird_ids(self):
+        """Pool ids (Bird.bird_id) of the birds in hand, None for birds outside the pool."""
+        return [bird.bird_id for bird in self.cards.values()]
+
     def draw_bird_from_tray(self, tray, bird_name):
         """Draw a bird from the tray and add it to the hand"""
         bird = tray.draw_bird(bird_name)
         self.add_card(bird, card_name=bird_name)
+        if self.feature_tracker is not None:
+            self.feature_tracker.on_add_to_hand(self, bird)
 
     def play_bird(self, bird_name, game_board):
         """Play a bird from the hand"""
-        game_board.add_bird(self.remove_card(bird_name))
+        bird = self.remove_card(bird_name)
+        game_board.add_bird(bird)
+        if self.feature_tracker is not None:
+            self.feature_tracker.on_play_bird(self, bird)
 
     def tuck_card(self, card_name):
         """Tuck a card from the hand"""
@@ -77,6 +127,6 @@ class BirdHand(Hand):
         """Reconstruct a BirdHand from a representation by drawing matching birds from the deck."""
         hand = cls()
         for bird_rep in representation:
-            bird = bird_deck.remove_and_return_bird(lambda b, rep=bird_rep: b.to_representation() == rep)
+            bird = bird_deck.remove_bird_with_representation(bird_rep)
             hand.add_card(card=bird, card_name=bird.get_name())
         return hand
@@ -1,5 +1,9 @@
+import copy
+
 from src.constants import CHOOSE_A_BIRD_TO_DRAW, CHOOSE_A_BIRD_TO_PLAY
+from src.entities.bird import affordable_mask
 from src.entities.gameboard import GameBoard
+from src.utilities.events import DREW_FROM_DECK, NULL_SINK, PrintEventSink
 
 
 class Player:
@@ -7,11 +11,16 @@ class Player:
 
     Subclasses must implement _choose_action, _choose_a_bird_to_play,
     and _choose_a_bird_to_draw to define decision-making behavior.
+
+    Game events (e.g. the bird drawn from the deck) go to event_sink, which
+    is shared with the player's hand; it defaults to a no-op sink.
     """
 
-    def __init__(self, name, bird_hand, food_supply, num_turns_remaining, game_board=None):
+    def __init__(self, name, bird_hand, food_supply, num_turns_remaining, game_board=None, event_sink=None):
         self.name = name
         self.bird_hand = bird_hand
+        self.event_sink = event_sink if event_sink is not None else self._default_event_sink()
+        self.bird_hand.event_sink = self.event_sink
         self.food_supply = food_supply
         self.turns_remaining = num_turns_remaining
         if game_board is None:
@@ -21,6 +30,20 @@ class Player:
         self.score = 0
         self.actions = ["play_a_bird", "gain_food", "draw_a_bird"]  # lay_eggs not implemented yet
 
+    def _default_event_sink(self):
+        return NULL_SINK
+
+    def clone(self):
+        """Return a copy with its own hand, food supply and board.
+
+        Birds, the policy (for bots) and the advisor (for humans) are shared.
+        """
+        player = copy.copy(self)
+        player.bird_hand = self.bird_hand.clone()
+        player.food_supply = self.food_supply.clone()
+        player.game_board = self.game_board.clone()
+        return player
+
     def get_name(self):
         return self.name
 
@@ -38,7 +61,23 @@ class Player:
 
     def _enumerate_playable_birds(self):
         """Return names of birds the player can afford to play."""
-        return [bird.get_name() for bird in self.bird_hand.get_cards_in_hand() if self.food_supply.can_play_bird(bird)]
+        hand_mask = self.bird_hand.bird_mask
+        if hand_mask is None:
+            birds = self.bird_hand.get_cards_in_hand()
+            return [bird.get_name() for bird in birds if self.food_supply.can_play_bird(bird)]
+        playable = hand_mask & affordable_mask(self.food_supply.amount)
+        if not playable:
+            return []
+        if playable == hand_mask:
+            return self.bird_hand.get_card_names_in_hand()
+        return [name for name, bird in self.bird_hand.cards.items() if playable >> bird.bird_id & 1]
+
+    def _can_play_a_bird(self):
+        """Return True if the player can afford at least one bird in hand (ignores board space)."""
+        hand_mask = self.bird_hand.bird_mask
+        if hand_mask is None:
+            return any(self.food_supply.can_play_bird(bird) for bird in self.bird_hand.get_cards_in_hand())
+        return bool(hand_mask & affordable_mask(self.food_supply.amount))
 
     def _enumerate_legal_actions(self, tray, bird_deck):
         """Return the list of actions available given the current board, hand, food, tray, and deck."""
@@ -46,7 +85,7 @@ class Player:
 
         # Check if player can play a bird
         if not self.game_board.check_if_full():
-            if len(self._enumerate_playable_birds()) > 0:
+            if self._can_play_a_bird():
                 legal_actions.append(self.actions[0])
 
         # Player can always gain food
@@ -110,12 +149,9 @@ class Player:
         chosen_bird = self._choose_a_bird_to_draw(valid_choices=valid_choices, game_state=game_state)
 
         if chosen_bird == "deck":
-            try:
-                self.bird_hand.draw_card_from_deck(bird_deck)
-                print(f"You drew {self.bird_hand.get_card_names_in_hand()[-1]} from the deck.")
-            except Exception as e:
-                print(f"Error: {e}")
-                chosen_bird = self._choose_a_bird_to_draw(valid_choices=valid_choices, game_state=game_state)
+            bird = self.bird_hand.draw_card_from_deck(bird_deck)
+            if bird is not None:
+                self.event_sink.emit(DREW_FROM_DECK, bird=bird)
         else:
             self.bird_hand.draw_bird_from_tray(tray=tray, bird_name=chosen_bird)
 
@@ -138,6 +174,9 @@ class HumanPlayer(Player):
         super().__init__(*args, **kwargs)
         self.advisor = advisor
 
+    def _default_event_sink(self):
+        return PrintEventSink()
+
     def _show_hints(self, game_state, actions, label="Action"):
         """Display the advisor's recommended probabilities if available."""
         if self.advisor is None:
@@ -1,11 +1,29 @@
+from src.entities.bird import BirdMaskMixin
 from src.utilities.utils import render_bird_container
 
 
-class Tray:
+class Tray(BirdMaskMixin):
     def __init__(self, capacity=3):
         self.capacity = capacity
         self.birds = {}
 
+    @property
+    def birds(self):
+        """Dict of bird name -> bird. Change it through the tray's methods so the bird mask stays current."""
+        return self._birds
+
+    @birds.setter
+    def birds(self, birds):
+        self._birds = birds
+        self._reset_mask(birds.values())
+
+    def clone(self):
+        """Return a copy with its own slots, sharing the (immutable) birds."""
+        tray = Tray(capacity=self.capacity)
+        tray._birds = dict(self._birds)
+        tray._copy_mask(self)
+        return tray
+
     def get_count(self):
         """Public method that returns the number of birds in the tray."""
         return len(self.birds)
@@ -14,6 +32,14 @@ class Tray:
         """Public method that returns a list of birds in the tray."""
         return [bird for bird in self.birds.values()]
 
+    def get_bird_ids(self):
+        """Pool ids (Bird.bird_id) of the birds in the tray, None for birds outside the pool."""
+        return [bird.bird_id for bird in self.birds.values()]
+
+    def get_bird_mask(self):
+        """Bitmask (bit Bird.bird_id) of the birds in the tray, or None if a bird is outside the pool."""
+        return self._current_mask()
+
     def see_birds_in_tray(self):
         """Public method that returns a list of birds in the tray."""
         return [bird for bird in self.birds.keys()]
@@ -28,7 +54,9 @@ class Tray:
 
         if common_name not in self.birds:
             raise ValueError(f"{common_name} does not exist in the tray.")
-        return self.birds.pop(common_name)
+        bird = self._birds.pop(common_name)
+        self._unmark(bird)
+        return bird
 
     def add_bird(self, bird):
         """
@@ -37,7 +65,11 @@ class Tray:
         Args:
             bird (Bird): The bird to add.
         """
-        self.birds[bird.get_name()] = bird
+        replaced = self._birds.get(bird.get_name())
+        if replaced is not None:
+            self._unmark(replaced)
+        self._birds[bird.get_name()] = bird
+        self._mark(bird)
 
     def is_not_full(self):
         """Public method that returns True if the tray is not full, False otherwise."""
@@ -66,7 +98,8 @@ class Tray:
         """
 
         while len(self.birds) > 0:
-            discard_pile.add_card(self.birds.popitem()[1])
+            discard_pile.add_card(self._birds.popitem()[1])
+        self._reset_mask(())
 
         self.refill(bird_deck)
 
@@ -87,6 +120,6 @@ class Tray:
         tray = cls(capacity=capacity)
         for bird_rep in representation:
             if bird_rep != (0, 0):
-                bird = deck.remove_and_return_bird(lambda b, rep=bird_rep: b.to_representation() == rep)
+                bird = deck.remove_bird_with_representation(bird_rep)
                 tray.add_bird(bird)
         return tray
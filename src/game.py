@@ -30,7 +30,14 @@ class WingspanGame:
         num_starting_cards=DEFAULT_NUM_STARTING_CARDS,
         bot_policy_factory=None,
         advisor=None,
+        rng=None,
     ):
+        """Set up a new game unless game_state is given.
+
+        rng (a numpy Generator) shuffles the deck and drives the default
+        RandomPolicy bots, so a seeded Generator deals and plays the same game
+        every time; None uses the global random state.
+        """
         if game_state is None:
             self.game_state = self._initialize_game_state(
                 num_players=num_players,
@@ -39,12 +46,13 @@ class WingspanGame:
                 num_starting_cards=num_starting_cards,
                 bot_policy_factory=bot_policy_factory,
                 advisor=advisor,
+                rng=rng,
             )
         else:
             self.game_state = game_state
 
     def _initialize_game_state(
-        self, num_players, num_human, num_turns, num_starting_cards, bot_policy_factory, advisor=None
+        self, num_players, num_human, num_turns, num_starting_cards, bot_policy_factory, advisor=None, rng=None
     ):
         # Validate inputs
         if num_human > num_players:
@@ -61,9 +69,9 @@ class WingspanGame:
         bird_feeder.reroll()
 
         # Initialize the bird deck and discard pile
-        bird_deck = Deck()
+        bird_deck = Deck(rng=rng)
         bird_deck.prepare_deck(cards=bird_list)
-        discard_pile = Deck()
+        discard_pile = Deck(rng=rng)
 
         # Initialize the players
         players = [None] * num_players
@@ -100,6 +108,7 @@ class WingspanGame:
                     food_supply=food_supply,
                     num_turns_remaining=num_turns,
                     policy=policy,
+                    rng=rng,
                 )
 
         # Initialize the bird tray
@@ -273,6 +282,31 @@ if __name__ == "__main__":
         default=100,
         help="Number of MCTS simulations per decision (only with --policy mcts)",
     )
+    parser.add_argument(
+        "--time_budget_ms",
+        type=positive_int,
+        default=None,
+        help="Search each MCTS decision for this many milliseconds instead of --num_simulations",
+    )
+    parser.add_argument(
+        "--playout_batch_size",
+        type=positive_int,
+        default=1,
+        help="MCTS playouts run together per expanded leaf, scored in one batched policy call",
+    )
+    parser.add_argument(
+        "--mcts_workers",
+        type=positive_int,
+        default=1,
+        help="Worker processes for MCTS search (only with --policy mcts)",
+    )
+    parser.add_argument(
+        "--mcts_parallel",
+        type=str,
+        default="root",
+        choices=["root", "leaf"],
+        help="MCTS parallelization with --mcts_workers > 1: independent trees ('root') or parallel playouts ('leaf')",
+    )
     parser.add_argument(
         "--playout_policy",
         type=str,
@@ -311,7 +345,14 @@ if __name__ == "__main__":
     def _make_mcts_policy():
         from src.rl.policy import MCTSPolicy
 
-        return MCTSPolicy(num_simulations=args.num_simulations, playout_policy=playout)
+        return MCTSPolicy(
+            num_simulations=args.num_simulations,
+            playout_policy=playout,
+            workers=args.mcts_workers,
+            parallel=args.mcts_parallel,
+            time_budget_ms=args.time_budget_ms,
+            playout_batch_size=args.playout_batch_size,
+        )
 
     bot_policy_factory = None
     if args.policy == "mcts":
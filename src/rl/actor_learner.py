@@ -0,0 +1,117 @@
+"""Asynchronous actor-learner self-play.
+
+In the default training loop the workers sit idle while the learner trains
+and evaluates. ActorLearner instead keeps self-play chunks queued on a
+PolicyWorkerPool at all times: actors play with whatever weights were last
+published when they start a chunk, and the learner takes finished chunks as
+they come in. Every chunk reports the weights version it was played with;
+chunks more than max_staleness learner updates behind the current weights
+are discarded.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import numpy as np
+
+from src.rl.self_play import _merge_chunk_results, _play_chunk
+from src.rl.worker_pool import PolicyWorkerPool
+from src.utilities.shared_arrays import release_arrays
+
+
+class ActorLearner:
+    """Continuously generates self-play experience for a learner on a PolicyWorkerPool.
+
+    Args:
+        policy: The LinearPolicy the learner updates in place.
+        pool: A PolicyWorkerPool (required: actors read weights from its shared buffer).
+        num_turns: Turns per game.
+        backend: "object" or "batch", passed to each actor's collect_experience.
+        games_per_chunk: Games per queued task.
+        max_staleness: Oldest usable experience, in learner updates behind the current weights.
+        chunks_in_flight: Tasks kept queued (default: two per worker, so actors stay
+            busy while the learner trains and evaluates).
+        seed: Seed for the SeedSequence each chunk's Generator is spawned from
+            (None for fresh entropy).
+    """
+
+    def __init__(
+        self,
+        policy,
+        pool,
+        num_turns=10,
+        backend="object",
+        games_per_chunk=4,
+        max_staleness=1,
+        chunks_in_flight=None,
+        seed=None,
+    ):
+        if not isinstance(pool, PolicyWorkerPool):
+            raise ValueError("ActorLearner requires a PolicyWorkerPool")
+        if games_per_chunk < 1:
+            raise ValueError(f"games_per_chunk must be at least 1, got {games_per_chunk}")
+        if max_staleness < 0:
+            raise ValueError(f"max_staleness must be non-negative, got {max_staleness}")
+        self.policy = policy
+        self.pool = pool
+        self.num_turns = num_turns
+        self.backend = backend
+        self.games_per_chunk = games_per_chunk
+        self.max_staleness = max_staleness
+        self.chunks_in_flight = chunks_in_flight if chunks_in_flight is not None else 2 * pool.workers
+        self._seeds = np.random.SeedSequence(seed)
+        self._pending = set()
+        self.games_played = 0
+        self.games_dropped = 0
+
+    def _staleness(self, version):
+        # Each published weight update advances the seqlock version by 2
+        return (self.pool.shared_weights.version - version) // 2
+
+    def _fill(self):
+        """Queue chunks up to chunks_in_flight, publishing the learner's current weights first.
+
+        Chunks already queued pick up the new weights too, if they have not started yet.
+        """
+        version = self.pool.publish(self.policy)
+        while len(self._pending) < self.chunks_in_flight:
+            seed = self._seeds.spawn(1)[0].generate_state(1)[0]
+            task = (version, self.games_per_chunk, self.num_turns, seed, self.backend)
+            self._pending.add(self.pool.submit(_play_chunk, task))
+
+    def next_batch(self, num_games):
+        """Return (ExperienceBuffer, stats) from at least num_games fresh-enough games.
+
+        Call after each learner update: the new weights are published and
+        used for every chunk queued from then on.
+        """
+        results = []
+        collected = 0
+        self._fill()
+        while collected < num_games:
+            done, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._pending.remove(future)
+                descriptor, stats, version = future.result()
+                if self._staleness(version) > self.max_staleness:
+                    release_arrays(descriptor)
+                    self.games_dropped += self.games_per_chunk
+                    continue
+                results.append((descriptor, stats))
+                collected += self.games_per_chunk
+            self._fill()
+        self.games_played += collected
+        return _merge_chunk_results(results)
+
+    def close(self):
+        """Cancel queued chunks and free the experience of any that already finished.
+
+        Chunks that failed are skipped, so closing never raises and the pool
+        can always be shut down afterwards.
+        """
+        for future in self._pending:
+            future.cancel()
+        for future in self._pending:
+            if not future.cancelled() and future.exception() is None:
+                descriptor, _, _ = future.result()
+                release_arrays(descriptor)
+        self._pending = set()
@@ -1,40 +1,67 @@
 """Evaluate policies by playing games against baselines."""
 
-import contextlib
-import io
-
 import numpy as np
 
+from src.utilities.shared_arrays import attach_arrays, export_arrays, map_exported, release_all
+
+# Paired games are dealt from Generators seeded below this bound
+_DEAL_SEED_BOUND = 2**32
+
 
 def _eval_chunk(args):
     """Play a chunk of evaluation games in a worker process.
 
+    The challenger comes from a policy ref (see src.rl.worker_pool).
+    Returns (wins, ties, descriptor), the per-game scores being passed back
+    through shared memory (see src.utilities.shared_arrays).
     Top-level function so it's picklable by ProcessPoolExecutor.
     """
-    weights, sub_weights, start_game_num, num_games, num_turns, seed = args
-
-    # Reseed RNG to ensure independent games across workers
-    np.random.seed(seed)
+    ref, start_game_num, num_games, num_turns, seed, backend, paired = args
 
-    from src.rl.linear_policy import LinearPolicy
     from src.rl.policy import RandomPolicy
-
-    challenger = LinearPolicy()
-    challenger.weights = np.array(weights)
-    challenger.sub_weights = np.array(sub_weights)
-    baseline = RandomPolicy()
-
-    return _evaluate_games(challenger, baseline, num_games, num_turns, start_game_num)
-
-
-def _evaluate_games(challenger, baseline, num_games, num_turns, start_game_num=0):
-    """Core evaluation loop shared by serial and parallel paths."""
+    from src.rl.worker_pool import resolve_policy
+
+    # Games and policies draw from this chunk's own Generator, independent across workers
+    rng = np.random.default_rng(seed)
+    challenger, _ = resolve_policy(ref)
+    challenger.rng = rng
+    baseline = RandomPolicy(rng=rng)
+
+    wins, ties, scores, opponent_scores = _play_eval_games(
+        challenger, baseline, num_games, num_turns, start_game_num, backend, paired, rng
+    )
+    return wins, ties, export_arrays({"scores": scores, "opponent_scores": opponent_scores})
+
+
+def _play_eval_games(
+    challenger, baseline, num_games, num_turns, start_game_num=0, backend="object", paired=False, rng=None
+):
+    """Play evaluation games on the chosen backend; returns (wins, ties, scores, opponent_scores)."""
+    if paired and (num_games % 2 or start_game_num % 2):
+        raise ValueError(f"Paired evaluation needs whole pairs, got {num_games} games from game {start_game_num}.")
+    if backend == "batch":
+        return _evaluate_games_batch(challenger, baseline, num_games, num_turns, start_game_num, paired, rng)
+    elif backend == "object":
+        return _evaluate_games(challenger, baseline, num_games, num_turns, start_game_num, paired, rng)
+    raise ValueError(f"Unknown backend '{backend}'. Must be 'object' or 'batch'.")
+
+
+def _evaluate_games(challenger, baseline, num_games, num_turns, start_game_num=0, paired=False, rng=None):
+    """Core evaluation loop shared by serial and parallel paths.
+
+    Games are dealt from rng (a numpy Generator; None uses the global random
+    state). With paired=True, each odd-numbered game replays the deal of the
+    game before it: both are dealt from Generators seeded alike, so they get
+    the same deck shuffle, hands, tray and draws.
+    """
     from src.game import WingspanGame
+    from src.rl.feature_tracker import FeatureTracker
 
     wins = 0
     ties = 0
     scores = []
     opponent_scores = []
+    deal_seed = None  # seed the current pair is dealt from
 
     for i in range(num_games):
         game_num = start_game_num + i
@@ -53,14 +80,20 @@ def _evaluate_games(challenger, baseline, num_games, num_turns, start_game_num=0
             call_count[0] += 1
             return policies[idx]
 
-        with contextlib.redirect_stdout(io.StringIO()):
-            game = WingspanGame(
-                num_players=2,
-                num_human=0,
-                num_turns=num_turns,
-                bot_policy_factory=policy_factory,
-            )
-            game.play()
+        deal_rng = rng
+        if paired:
+            if challenger_first:
+                deal_seed = np.random.randint(_DEAL_SEED_BOUND) if rng is None else rng.integers(_DEAL_SEED_BOUND)
+            deal_rng = np.random.default_rng(deal_seed)
+        game = WingspanGame(
+            num_players=2,
+            num_human=0,
+            num_turns=num_turns,
+            bot_policy_factory=policy_factory,
+            rng=deal_rng,
+        )
+        FeatureTracker.attach(game.game_state)
+        game.play()
 
         game_scores = game.get_player_scores()
         c_score = game_scores[challenger_idx]
@@ -76,75 +109,265 @@ def _evaluate_games(challenger, baseline, num_games, num_turns, start_game_num=0
     return wins, ties, scores, opponent_scores
 
 
-def evaluate(challenger, baseline, num_games=100, num_turns=10):
+def _evaluate_games_batch(challenger, baseline, num_games, num_turns, start_game_num=0, paired=False, rng=None):
+    """Batched counterpart of _evaluate_games: all games advance in lockstep on a BatchGameEngine."""
+    from src.entities.batch_game import BatchGameEngine
+    from src.rl.self_play import play_batch_games
+
+    decks = None
+    if paired:
+        decks = np.repeat(BatchGameEngine.shuffled_decks(num_games // 2, rng=rng), 2, axis=0)
+    engine = BatchGameEngine(num_games, num_players=2, num_turns=num_turns, decks=decks, rng=rng)
+    challenger_idx = (start_game_num + np.arange(num_games)) % 2
+    seat_policy = np.column_stack([challenger_idx, 1 - challenger_idx])
+    play_batch_games(engine, [challenger, baseline], seat_policy, rng=rng)
+
+    games = np.arange(num_games)
+    c_scores = engine.scores[games, challenger_idx]
+    o_scores = engine.scores[games, 1 - challenger_idx]
+    wins = int(np.sum(c_scores > o_scores))
+    ties = int(np.sum(c_scores == o_scores))
+    return wins, ties, c_scores.tolist(), o_scores.tolist()
+
+
+def evaluate(challenger, baseline, num_games=100, num_turns=10, backend="object", paired=False, rng=None):
     """Play num_games between challenger and baseline, alternating positions.
 
     Even-numbered games: challenger is player 0, baseline is player 1.
     Odd-numbered games: baseline is player 0, challenger is player 1.
     This removes first-player positional bias.
 
-    Returns a dict with win_rate, tie_rate, mean_score, mean_opponent_score,
-    and mean_score_diff.
+    paired=True plays each deal twice: the odd-numbered game reuses the deck
+    of the game before it, so both policies play both seats of the same
+    cards and the luck of the deal cancels within each pair. num_games must
+    then be even.
+
+    backend="batch" plays all games in lockstep on a BatchGameEngine instead
+    of one WingspanGame at a time (both policies must support batched play).
+
+    rng is a numpy Generator to deal the games from (on the batch backend,
+    also to sample with); the policies otherwise sample from their own rng.
+    None uses the global random state.
+
+    Returns a dict with num_games, win_rate, tie_rate, mean_score,
+    mean_opponent_score and mean_score_diff, plus 95% intervals
+    win_rate_ci (Wilson) and mean_score_diff_ci (normal approximation).
+    Paired results add num_pairs and pair_score (the challenger's mean
+    points per game, win 1 / tie 0.5, over each pair) with pair_score_ci,
+    and compute mean_score_diff_ci over pair means.
     """
-    wins, ties, scores, opponent_scores = _evaluate_games(challenger, baseline, num_games, num_turns)
-    return _build_eval_results(wins, ties, scores, opponent_scores)
+    results = _play_eval_games(challenger, baseline, num_games, num_turns, backend=backend, paired=paired, rng=rng)
+    return _build_eval_results(*results, paired=paired)
 
 
-def evaluate_parallel(policy, num_games=100, num_turns=10, pool=None, workers=1):
+def evaluate_parallel(
+    policy, num_games=100, num_turns=10, pool=None, workers=1, backend="object", paired=False, seed=None
+):
     """Evaluate a LinearPolicy against RandomPolicy using a process pool.
 
     Args:
         policy: LinearPolicy with weights/sub_weights attributes.
         num_games: Total evaluation games.
         num_turns: Turns per game.
-        pool: A ProcessPoolExecutor instance (required).
+        pool: A PolicyWorkerPool or ProcessPoolExecutor instance (required).
         workers: Number of workers to split work across.
+        backend: "object" or "batch", as in evaluate().
+        paired: Play each deal twice with seats swapped, as in evaluate().
+        seed: Seed for the SeedSequence the workers' Generators are spawned
+            from (None for fresh entropy).
 
     Returns:
         Same dict as evaluate().
     """
     if pool is None:
         raise ValueError("pool is required for parallel evaluation")
+    results = _evaluate_games_parallel(policy, num_games, num_turns, pool, workers, backend, paired=paired, seed=seed)
+    return _build_eval_results(*results, paired=paired)
+
+
+def _evaluate_games_parallel(
+    policy, num_games, num_turns, pool, workers, backend, start_game_num=0, paired=False, seed=None
+):
+    """Play evaluation games across a process pool; returns (wins, ties, scores, opponent_scores).
 
-    chunk_size = num_games // workers
-    remainder = num_games % workers
+    seed may be an int or a SeedSequence to spawn the chunk seeds from.
+    """
+    # Split whole pairs between workers so no deal straddles two chunks
+    unit = 2 if paired else 1
+    if num_games % unit:
+        raise ValueError(f"Paired evaluation needs an even number of games, got {num_games}.")
+    chunk_size = num_games // unit // workers
+    remainder = num_games // unit % workers
+
+    from src.rl.worker_pool import policy_ref
 
-    weights = policy.weights.tolist()
-    sub_weights = policy.sub_weights.tolist()
+    ref = policy_ref(pool, policy)
 
     # Generate independent seeds via SeedSequence for each worker
-    parent_seed = np.random.SeedSequence()
+    parent_seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
     child_seeds = parent_seed.spawn(workers)
 
     chunks = []
-    game_offset = 0
+    game_offset = start_game_num
     for i in range(workers):
-        games = chunk_size + (1 if i < remainder else 0)
+        games = unit * (chunk_size + (1 if i < remainder else 0))
         if games > 0:
-            seed = child_seeds[i].generate_state(1)[0]
-            chunks.append((weights, sub_weights, game_offset, games, num_turns, seed))
+            chunk_seed = child_seeds[i].generate_state(1)[0]
+            chunks.append((ref, game_offset, games, num_turns, chunk_seed, backend, paired))
             game_offset += games
 
-    results = list(pool.map(_eval_chunk, chunks))
+    results = map_exported(pool, _eval_chunk, chunks, descriptor=lambda result: result[2])
 
     total_wins = sum(r[0] for r in results)
     total_ties = sum(r[1] for r in results)
     all_scores = []
     all_opp_scores = []
-    for _, _, scores, opp_scores in results:
-        all_scores.extend(scores)
-        all_opp_scores.extend(opp_scores)
-
-    return _build_eval_results(total_wins, total_ties, all_scores, all_opp_scores)
-
+    pending = [descriptor for _, _, descriptor in reversed(results)]
+    try:
+        while pending:
+            with attach_arrays(pending.pop()) as arrays:
+                all_scores.extend(arrays["scores"].tolist())
+                all_opp_scores.extend(arrays["opponent_scores"].tolist())
+    finally:
+        release_all(pending)
+
+    return total_wins, total_ties, all_scores, all_opp_scores
+
+
+def evaluate_sequential(
+    challenger,
+    baseline,
+    max_games=100,
+    batch_size=10,
+    num_turns=10,
+    backend="object",
+    threshold=0.5,
+    margin=0.1,
+    alpha=0.05,
+    beta=0.05,
+    pool=None,
+    workers=1,
+    paired=False,
+    seed=None,
+):
+    """Play games in batches until an SPRT decides whether the challenger's win rate beats threshold.
+
+    After each batch, a sequential probability ratio test weighs
+    "win rate = threshold + margin" against "win rate = threshold - margin"
+    (ties count as non-wins). Play stops as soon as one is accepted at error
+    rates alpha/beta, or at max_games. Positions alternate as in evaluate().
+
+    With a pool, batches are split across workers as in evaluate_parallel;
+    the challenger must then be a LinearPolicy and the baseline a RandomPolicy.
+    paired=True plays each deal twice as in evaluate(); batch_size and
+    max_games must then be even.
+
+    With a seed, the games are dealt (and parallel workers seeded) from
+    np.random.SeedSequence(seed), so a rerun plays the same games.
 
-def _build_eval_results(wins, ties, scores, opponent_scores):
-    """Build the standard evaluation results dict."""
+    Returns:
+        The evaluate() dict plus "decision": "above", "below" or "undecided".
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    if paired and (batch_size % 2 or max_games % 2):
+        raise ValueError(f"Paired evaluation needs even batch_size and max_games, got {batch_size} and {max_games}")
+    if not 0 < threshold - margin < threshold + margin < 1:
+        raise ValueError(f"threshold +/- margin must lie strictly between 0 and 1, got {threshold} +/- {margin}")
+    if pool is not None:
+        from src.rl.policy import RandomPolicy
+
+        if not isinstance(baseline, RandomPolicy):
+            raise ValueError("Parallel sequential evaluation plays against RandomPolicy only")
+
+    seeds = np.random.SeedSequence(seed)
+    rng = np.random.default_rng(seeds.spawn(1)[0]) if seed is not None and pool is None else None
+
+    wins = ties = 0
+    scores = []
+    opponent_scores = []
+    decision = None
+    while decision is None and len(scores) < max_games:
+        num_games = min(batch_size, max_games - len(scores))
+        start = len(scores)
+        if pool is not None:
+            batch = _evaluate_games_parallel(
+                challenger, num_games, num_turns, pool, workers, backend, start, paired, seeds.spawn(1)[0]
+            )
+        else:
+            batch = _play_eval_games(challenger, baseline, num_games, num_turns, start, backend, paired, rng)
+        wins += batch[0]
+        ties += batch[1]
+        scores.extend(batch[2])
+        opponent_scores.extend(batch[3])
+        decision = sprt_decision(wins, len(scores), threshold, margin, alpha, beta)
+
+    results = _build_eval_results(wins, ties, scores, opponent_scores, paired=paired)
+    results["decision"] = decision or "undecided"
+    return results
+
+
+def sprt_decision(wins, num_games, threshold=0.5, margin=0.1, alpha=0.05, beta=0.05):
+    """Wald's SPRT on a win count: "above" or "below" threshold once decided, else None."""
+    p_low = threshold - margin
+    p_high = threshold + margin
+    llr = wins * np.log(p_high / p_low) + (num_games - wins) * np.log((1 - p_high) / (1 - p_low))
+    if llr >= np.log((1 - beta) / alpha):
+        return "above"
+    if llr <= np.log(beta / (1 - alpha)):
+        return "below"
+    return None
+
+
+# Two-sided 95% normal quantile
+_Z_95 = 1.959963984540054
+
+
+def wilson_interval(successes, num_trials, z=_Z_95):
+    """Wilson score interval (low, high) for a binomial proportion."""
+    if num_trials == 0:
+        return 0.0, 1.0
+    p = successes / num_trials
+    denominator = 1 + z**2 / num_trials
+    center = (p + z**2 / (2 * num_trials)) / denominator
+    half_width = z * np.sqrt(p * (1 - p) / num_trials + z**2 / (4 * num_trials**2)) / denominator
+    return float(center - half_width), float(center + half_width)
+
+
+def mean_interval(values, z=_Z_95):
+    """Normal-approximation interval (low, high) for the mean of values."""
+    values = np.asarray(values, dtype=float)
+    mean = float(values.mean())
+    if len(values) < 2:
+        return mean, mean
+    half_width = z * values.std(ddof=1) / np.sqrt(len(values))
+    return float(mean - half_width), float(mean + half_width)
+
+
+def _build_eval_results(wins, ties, scores, opponent_scores, paired=False):
+    """Build the standard evaluation results dict, with 95% intervals for win rate and score diff.
+
+    For paired games (2k and 2k + 1 share a deal) the score diff interval is
+    taken over pair means, and pair_score summarizes each pair's outcomes.
+    """
     num_games = len(scores)
-    return {
+    score_diffs = np.array(scores) - np.array(opponent_scores)
+    results = {
+        "num_games": num_games,
         "win_rate": wins / num_games,
+        "win_rate_ci": wilson_interval(wins, num_games),
         "tie_rate": ties / num_games,
         "mean_score": np.mean(scores),
         "mean_opponent_score": np.mean(opponent_scores),
-        "mean_score_diff": np.mean(np.array(scores) - np.array(opponent_scores)),
+        "mean_score_diff": np.mean(score_diffs),
+        "mean_score_diff_ci": mean_interval(score_diffs),
     }
+    if paired:
+        # Challenger points per game: 1 for a win, 0.5 for a tie
+        points = (np.sign(score_diffs) + 1) / 2
+        pair_scores = points.reshape(-1, 2).mean(axis=1)
+        results["num_pairs"] = len(pair_scores)
+        results["pair_score"] = float(pair_scores.mean())
+        results["pair_score_ci"] = mean_interval(pair_scores)
+        results["mean_score_diff_ci"] = mean_interval(score_diffs.reshape(-1, 2).mean(axis=1))
+    return results
@@ -0,0 +1,223 @@
+"""Training experience: per-decision records and a columnar buffer of them."""
+
+from collections import namedtuple
+
+import numpy as np
+
+from src.rl.featurizer import NUM_FEATURES, NUM_SUB_FEATURES
+from src.utilities.shared_arrays import attach_arrays, export_arrays, release_all
+
+# Action-level experience (CHOOSE_ACTION phase)
+ActionExperience = namedtuple("ActionExperience", ["features", "action_index", "reward"])
+
+# Sub-decision experience (which bird to play/draw)
+SubExperience = namedtuple("SubExperience", ["combined_features", "action_index", "num_options", "reward"])
+
+
+def _grow(array, size):
+    """Return array with its first axis enlarged to at least size (doubling), keeping the contents."""
+    capacity = max(size, 2 * len(array))
+    grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+class ExperienceBuffer:
+    """Growable columnar storage for action and sub-decision experiences.
+
+    Action rows: action_features (N, NUM_FEATURES), action_indices (N,),
+    action_rewards (N,). Sub-decision rows: sub_features (M, NUM_SUB_FEATURES)
+    holding the combined features of the chosen option, sub_indices (M,) its
+    position among the options, sub_num_options (M,) and sub_rewards (M,).
+
+    Columns are preallocated and doubled when full, and the properties return
+    views of the filled rows. Pickling keeps only the filled rows, so a buffer
+    crosses a process boundary as a few contiguous arrays; to_shared and
+    merge_shared move them through shared memory instead of the pipe.
+    """
+
+    _COLUMNS = (
+        "_action_features",
+        "_action_indices",
+        "_action_rewards",
+        "_sub_features",
+        "_sub_indices",
+        "_sub_num_options",
+        "_sub_rewards",
+    )
+
+    def __init__(self, capacity=256, num_features=NUM_FEATURES, num_sub_features=NUM_SUB_FEATURES):
+        self._action_features = np.empty((capacity, num_features))
+        self._action_indices = np.empty(capacity, dtype=np.int64)
+        self._action_rewards = np.empty(capacity)
+        self._sub_features = np.empty((capacity, num_sub_features))
+        self._sub_indices = np.empty(capacity, dtype=np.int64)
+        self._sub_num_options = np.empty(capacity, dtype=np.int64)
+        self._sub_rewards = np.empty(capacity)
+        self.num_actions = 0
+        self.num_subs = 0
+
+    def __len__(self):
+        return self.num_actions + self.num_subs
+
+    def __getstate__(self):
+        state = self._columns()
+        state["num_actions"] = self.num_actions
+        state["num_subs"] = self.num_subs
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def _filled(self, name):
+        return self.num_actions if name.startswith("_action") else self.num_subs
+
+    # --- Column views ---
+
+    @property
+    def action_features(self):
+        return self._action_features[: self.num_actions]
+
+    @property
+    def action_indices(self):
+        return self._action_indices[: self.num_actions]
+
+    @property
+    def action_rewards(self):
+        return self._action_rewards[: self.num_actions]
+
+    @property
+    def sub_features(self):
+        return self._sub_features[: self.num_subs]
+
+    @property
+    def sub_indices(self):
+        return self._sub_indices[: self.num_subs]
+
+    @property
+    def sub_num_options(self):
+        return self._sub_num_options[: self.num_subs]
+
+    @property
+    def sub_rewards(self):
+        return self._sub_rewards[: self.num_subs]
+
+    # --- Appending ---
+
+    def add_actions(self, features, action_indices, rewards):
+        """Append action rows. rewards may be a scalar shared by every row."""
+        start = self.num_actions
+        end = start + len(action_indices)
+        if end > len(self._action_indices):
+            self._action_features = _grow(self._action_features, end)
+            self._action_indices = _grow(self._action_indices, end)
+            self._action_rewards = _grow(self._action_rewards, end)
+        self._action_features[start:end] = features
+        self._action_indices[start:end] = action_indices
+        self._action_rewards[start:end] = rewards
+        self.num_actions = end
+
+    def add_subs(self, combined_features, action_indices, num_options, rewards):
+        """Append sub-decision rows. num_options and rewards may be scalars shared by every row."""
+        start = self.num_subs
+        end = start + len(action_indices)
+        if end > len(self._sub_indices):
+            self._sub_features = _grow(self._sub_features, end)
+            self._sub_indices = _grow(self._sub_indices, end)
+            self._sub_num_options = _grow(self._sub_num_options, end)
+            self._sub_rewards = _grow(self._sub_rewards, end)
+        self._sub_features[start:end] = combined_features
+        self._sub_indices[start:end] = action_indices
+        self._sub_num_options[start:end] = num_options
+        self._sub_rewards[start:end] = rewards
+        self.num_subs = end
+
+    def extend(self, other):
+        """Append every row of another buffer."""
+        self.add_actions(other.action_features, other.action_indices, other.action_rewards)
+        self.add_subs(other.sub_features, other.sub_indices, other.sub_num_options, other.sub_rewards)
+
+    @classmethod
+    def concatenate(cls, buffers):
+        """Return one buffer holding the rows of all the given buffers, in order."""
+        buffers = list(buffers)
+        num_actions = sum(b.num_actions for b in buffers)
+        num_subs = sum(b.num_subs for b in buffers)
+        merged = cls(capacity=max(1, num_actions, num_subs))
+        for buffer in buffers:
+            merged.extend(buffer)
+        return merged
+
+    # --- Shared-memory transfer ---
+
+    def _columns(self):
+        return {name: getattr(self, name)[: self._filled(name)] for name in self._COLUMNS}
+
+    def to_shared(self):
+        """Copy the filled rows into a shared memory segment and return its (small, picklable) descriptor."""
+        return export_arrays(self._columns())
+
+    @classmethod
+    def merge_shared(cls, descriptors):
+        """Concatenate buffers exported with to_shared, in order, and free their segments.
+
+        Each segment is read in place; the only copy is into the merged buffer.
+        Every segment is freed even if the merge fails partway.
+        """
+        pending = list(descriptors)
+        pending.reverse()
+        try:
+            sizes = [{key: shape[0] for key, _, shape, _ in d.layout} for d in pending]
+            num_actions = sum(size["_action_indices"] for size in sizes)
+            num_subs = sum(size["_sub_indices"] for size in sizes)
+            merged = cls(capacity=max(1, num_actions, num_subs))
+            while pending:
+                # attach_arrays frees the segment from here on, whatever happens
+                with attach_arrays(pending.pop()) as columns:
+                    merged.add_actions(
+                        columns["_action_features"], columns["_action_indices"], columns["_action_rewards"]
+                    )
+                    merged.add_subs(
+                        columns["_sub_features"],
+                        columns["_sub_indices"],
+                        columns["_sub_num_options"],
+                        columns["_sub_rewards"],
+                    )
+        finally:
+            release_all(pending)
+        return merged
+
+    # --- Conversion to/from experience tuples ---
+
+    @classmethod
+    def from_experiences(cls, action_experiences, sub_experiences):
+        """Build a buffer from lists of ActionExperience and SubExperience."""
+        buffer = cls(capacity=max(1, len(action_experiences), len(sub_experiences)))
+        if action_experiences:
+            buffer.add_actions(
+                np.array([e.features for e in action_experiences], dtype=float),
+                [e.action_index for e in action_experiences],
+                [e.reward for e in action_experiences],
+            )
+        if sub_experiences:
+            buffer.add_subs(
+                np.array([e.combined_features for e in sub_experiences], dtype=float),
+                [e.action_index for e in sub_experiences],
+                [e.num_options for e in sub_experiences],
+                [e.reward for e in sub_experiences],
+            )
+        return buffer
+
+    def action_experiences(self):
+        """Return the action rows as a list of ActionExperience."""
+        return [
+            ActionExperience(features=f, action_index=int(a), reward=float(r))
+            for f, a, r in zip(self.action_features, self.action_indices, self.action_rewards)
+        ]
+
+    def sub_experiences(self):
+        """Return the sub-decision rows as a list of SubExperience."""
+        return [
+            SubExperience(combined_features=f, action_index=int(a), num_options=int(n), reward=float(r))
+            for f, a, n, r in zip(self.sub_features, self.sub_indices, self.sub_num_options, self.sub_rewards)
+        ]
@@ -0,0 +1,215 @@
+"""Incremental maintenance of the featurize aggregates across a game.
+
+featurize rescans every hand, board and the tray and rebuilds the unseen-pool
+mask on each call. A FeatureTracker attached to a GameState instead keeps the
+card-dependent aggregates (each player's hand in score order, live board
+scores and per-player unseen-pool histograms) up to date as cards move, so a
+decision only pays for the cards that changed since the last one.
+
+Cards move through hooks in BirdHand.play_bird, BirdHand.draw_bird_from_tray,
+Hand.draw_card_from_deck and GameState.end_player_turn (tray refills). Food,
+turns remaining and the game turn are read live from the state.
+"""
+
+import bisect
+import copy
+
+import numpy as np
+
+from src.rl.featurizer import (
+    _POOL_COSTS_INT,
+    _POOL_POINTS_INT,
+    _POOL_RATIO_UNITS,
+    _POOL_RATIOS,
+    _RATIO_SCALE,
+    FEATURE_NAMES,
+    _assemble_features,
+    _best_ratio,
+    _featurize_full,
+)
+
+# Bird pool grouped into (points, food cost) classes; unseen statistics only depend on class counts
+_CLASS_KEYS, _POOL_CLASS, _CLASS_SIZES = np.unique(
+    np.column_stack([_POOL_POINTS_INT, _POOL_COSTS_INT]), axis=0, return_inverse=True, return_counts=True
+)
+_POOL_CLASS = _POOL_CLASS.ravel()
+_CLASS_POINTS = _CLASS_KEYS[:, 0]
+_CLASS_COSTS = _CLASS_KEYS[:, 1]
+_CLASS_RATIO_UNITS = np.array([_POOL_RATIO_UNITS[_POOL_CLASS == k][0] for k in range(len(_CLASS_KEYS))])
+_CLASS_RATIOS = np.array([_POOL_RATIOS[_POOL_CLASS == k][0] for k in range(len(_CLASS_KEYS))])
+
+# Card locations. Non-negative locations are the index of the player holding the card.
+HIDDEN = -1  # deck or discard pile
+ON_BOARD = -2
+IN_TRAY = -3
+
+
+def _is_visible(location, player_idx):
+    """A card is visible to a player if it is in their hand, on any board, or in the tray."""
+    return location == player_idx or location <= ON_BOARD
+
+
+def _sort_key(bird):
+    return -bird.get_points()
+
+
+class FeatureTracker:
+    """Running featurize aggregates for one game, updated on every card move.
+
+    Attach with FeatureTracker.attach(state); featurize(state) then reads the
+    tracker instead of recomputing. With check=True every features() call is
+    verified against a full recomputation and raises AssertionError on drift.
+
+    The tracker holds no reference to the GameState itself, so it stays
+    consistent when the state is deep-copied (e.g. by MCTS).
+    """
+
+    def __init__(self, state, check=False):
+        self.check = check
+        players = state.get_players()
+        self._hands = [p.get_bird_hand() for p in players]
+        self._locations = {}
+        self._unseen = np.tile(_CLASS_SIZES.astype(np.int64), (len(players), 1))
+        self._sorted_hands = []
+        self._board_scores = []
+
+        for i, player in enumerate(players):
+            hand_birds = player.get_bird_hand().get_cards_in_hand()
+            self._sorted_hands.append(sorted(hand_birds, key=_sort_key))
+            for bird in hand_birds:
+                self._move(bird, i)
+            board_birds = player.get_game_board().get_birds()
+            self._board_scores.append(sum(b.get_points() for b in board_birds))
+            for bird in board_birds:
+                self._move(bird, ON_BOARD)
+        for bird in state.get_tray().get_birds_in_tray():
+            self._move(bird, IN_TRAY)
+
+    @classmethod
+    def attach(cls, state, check=False):
+        """Create a tracker for the state and hook it into the state and every player's hand."""
+        tracker = cls(state, check=check)
+        state.feature_tracker = tracker
+        for hand in tracker._hands:
+            hand.feature_tracker = tracker
+        return tracker
+
+    def clone(self, hands):
+        """Return an independent copy tracking the given (cloned) hands, in player order."""
+        tracker = copy.copy(self)
+        tracker._hands = list(hands)
+        tracker._locations = dict(self._locations)
+        tracker._unseen = self._unseen.copy()
+        tracker._sorted_hands = [list(hand) for hand in self._sorted_hands]
+        tracker._board_scores = list(self._board_scores)
+        return tracker
+
+    def _player_index(self, hand):
+        for i, tracked in enumerate(self._hands):
+            if tracked is hand:
+                return i
+        raise ValueError("Hand is not tracked by this FeatureTracker.")
+
+    def _move(self, bird, location):
+        """Record a card's new location and update every player's unseen histogram."""
+        idx = bird.bird_id
+        if idx is None:
+            return
+        old = self._locations.get(idx, HIDDEN)
+        self._locations[idx] = location
+        cls = _POOL_CLASS[idx]
+        for p in range(len(self._hands)):
+            was_visible = _is_visible(old, p)
+            now_visible = _is_visible(location, p)
+            if was_visible and not now_visible:
+                self._unseen[p, cls] += 1
+            elif now_visible and not was_visible:
+                self._unseen[p, cls] -= 1
+
+    # --- Hooks ---
+
+    def on_add_to_hand(self, hand, bird):
+        """A bird entered a hand from the deck or the tray."""
+        p = self._player_index(hand)
+        bisect.insort(self._sorted_hands[p], bird, key=_sort_key)
+        self._move(bird, p)
+
+    def on_play_bird(self, hand, bird):
+        """A bird moved from a hand to that player's board."""
+        p = self._player_index(hand)
+        self._sorted_hands[p].remove(bird)
+        self._board_scores[p] += bird.get_points()
+        self._move(bird, ON_BOARD)
+
+    def on_end_turn(self, state):
+        """Pick up birds dealt into the tray by the end-of-turn refill."""
+        for bird in state.get_tray().get_birds_in_tray():
+            idx = bird.bird_id
+            if idx is not None and self._locations.get(idx, HIDDEN) != IN_TRAY:
+                self._move(bird, IN_TRAY)
+
+    # --- Features ---
+
+    def _unseen_stats(self, p, hand_birds, food, can_play):
+        """Same values as featurizer._unseen_bird_stats, from the class histogram."""
+        counts = self._unseen[p]
+        n_unseen = int(counts.sum())
+        if n_unseen == 0:
+            return 0.0, 0.0, 0.0, 0.0
+
+        mean_ratio = float(int(counts @ _CLASS_RATIO_UNITS) / (_RATIO_SCALE * n_unseen))
+        better = _CLASS_RATIOS > _best_ratio(hand_birds)
+        prob_better = float(int(counts[better].sum()) / n_unseen)
+        affordable = _CLASS_COSTS <= food
+        n_affordable = int(counts[affordable].sum())
+        prob_affordable = float(n_affordable / n_unseen)
+        if n_affordable > 0:
+            mean_affordable_vp = float(int(counts[affordable] @ _CLASS_POINTS[affordable]) / n_affordable)
+        else:
+            mean_affordable_vp = 0.0
+
+        if can_play:
+            best_immediate_vp = max((b.get_points() for b in hand_birds if food >= b.get_food_cost()), default=0)
+        else:
+            best_immediate_vp = 0
+        return mean_ratio, prob_better, prob_affordable, mean_affordable_vp - best_immediate_vp
+
+    def features(self, state):
+        """Feature vector for the state's current player, equal to the full featurize."""
+        player = state.get_current_player()
+        p = state.game_turn % state.num_players
+        board = player.get_game_board()
+        board_bird_count = len(board.get_birds())
+        food = player.get_food_supply().amount
+        hand_birds = self._sorted_hands[p]
+
+        opponents = [i for i in range(state.num_players) if i != p]
+        if opponents:
+            opponent_best_score = max(self._board_scores[i] for i in opponents)
+            opponent_avg_food = np.mean([state.get_player(i).get_food_supply().amount for i in opponents])
+        else:
+            opponent_best_score = 0
+            opponent_avg_food = 0
+
+        total_turns = state.num_turns * state.num_players
+        features = _assemble_features(
+            game_progress=state.game_turn / total_turns if total_turns > 0 else 1.0,
+            num_turns=state.num_turns,
+            food=food,
+            turns_remaining=player.get_turns_remaining(),
+            hand_birds=hand_birds,
+            board_score=self._board_scores[p],
+            board_bird_count=board_bird_count,
+            board_capacity=board.capacity,
+            tray_birds=state.get_tray().get_birds_in_tray(),
+            unseen_stats=self._unseen_stats(p, hand_birds, food, board_bird_count != board.capacity),
+            opponent_best_score=opponent_best_score,
+            opponent_avg_food=opponent_avg_food,
+        )
+
+        if self.check:
+            expected = _featurize_full(state)
+            if not np.array_equal(features, expected):
+                mismatched = [FEATURE_NAMES[i] for i in np.flatnonzero(features != expected)]
+                raise AssertionError(f"FeatureTracker drifted from featurize on: {', '.join(mismatched)}")
+        return features
@@ -76,6 +76,26 @@ _POOL_POINTS = np.array([b.get_points() for b in _ALL_BIRDS], dtype=np.float64)
 _POOL_COSTS = np.array([b.get_food_cost() for b in _ALL_BIRDS], dtype=np.float64)
 _POOL_RATIOS = np.array([_points_cost_ratio(b) for b in _ALL_BIRDS], dtype=np.float64)
 _POOL_NAME_TO_IDX = {name: i for i, name in enumerate(_POOL_NAMES)}
+# Bytes holding one bit per pool bird, for unpacking Bird.bird_id bitmasks
+_POOL_MASK_BYTES = (len(_POOL_NAMES) + 7) // 8
+
+# Integer views for exact sums. Every ratio is a multiple of 1/_RATIO_SCALE (the lcm
+# of the food costs), so ratio sums can be taken over integers and divided once. This
+# makes the unseen mean ratio independent of summation order, which keeps featurize,
+# featurize_arrays and FeatureTracker bit-identical. The result is the correctly
+# rounded mean, which can differ from a float mean (np.mean of _POOL_RATIOS, used
+# before batched featurization existed) by up to a few ulps.
+_POOL_POINTS_INT = _POOL_POINTS.astype(np.int64)
+_POOL_COSTS_INT = _POOL_COSTS.astype(np.int64)
+_RATIO_SCALE = int(np.lcm.reduce(_POOL_COSTS_INT[_POOL_COSTS_INT > 0]))
+_POOL_RATIO_UNITS = np.where(
+    _POOL_COSTS_INT == 0,
+    5 * _RATIO_SCALE,
+    _POOL_POINTS_INT * _RATIO_SCALE // np.maximum(_POOL_COSTS_INT, 1),
+)
+
+# Option id used by featurize_option_arrays for drawing from the deck
+DECK_OPTION = -1
 
 
 def _best_ratio(birds):
@@ -117,6 +137,23 @@ def _max_achievable_vp(hand_birds, food, board_slots_left, turns_left):
     return total_vp
 
 
+def _visible_pool_mask(state, player):
+    """Bool pool mask of the birds player can see (own hand, all boards, tray).
+
+    ORs the containers' bird_id bitmasks. Returns None if any visible bird
+    is outside the pool.
+    """
+    masks = [player.get_bird_hand().bird_mask, state.get_tray().get_bird_mask()]
+    masks.extend(p.get_game_board().get_bird_mask() for p in state.get_players())
+    visible = 0
+    for mask in masks:
+        if mask is None:
+            return None
+        visible |= mask
+    bits = np.unpackbits(np.frombuffer(visible.to_bytes(_POOL_MASK_BYTES, "little"), dtype=np.uint8), bitorder="little")
+    return bits[: len(_POOL_NAMES)].view(bool)
+
+
 def _unseen_bird_stats(state, player):
     """Compute statistics about unseen birds (full pool minus visible cards).
 
@@ -125,7 +162,7 @@ def _unseen_bird_stats(state, player):
     and discard pile without distinguishing between them.
 
     Uses precomputed numpy arrays for the full bird pool, so per-call cost
-    is a set lookup + array masking rather than iterating over bird objects.
+    is a few bitmask ORs + array masking rather than iterating over bird objects.
 
     Returns (mean_ratio, prob_better, prob_affordable, draw_upside) where:
     - mean_ratio: average VP/cost ratio of unseen cards
@@ -133,21 +170,25 @@ def _unseen_bird_stats(state, player):
     - prob_affordable: fraction with cost <= current food
     - draw_upside: mean VP of affordable unseen cards minus best immediate play VP
     """
-    # Build visibility mask using precomputed index lookup
-    visible_names = set()
-    for b in player.get_bird_hand().get_cards_in_hand():
-        visible_names.add(b.get_name())
-    for p in state.get_players():
-        for b in p.get_game_board().get_birds():
+    visible = _visible_pool_mask(state, player)
+    if visible is not None:
+        mask = ~visible
+    else:
+        # Birds outside the pool: build the visibility mask by name instead
+        visible_names = set()
+        for b in player.get_bird_hand().get_cards_in_hand():
+            visible_names.add(b.get_name())
+        for p in state.get_players():
+            for b in p.get_game_board().get_birds():
+                visible_names.add(b.get_name())
+        for b in state.get_tray().get_birds_in_tray():
             visible_names.add(b.get_name())
-    for b in state.get_tray().get_birds_in_tray():
-        visible_names.add(b.get_name())
 
-    mask = np.ones(len(_POOL_NAMES), dtype=bool)
-    for name in visible_names:
-        idx = _POOL_NAME_TO_IDX.get(name)
-        if idx is not None:
-            mask[idx] = False
+        mask = np.ones(len(_POOL_NAMES), dtype=bool)
+        for name in visible_names:
+            idx = _POOL_NAME_TO_IDX.get(name)
+            if idx is not None:
+                mask[idx] = False
 
     n_unseen = mask.sum()
     if n_unseen == 0:
@@ -161,7 +202,8 @@ def _unseen_bird_stats(state, player):
     hand_birds = player.get_bird_hand().get_cards_in_hand()
     best_hand_ratio = _best_ratio(hand_birds)
 
-    mean_ratio = float(unseen_ratios.mean())
+    # Exact integer mean, not unseen_ratios.mean(): see _POOL_RATIO_UNITS
+    mean_ratio = float(_POOL_RATIO_UNITS[mask].sum() / (_RATIO_SCALE * n_unseen))
     prob_better = float((unseen_ratios > best_hand_ratio).sum() / n_unseen)
     prob_affordable = float((unseen_costs <= food).sum() / n_unseen)
 
@@ -186,30 +228,80 @@ def featurize(state):
     All features are from the current player's perspective, normalized
     to roughly [0, 1] or small bounded ranges for stable learning.
     Returns a 1-D numpy array of shape (NUM_FEATURES,).
+
+    If a FeatureTracker is attached to the state, its incrementally
+    maintained aggregates are used instead of rescanning the state.
     """
+    tracker = getattr(state, "feature_tracker", None)
+    if tracker is not None:
+        return tracker.features(state)
+    return _featurize_full(state)
+
+
+def _featurize_full(state):
+    """featurize computed from scratch, scanning hands, boards, tray and the bird pool."""
     player = state.get_current_player()
-    hand_birds = player.get_bird_hand().get_cards_in_hand()
     board = player.get_game_board()
-    food = player.get_food_supply().amount
-    tray_birds = state.get_tray().get_birds_in_tray()
 
     # Game progress
     total_turns = state.num_turns * state.num_players
     game_progress = state.game_turn / total_turns if total_turns > 0 else 1.0
 
+    # Opponent features (use live board score for consistency)
+    opponents = [p for p in state.get_players() if p is not player]
+    if opponents:
+        opponent_best_score = max(p.get_game_board().get_score() for p in opponents)
+        opponent_avg_food = np.mean([p.get_food_supply().amount for p in opponents])
+    else:
+        opponent_best_score = 0
+        opponent_avg_food = 0
+
+    return _assemble_features(
+        game_progress=game_progress,
+        num_turns=state.num_turns,
+        food=player.get_food_supply().amount,
+        turns_remaining=player.get_turns_remaining(),
+        hand_birds=player.get_bird_hand().get_cards_in_hand(),
+        board_score=board.get_score(),
+        board_bird_count=len(board.get_birds()),
+        board_capacity=board.capacity,
+        tray_birds=state.get_tray().get_birds_in_tray(),
+        unseen_stats=_unseen_bird_stats(state, player),
+        opponent_best_score=opponent_best_score,
+        opponent_avg_food=opponent_avg_food,
+    )
+
+
+def _assemble_features(
+    game_progress,
+    num_turns,
+    food,
+    turns_remaining,
+    hand_birds,
+    board_score,
+    board_bird_count,
+    board_capacity,
+    tray_birds,
+    unseen_stats,
+    opponent_best_score,
+    opponent_avg_food,
+):
+    """Build the feature vector from per-state aggregates.
+
+    Shared by featurize and FeatureTracker so both produce identical values.
+    hand_birds may be in hand order or stably sorted by points descending.
+    """
     # Current player features (use live board score)
-    board_score = board.get_score()
-    board_count = len(board.get_birds()) / board.capacity
+    board_count = board_bird_count / board_capacity
     hand_count = len(hand_birds)
     hand_max_points = max((b.get_points() for b in hand_birds), default=0)
     playable = [b for b in hand_birds if food >= b.get_food_cost()]
     hand_min_cost = min((b.get_food_cost() for b in playable), default=0) if playable else 0.0
-    can_play_bird = 1.0 if playable and not board.check_if_full() else 0.0
+    can_play_bird = 1.0 if playable and board_bird_count != board_capacity else 0.0
     hand_best_ratio = _best_ratio(hand_birds)
 
     # Tier 1: strategic calculations (#91)
-    turns_remaining = player.get_turns_remaining()
-    board_slots_left = board.capacity - len(board.get_birds())
+    board_slots_left = board_capacity - board_bird_count
     can_play = playable and board_slots_left > 0
     best_immediate_vp = max((b.get_points() for b in playable), default=0) if can_play else 0
     affordable_count = len(playable) if can_play else 0
@@ -220,16 +312,7 @@ def featurize(state):
     tray_best_ratio = _best_ratio(tray_birds)
 
     # Tier 2: deck composition (#91)
-    unseen_mean_ratio, prob_draw_better, prob_draw_affordable, draw_vp_upside = _unseen_bird_stats(state, player)
-
-    # Opponent features (use live board score for consistency)
-    opponents = [p for p in state.get_players() if p is not player]
-    if opponents:
-        opponent_best_score = max(p.get_game_board().get_score() for p in opponents)
-        opponent_avg_food = np.mean([p.get_food_supply().amount for p in opponents])
-    else:
-        opponent_best_score = 0
-        opponent_avg_food = 0
+    unseen_mean_ratio, prob_draw_better, prob_draw_affordable, draw_vp_upside = unseen_stats
 
     score_lead = board_score - opponent_best_score
 
@@ -261,7 +344,7 @@ def featurize(state):
             can_play_bird,
             hand_best_ratio / 5.0,
             # Tier 1
-            turns_remaining / state.num_turns,
+            turns_remaining / num_turns,
             best_immediate_vp / 10.0,
             affordable_count / 5.0,
             max_vp / 50.0,
@@ -344,3 +427,399 @@ def featurize_option(state, bird_name):
         ],
         dtype=np.float64,
     )
+
+
+# --- Vectorized featurization over arrays of states ---
+
+
+def _max_achievable_vp_arrays(points, costs, in_hand, food, board_slots_left, turns_left):
+    """Row-wise _max_achievable_vp over padded hand arrays of shape (N, H).
+
+    Birds are considered in descending VP order with ties kept in hand order,
+    matching the stable sort in _max_achievable_vp.
+    """
+    order = np.argsort(-np.where(in_hand, points, -1), axis=1, kind="stable")
+    points = np.take_along_axis(points, order, axis=1)
+    costs = np.take_along_axis(costs, order, axis=1)
+    in_hand = np.take_along_axis(in_hand, order, axis=1)
+
+    total_vp = np.zeros(len(food), dtype=np.int64)
+    remaining_food = food.astype(np.int64)
+    remaining_turns = turns_left.astype(np.int64)
+    remaining_slots = board_slots_left.astype(np.int64)
+
+    for j in range(points.shape[1]):
+        food_needed = np.maximum(0, costs[:, j] - remaining_food)
+        turns_needed = food_needed + 1
+        take = in_hand[:, j] & (remaining_slots > 0) & (turns_needed <= remaining_turns)
+        total_vp += np.where(take, points[:, j], 0)
+        remaining_food = np.where(take, remaining_food + food_needed - costs[:, j], remaining_food)
+        remaining_turns = np.where(take, remaining_turns - turns_needed, remaining_turns)
+        remaining_slots = remaining_slots - take
+
+    return total_vp.astype(np.float64)
+
+
+def featurize_arrays(
+    hand_ids,
+    board,
+    tray,
+    seen,
+    food,
+    turns_remaining,
+    num_turns,
+    game_progress,
+    opponent_best_score,
+    opponent_avg_food,
+    board_capacity=5,
+):
+    """Vectorized featurize for N states given as arrays over the bird pool.
+
+    All arrays are from each state's current player's perspective. Produces
+    the same values as featurize row by row.
+
+    Args:
+        hand_ids (np.ndarray): Int (N, H) bird ids in hand order, padded with -1.
+        board (np.ndarray): Bool (N, NUM_BIRDS) current player's board.
+        tray (np.ndarray): Bool (N, NUM_BIRDS) birds in the tray.
+        seen (np.ndarray): Bool (N, NUM_BIRDS) birds on any player's board.
+        food (np.ndarray): Int (N,) current player's food.
+        turns_remaining (np.ndarray): Int (N,) current player's turns remaining.
+        num_turns (int or np.ndarray): Turns per player in the game.
+        game_progress (np.ndarray): Float (N,) game_turn / total game turns.
+        opponent_best_score (np.ndarray): Int (N,) best live opponent board score (0 without opponents).
+        opponent_avg_food (np.ndarray): Float (N,) mean opponent food supply (0 without opponents).
+        board_capacity (int or np.ndarray): Bird slots per board.
+
+    Returns:
+        np.ndarray of shape (N, NUM_FEATURES).
+    """
+    n = hand_ids.shape[0]
+    food = np.asarray(food, dtype=np.int64)
+    turns_remaining = np.asarray(turns_remaining, dtype=np.int64)
+
+    in_hand = hand_ids >= 0
+    safe_ids = np.where(in_hand, hand_ids, 0)
+    hand_points = np.where(in_hand, _POOL_POINTS_INT[safe_ids], 0)
+    hand_costs = np.where(in_hand, _POOL_COSTS_INT[safe_ids], 0)
+    hand_ratios = np.where(in_hand, _POOL_RATIOS[safe_ids], 0.0)
+    playable = in_hand & (hand_costs <= food[:, None])
+    any_playable = playable.any(axis=1)
+
+    # Current player features
+    board_score = board @ _POOL_POINTS_INT
+    board_birds = board.sum(axis=1)
+    hand_count = in_hand.sum(axis=1)
+    hand_max_points = hand_points.max(axis=1, initial=0)
+    hand_min_cost = np.where(
+        any_playable,
+        np.where(playable, hand_costs, np.iinfo(np.int64).max).min(axis=1, initial=np.iinfo(np.int64).max),
+        0,
+    )
+    board_slots_left = board_capacity - board_birds
+    can_play = any_playable & (board_slots_left > 0)
+    hand_best_ratio = hand_ratios.max(axis=1, initial=0.0)
+
+    # Tier 1
+    best_immediate_vp = np.where(can_play, np.where(playable, hand_points, 0).max(axis=1, initial=0), 0)
+    affordable_count = np.where(can_play, playable.sum(axis=1), 0)
+    max_vp = _max_achievable_vp_arrays(hand_points, hand_costs, in_hand, food, board_slots_left, turns_remaining)
+
+    # Tray quality
+    tray_max_points = np.where(tray, _POOL_POINTS_INT, 0).max(axis=1, initial=0)
+    tray_best_ratio = np.where(tray, _POOL_RATIOS, 0.0).max(axis=1, initial=0.0)
+
+    # Tier 2: unseen = pool minus own hand, all boards and tray
+    hand_mask = np.zeros((n, len(_POOL_NAMES)), dtype=bool)
+    rows, cols = np.nonzero(in_hand)
+    hand_mask[rows, hand_ids[rows, cols]] = True
+    unseen = ~(hand_mask | seen | tray)
+    n_unseen = unseen.sum(axis=1)
+    has_unseen = n_unseen > 0
+    denom = np.maximum(n_unseen, 1)
+
+    unseen_mean_ratio = np.where(has_unseen, (unseen @ _POOL_RATIO_UNITS) / (_RATIO_SCALE * denom), 0.0)
+    unseen_better = unseen & (_POOL_RATIOS > hand_best_ratio[:, None])
+    prob_draw_better = np.where(has_unseen, unseen_better.sum(axis=1) / denom, 0.0)
+    unseen_affordable = unseen & (_POOL_COSTS_INT <= food[:, None])
+    n_affordable = unseen_affordable.sum(axis=1)
+    prob_draw_affordable = np.where(has_unseen, n_affordable / denom, 0.0)
+    mean_affordable_vp = np.where(
+        n_affordable > 0, (unseen_affordable @ _POOL_POINTS_INT) / np.maximum(n_affordable, 1), 0.0
+    )
+    draw_vp_upside = np.where(has_unseen, mean_affordable_vp - best_immediate_vp, 0.0)
+
+    # Opponent features
+    opponent_best_score = np.asarray(opponent_best_score, dtype=np.int64)
+    score_lead = board_score - opponent_best_score
+
+    # Interaction/polynomial (#92)
+    food_gap_for_best = np.maximum(0, hand_costs.max(axis=1, initial=0) - food)
+    vp_at_stake = hand_max_points - best_immediate_vp
+    endgame_flag = (turns_remaining <= 3).astype(np.float64)
+    urgency = np.where(
+        turns_remaining > 0,
+        np.maximum(0, opponent_best_score - board_score) / np.maximum(turns_remaining, 1),
+        0.0,
+    )
+
+    return np.column_stack(
+        [
+            np.broadcast_to(game_progress, (n,)),
+            food / 10.0,
+            board_score / 50.0,
+            board_birds / board_capacity,
+            hand_count / 10.0,
+            hand_max_points / 10.0,
+            hand_min_cost / 5.0,
+            can_play.astype(np.float64),
+            hand_best_ratio / 5.0,
+            # Tier 1
+            turns_remaining / num_turns,
+            best_immediate_vp / 10.0,
+            affordable_count / 5.0,
+            max_vp / 50.0,
+            # Tray quality
+            tray_max_points / 10.0,
+            tray_best_ratio / 5.0,
+            # Tier 2
+            unseen_mean_ratio / 5.0,
+            prob_draw_better,
+            prob_draw_affordable,
+            np.clip(draw_vp_upside / 10.0, -1.0, 1.0),
+            # Opponent/relative
+            opponent_best_score / 50.0,
+            opponent_avg_food / 10.0,
+            score_lead / 50.0,
+            # Interaction/polynomial (#92)
+            food_gap_for_best / 5.0,
+            vp_at_stake / 10.0,
+            endgame_flag,
+            urgency / 10.0,
+        ]
+    ).astype(np.float64, copy=False)
+
+
+def featurize_option_arrays(option_ids, food, turns_remaining, opponent_best_score):
+    """Vectorized featurize_option for N states with K options each.
+
+    Args:
+        option_ids (np.ndarray): Int (N, K) bird ids, DECK_OPTION for the deck.
+        food, turns_remaining, opponent_best_score (np.ndarray): Int (N,) per state.
+
+    Returns:
+        np.ndarray of shape (N, K, NUM_OPTION_FEATURES).
+    """
+    is_deck = option_ids == DECK_OPTION
+    safe_ids = np.where(is_deck, 0, option_ids)
+    food = np.asarray(food, dtype=np.int64)[:, None]
+    turns_left = np.asarray(turns_remaining, dtype=np.int64)[:, None]
+    opponent_best = np.asarray(opponent_best_score, dtype=np.int64)[:, None]
+
+    points = _POOL_POINTS_INT[safe_ids]
+    cost = _POOL_COSTS_INT[safe_ids]
+    turns_to_afford = np.maximum(0, cost - food)
+    points_vs_opponent = points / np.maximum(opponent_best, 1)
+
+    features = np.stack(
+        [
+            points / 10.0,
+            cost / 5.0,
+            _POOL_RATIOS[safe_ids] / 5.0,
+            (food >= cost).astype(np.float64),
+            turns_to_afford / 5.0,
+            (turns_to_afford + 1 <= turns_left).astype(np.float64),
+            np.minimum(points_vs_opponent, 2.0) / 2.0,
+            np.zeros(points.shape),
+        ],
+        axis=-1,
+    )
+    features[is_deck] = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0])
+    return features
+
+
+def _mask_to_ids(mask):
+    """Convert a bool (N, NUM_BIRDS) mask to (N, K) ids in id order, padded with -1."""
+    width = int(mask.sum(axis=1).max(initial=0))
+    order = np.argsort(~mask, axis=1, kind="stable")[:, :width]
+    return np.where(np.take_along_axis(mask, order, axis=1), order, -1)
+
+
+def _engine_opponents(engine, games, player):
+    """Return (opponent live board scores, opponent food) arrays of shape (n, num_players - 1)."""
+    others = (player[:, None] + np.arange(1, engine.num_players)) % engine.num_players
+    board_scores = engine.board_scores()[games]
+    return (
+        np.take_along_axis(board_scores, others, axis=1),
+        np.take_along_axis(engine.food[games], others, axis=1),
+    )
+
+
+def featurize_engine(engine, games):
+    """Featurize the listed games of a BatchGameEngine from each current player's perspective.
+
+    Returns an (n, NUM_FEATURES) array matching featurize on the equivalent
+    GameState (hands ordered by bird id).
+    """
+    player = engine.current_player(games)
+    opponent_scores, opponent_food = _engine_opponents(engine, games, player)
+
+    tray = np.zeros((len(games), len(_POOL_NAMES)), dtype=bool)
+    rows, slots = np.nonzero(engine.tray[games] >= 0)
+    tray[rows, engine.tray[games][rows, slots]] = True
+
+    return featurize_arrays(
+        hand_ids=_mask_to_ids(engine.hand[games, player]),
+        board=engine.board[games, player],
+        tray=tray,
+        seen=engine.board[games].any(axis=1),
+        food=engine.food[games, player],
+        turns_remaining=engine.turns_remaining[games, player],
+        num_turns=engine.num_turns,
+        game_progress=engine.game_turn[games] / (engine.num_turns * engine.num_players),
+        opponent_best_score=opponent_scores.max(axis=1, initial=0),
+        opponent_avg_food=opponent_food.mean(axis=1) if engine.num_players > 1 else np.zeros(len(games)),
+    )
+
+
+def featurize_engine_options(engine, games, option_ids):
+    """Option features for (n, K) option ids in the listed games of a BatchGameEngine."""
+    player = engine.current_player(games)
+    opponent_scores, _ = _engine_opponents(engine, games, player)
+    return featurize_option_arrays(
+        option_ids,
+        food=engine.food[games, player],
+        turns_remaining=engine.turns_remaining[games, player],
+        opponent_best_score=opponent_scores.max(axis=1, initial=0),
+    )
+
+
+# --- Batched featurization of GameStates ---
+
+
+def _state_arrays(state):
+    """Collect the featurize inputs of one GameState as bird ids and scalars.
+
+    Returns None if any visible bird is outside the bird pool, in which case
+    callers fall back to the scalar featurizer.
+    """
+    player = state.get_current_player()
+    board = player.get_game_board()
+    hand_ids = player.get_bird_hand().get_bird_ids()
+    board_ids = board.get_bird_ids()
+    seen_ids = [bird_id for p in state.get_players() for bird_id in p.get_game_board().get_bird_ids()]
+    tray_ids = state.get_tray().get_bird_ids()
+    if None in hand_ids or None in seen_ids or None in tray_ids:
+        return None
+
+    opponents = [p for p in state.get_players() if p is not player]
+    total_turns = state.num_turns * state.num_players
+    return {
+        "hand_ids": hand_ids,
+        "board_ids": board_ids,
+        "seen_ids": seen_ids,
+        "tray_ids": tray_ids,
+        "food": player.get_food_supply().amount,
+        "turns_remaining": player.get_turns_remaining(),
+        "num_turns": state.num_turns,
+        "game_progress": state.game_turn / total_turns if total_turns > 0 else 1.0,
+        "opponent_best_score": max((p.get_game_board().get_score() for p in opponents), default=0),
+        "opponent_avg_food": np.mean([p.get_food_supply().amount for p in opponents]) if opponents else 0,
+        "board_capacity": board.capacity,
+    }
+
+
+def _ids_to_mask(id_lists):
+    """Convert lists of bird ids to a bool (N, pool size) membership mask."""
+    mask = np.zeros((len(id_lists), len(_POOL_NAMES)), dtype=bool)
+    for i, ids in enumerate(id_lists):
+        mask[i, ids] = True
+    return mask
+
+
+def featurize_batch(states):
+    """Featurize many GameStates at once.
+
+    Row i equals featurize(states[i]) exactly. States whose visible birds are
+    all in the bird pool are computed together by featurize_arrays; any other
+    state falls back to featurize.
+
+    Returns a numpy array of shape (len(states), NUM_FEATURES).
+    """
+    features = np.zeros((len(states), NUM_FEATURES), dtype=np.float64)
+    rows = []
+    columns = []
+    for i, state in enumerate(states):
+        arrays = _state_arrays(state)
+        if arrays is None:
+            features[i] = featurize(state)
+        else:
+            rows.append(i)
+            columns.append(arrays)
+
+    if rows:
+        width = max(len(c["hand_ids"]) for c in columns)
+        hand_ids = np.full((len(rows), width), -1, dtype=np.int64)
+        for j, c in enumerate(columns):
+            hand_ids[j, : len(c["hand_ids"])] = c["hand_ids"]
+
+        def column(key):
+            return np.array([c[key] for c in columns])
+
+        features[rows] = featurize_arrays(
+            hand_ids=hand_ids,
+            board=_ids_to_mask([c["board_ids"] for c in columns]),
+            tray=_ids_to_mask([c["tray_ids"] for c in columns]),
+            seen=_ids_to_mask([c["seen_ids"] for c in columns]),
+            food=column("food"),
+            turns_remaining=column("turns_remaining"),
+            num_turns=column("num_turns"),
+            game_progress=column("game_progress"),
+            opponent_best_score=column("opponent_best_score"),
+            opponent_avg_food=column("opponent_avg_food"),
+            board_capacity=column("board_capacity"),
+        )
+    return features
+
+
+def featurize_option_batch(states, options):
+    """Option features for many states, each with its own list of options.
+
+    options[i] lists bird names (or 'deck') for states[i]. Returns a list of
+    arrays of shape (len(options[i]), NUM_OPTION_FEATURES), equal row by row
+    to featurize_option.
+    """
+    results = []
+    for state, names in zip(states, options):
+        player = state.get_current_player()
+        known = {b.get_name() for b in player.get_bird_hand().get_cards_in_hand()}
+        known.update(b.get_name() for b in state.get_tray().get_birds_in_tray())
+        if any(name != "deck" and name in known and name not in _POOL_NAME_TO_IDX for name in names):
+            results.append(np.array([featurize_option(state, name) for name in names]).reshape(-1, NUM_OPTION_FEATURES))
+            continue
+
+        # Options that are neither the deck nor a visible bird get all-zero features
+        valid = np.array([name == "deck" or name in known for name in names], dtype=bool)
+        option_ids = np.array(
+            [DECK_OPTION if name == "deck" else _POOL_NAME_TO_IDX.get(name, 0) for name in names], dtype=np.int64
+        )
+        opponents = [p for p in state.get_players() if p is not player]
+        option_features = featurize_option_arrays(
+            option_ids[None, :],
+            food=[player.get_food_supply().amount],
+            turns_remaining=[player.get_turns_remaining()],
+            opponent_best_score=[max((p.get_game_board().get_score() for p in opponents), default=0)],
+        )[0]
+        option_features[~valid] = 0.0
+        results.append(option_features)
+    return results
+
+
+def featurize_sub_decision(state, options):
+    """Combined [state features; option features] for every option of one sub-decision.
+
+    Returns a numpy array of shape (len(options), NUM_SUB_FEATURES).
+    """
+    state_features = featurize(state)
+    option_features = featurize_option_batch([state], [options])[0]
+    return np.hstack([np.broadcast_to(state_features, (len(options), NUM_FEATURES)), option_features])
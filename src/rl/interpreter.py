@@ -20,7 +20,8 @@ from src.rl.featurizer import (
     NUM_SUB_FEATURES,
     OPTION_FEATURE_NAMES,
     featurize,
-    featurize_option,
+    featurize_batch,
+    featurize_sub_decision,
 )
 from src.rl.linear_policy import LinearPolicy, _softmax
 
@@ -247,17 +248,8 @@ def trace_sub_decision(policy, state, options):
     Returns list of ActionBreakdown sorted by probability descending.
     """
     all_names = FEATURE_NAMES + OPTION_FEATURE_NAMES
-    state_features = featurize(state)
-    scores = []
-    combined_list = []
-
-    for option_name in options:
-        option_features = featurize_option(state, option_name)
-        combined = np.concatenate([state_features, option_features])
-        combined_list.append(combined)
-        scores.append(float(combined @ policy.sub_weights))
-
-    logits = np.array(scores)
+    combined_list = featurize_sub_decision(state, options)
+    logits = combined_list @ policy.sub_weights
     probs = _softmax(logits)
 
     breakdowns = []
@@ -287,25 +279,13 @@ def trace_sub_decision(policy, state, options):
 
 def create_sample_states(num_samples=3, seed=42):
     """Create deterministic sample GameStates for decision trace demonstrations."""
-    import random
-
     from src.game import WingspanGame
 
-    # Save caller's RNG state so we don't leak side effects
-    py_state = random.getstate()
-    np_state = np.random.get_state()
-
-    try:
-        states = []
-        for i in range(num_samples):
-            random.seed(seed + i)
-            np.random.seed(seed + i)
-            game = WingspanGame(num_players=2, num_turns=10)
-            states.append(game.game_state)
-        return states
-    finally:
-        random.setstate(py_state)
-        np.random.set_state(np_state)
+    states = []
+    for i in range(num_samples):
+        game = WingspanGame(num_players=2, num_turns=10, rng=np.random.default_rng(seed + i))
+        states.append(game.game_state)
+    return states
 
 
 def generate_diverse_states(policy, num_candidates=200, seed=42):
@@ -313,67 +293,53 @@ def generate_diverse_states(policy, num_candidates=200, seed=42):
 
     Plays partial games with random bots to create early/mid/late-game states,
     scores each by action-distribution entropy, and returns three representative
-    states: most confident, moderate, and most uncertain.
+    states: most confident, moderate, and most uncertain. Candidate i is dealt
+    and played from np.random.default_rng(seed + i).
 
     Returns list of dicts with keys: state, probs, entropy, label, turn.
     """
-    import contextlib
-    import io
-    import random
-
     from src.game import WingspanGame
 
-    # Save caller's RNG state so we don't leak side effects
-    py_state = random.getstate()
-    np_state = np.random.get_state()
-
-    try:
-        candidates = []
-        num_turns = 10
-        total_game_turns = num_turns * 2  # 2 players
+    states = []
+    num_turns = 10
+    total_game_turns = num_turns * 2  # 2 players
 
-        for i in range(num_candidates):
-            random.seed(seed + i)
-            np.random.seed(seed + i)
+    for i in range(num_candidates):
+        game = WingspanGame(num_players=2, num_human=0, num_turns=num_turns, rng=np.random.default_rng(seed + i))
 
-            with contextlib.redirect_stdout(io.StringIO()):
-                game = WingspanGame(num_players=2, num_human=0, num_turns=num_turns)
+        # Spread candidates across game stages
+        turns_to_play = (i * total_game_turns) // num_candidates
+        for _ in range(turns_to_play):
+            if game.game_state.is_game_over():
+                break
+            player = game.game_state.get_current_player()
+            action = player.request_action(game_state=game.game_state)
+            player.take_action(action=action, game_state=game.game_state)
+            game.game_state.end_player_turn(player=player)
 
-                # Spread candidates across game stages
-                turns_to_play = (i * total_game_turns) // num_candidates
-                for _ in range(turns_to_play):
-                    if game.game_state.is_game_over():
-                        break
-                    player = game.game_state.get_current_player()
-                    action = player.request_action(game_state=game.game_state)
-                    player.take_action(action=action, game_state=game.game_state)
-                    game.game_state.end_player_turn(player=player)
+        if not game.game_state.is_game_over():
+            states.append(game.game_state)
 
-            if game.game_state.is_game_over():
-                continue
-
-            state = game.game_state
-            all_logits = featurize(state) @ policy.weights
-            probs = _softmax(all_logits)
-            entropy = float(-np.sum(probs * np.log(probs + 1e-10)))
-            normalized = entropy / float(np.log(3))
-
-            candidates.append({"state": state, "probs": probs, "entropy": normalized, "turn": state.game_turn})
-
-        if not candidates:
-            return []
-
-        candidates.sort(key=lambda x: x["entropy"])
-        n = len(candidates)
-
-        return [
-            {**candidates[0], "label": "Confident"},
-            {**candidates[n // 2], "label": "Moderate"},
-            {**candidates[-1], "label": "Uncertain"},
-        ]
-    finally:
-        random.setstate(py_state)
-        np.random.set_state(np_state)
+    if not states:
+        return []
+
+    # Score all candidates in one batch
+    all_logits = featurize_batch(states) @ policy.weights
+    candidates = []
+    for state, logits in zip(states, all_logits):
+        probs = _softmax(logits)
+        entropy = float(-np.sum(probs * np.log(probs + 1e-10)))
+        normalized = entropy / float(np.log(3))
+        candidates.append({"state": state, "probs": probs, "entropy": normalized, "turn": state.game_turn})
+
+    candidates.sort(key=lambda x: x["entropy"])
+    n = len(candidates)
+
+    return [
+        {**candidates[0], "label": "Confident"},
+        {**candidates[n // 2], "label": "Moderate"},
+        {**candidates[-1], "label": "Uncertain"},
+    ]
 
 
 def format_game_context(state):
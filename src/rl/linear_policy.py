@@ -5,7 +5,7 @@ from src.rl.featurizer import (
     NUM_FEATURES,
     NUM_SUB_FEATURES,
     featurize,
-    featurize_option,
+    featurize_sub_decision,
 )
 from src.rl.policy import Policy
 
@@ -19,8 +19,9 @@ class LinearPolicy(Policy):
     Both are interpretable: weights show which features drive each decision.
     """
 
-    def __init__(self, num_actions=3):
+    def __init__(self, num_actions=3, rng=None):
         self.num_actions = num_actions
+        self.rng = rng
         self.weights = np.zeros((NUM_FEATURES, num_actions), dtype=np.float64)
         self.sub_weights = np.zeros(NUM_SUB_FEATURES, dtype=np.float64)
 
@@ -40,19 +41,9 @@ class LinearPolicy(Policy):
         Each option gets scored by concatenating state features with
         per-option features and dotting with sub_weights.
         """
-        state_features = featurize(state)
-        combined_list = []
-        scores = []
-
-        for option_name in options:
-            option_features = featurize_option(state, option_name)
-            combined = np.concatenate([state_features, option_features])
-            combined_list.append(combined)
-            scores.append(combined @ self.sub_weights)
-
-        logits = np.array(scores)
-        probs = _softmax(logits)
-        return combined_list, probs
+        combined = featurize_sub_decision(state, options)
+        probs = _softmax(combined @ self.sub_weights)
+        return list(combined), probs
 
     def get_action_probabilities(self, state, actions):
         """Return probability distribution over actions."""
@@ -63,17 +54,28 @@ class LinearPolicy(Policy):
             _, probs = self._score_options(state, actions)
         return probs
 
+    def action_probabilities_batch(self, features, legal_mask):
+        """Score many states at once: (N, NUM_FEATURES) @ weights, softmax over legal actions.
+
+        legal_mask is a bool (N, num_actions) array in ACTION_INDEX order.
+        """
+        return _masked_softmax(features @ self.weights, legal_mask)
+
+    def option_probabilities_batch(self, combined_features, option_mask):
+        """Score (N, K, NUM_SUB_FEATURES) option features, softmax over each row's valid options."""
+        return _masked_softmax(combined_features @ self.sub_weights, option_mask)
+
     def _policy_choose_action(self, state, legal_actions):
         _, probs = self._score_actions(state, legal_actions)
-        return np.random.choice(legal_actions, p=probs)
+        return self._random.choice(legal_actions, p=probs)
 
     def _policy_choose_a_bird_to_play(self, state, playable_birds):
         _, probs = self._score_options(state, playable_birds)
-        return np.random.choice(playable_birds, p=probs)
+        return self._random.choice(playable_birds, p=probs)
 
     def _policy_choose_a_bird_to_draw(self, state, valid_choices):
         _, probs = self._score_options(state, valid_choices)
-        return np.random.choice(valid_choices, p=probs)
+        return self._random.choice(valid_choices, p=probs)
 
     def save(self, path):
         """Save weights to a .npz file."""
@@ -95,3 +97,11 @@ def _softmax(logits):
     shifted = logits - np.max(logits)
     exp_scores = np.exp(shifted)
     return exp_scores / np.sum(exp_scores)
+
+
+def _masked_softmax(logits, mask):
+    """Row-wise softmax of a (N, K) logits array restricted to entries where mask is True."""
+    masked = np.where(mask, logits, -np.inf)
+    shifted = masked - masked.max(axis=1, keepdims=True)
+    exp_scores = np.exp(shifted)
+    return exp_scores / exp_scores.sum(axis=1, keepdims=True)
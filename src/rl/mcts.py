@@ -1,16 +1,69 @@
 import math
+from collections import OrderedDict
+
+
+class NodeStats:
+    """Visit count and total reward, shareable between nodes that reach the same state."""
+
+    __slots__ = ("num_visits", "total_reward")
+
+    def __init__(self):
+        self.num_visits = 0
+        self.total_reward = 0
 
 
 class Node:
-    """A node in the MCTS game tree, tracking visit count and total reward for UCB1."""
+    """A node in the MCTS game tree, tracking visit count and total reward for UCB1.
+
+    The statistics live in a NodeStats object; nodes created through a
+    TranspositionTable share it with every other node for the same state.
+
+    A child can be created from its representation alone. Its state is then
+    built the first time it is needed, by cloning the parent's state and
+    applying action, so children that are only played out never copy a state.
+    """
 
-    def __init__(self, state, parent=None, action=None):
-        self.state = state
+    def __init__(self, state=None, parent=None, action=None, stats=None, representation=None):
+        self._state = state
+        self._representation = representation
         self.parent = parent
         self.action = action
         self.children = []
-        self.num_visits = 0
-        self.total_reward = 0
+        self.stats = stats if stats is not None else NodeStats()
+
+    @property
+    def state(self):
+        if self._state is None:
+            self._state = self.parent.state.clone()
+            self._state.apply_move(self.action)
+        return self._state
+
+    @state.setter
+    def state(self, state):
+        self._state = state
+
+    @property
+    def representation(self):
+        """The state's to_representation(), computed once."""
+        if self._representation is None:
+            self._representation = self._state.to_representation()
+        return self._representation
+
+    @property
+    def num_visits(self):
+        return self.stats.num_visits
+
+    @num_visits.setter
+    def num_visits(self, value):
+        self.stats.num_visits = value
+
+    @property
+    def total_reward(self):
+        return self.stats.total_reward
+
+    @total_reward.setter
+    def total_reward(self, value):
+        self.stats.total_reward = value
 
     def get_ucb1(self, c=1.4142):
         """Upper Confidence Bound: exploitation (avg reward) + exploration (under-visited bonus)."""
@@ -26,3 +79,63 @@ class Edge:
         self.parent = parent
         self.child = child
         self.action = action
+
+
+class TranspositionTable:
+    """Bounded LRU map from state keys to shared NodeStats.
+
+    Keys are hashable state representations (MCTSGameState.to_representation()),
+    so identical states reached through different action orders, or again on a
+    later decision, accumulate visits in one place. When more than max_size
+    entries are held, the least recently used one is evicted; nodes still
+    holding its stats keep them, they just stop being shared.
+
+    hits and misses count lookups since construction or the last reset_counters().
+    """
+
+    def __init__(self, max_size=100_000):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}.")
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def lookup(self, key):
+        """Return the NodeStats for key, creating (and possibly evicting) on a miss."""
+        stats = self._entries.get(key)
+        if stats is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return stats
+
+        self.misses += 1
+        stats = NodeStats()
+        self._entries[key] = stats
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return stats
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def reset_counters(self):
+        """Zero hits, misses and evictions without dropping any entries."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self):
+        """Drop every entry and zero the counters."""
+        self._entries.clear()
+        self.reset_counters()
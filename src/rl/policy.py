@@ -1,6 +1,4 @@
-import contextlib
-import copy
-import io
+import time
 
 import numpy as np
 
@@ -13,8 +11,17 @@ class Policy:
     Dispatches to phase-specific methods based on state.phase. Subclasses must
     implement _policy_choose_action, _policy_choose_a_bird_to_play, and
     _policy_choose_a_bird_to_draw.
+
+    Random choices draw from rng, a numpy Generator, or the global np.random
+    state while rng is None.
     """
 
+    rng = None
+
+    @property
+    def _random(self):
+        return np.random if self.rng is None else self.rng
+
     def __call__(self, state, actions):
         if state.phase == CHOOSE_ACTION:
             return self._policy_choose_action(state, actions)
@@ -36,9 +43,20 @@ class Policy:
 class RandomPolicy(Policy):
     """Policy that selects uniformly at random from legal actions."""
 
+    def __init__(self, rng=None):
+        self.rng = rng
+
     def _uniform_random_choice(self, actions):
         """Return a choice uniformly at random from the list of actions."""
-        return np.random.choice(actions)
+        return self._random.choice(actions)
+
+    def action_probabilities_batch(self, features, legal_mask):
+        """Uniform distribution over each row's legal actions (batched play)."""
+        return legal_mask / legal_mask.sum(axis=1, keepdims=True)
+
+    def option_probabilities_batch(self, combined_features, option_mask):
+        """Uniform distribution over each row's valid options (batched play)."""
+        return option_mask / option_mask.sum(axis=1, keepdims=True)
 
     def _policy_choose_action(self, state, legal_actions):
         return self._uniform_random_choice(legal_actions)
@@ -50,44 +68,238 @@ class RandomPolicy(Policy):
         return self._uniform_random_choice(valid_choices)
 
 
+# Plies below the retained root searched for the next decision's state: one
+# opponent turn is at most two decisions
+_TREE_REUSE_DEPTH = 3
+
+# Leaf-parallel playouts sent to each worker per step, amortizing the IPC round trip
+_LEAVES_PER_WORKER = 4
+
+
 class MCTSPolicy(Policy):
     """Policy that uses Monte Carlo Tree Search (rhoUCT) to select actions.
 
     Builds a game tree via repeated select-expand-playout-backpropagate cycles,
     then returns the action leading to the most-visited child of the root.
+
+    With transposition_table_size set, node statistics are stored in a
+    TranspositionTable keyed on the state representation, so states reached
+    along different paths or on later decisions reuse accumulated visits.
+    The table is available as self.transposition_table for hit/miss counters.
+
+    With reuse_tree (the default), the chosen child is kept as self.root after
+    each decision. The next decision searches that subtree for a node whose
+    state representation matches the new state (the bird sub-decision of the
+    same turn, or our next turn after the opponents' moves) and continues
+    from it, running only enough simulations to bring the root up to
+    num_simulations visits.
+
+    With workers > 1 the search runs on a process pool (pool, or one created
+    on first use and shut down by close()):
+      - parallel="root": each worker searches its own tree from an independent
+        determinization of the root; root children are merged by visit count.
+        The tree is not retained, so reuse_tree and the transposition table
+        have no effect in this mode.
+      - parallel="leaf": the tree stays in this process; each step selects a
+        batch of leaves per worker (counting their visits up front so
+        selection spreads out) and plays them out in parallel.
+    Worker seeds are spawned from np.random.SeedSequence(seed), as is the
+    Generator (rng) behind expansion and determinization in this process;
+    the playout policy samples from its own rng.
+
+    With time_budget_ms set, each decision searches until the budget has
+    elapsed (always at least one simulation) instead of for num_simulations,
+    and returns the most-visited child found so far. After every decision,
+    last_search_stats holds simulations, elapsed_s, sims_per_sec, tree_size
+    and tree_depth for that search.
+
+    With playout_batch_size = K > 1, each expanded leaf is evaluated by K
+    playouts run together on a BatchGameEngine, with the playout policy
+    scoring all K games in one batched call per step (see _playout_batch);
+    the policy must support batched play, as LinearPolicy and RandomPolicy
+    do. Each playout counts as one simulation. Root-parallel workers use the
+    same batch size; leaf-parallel playouts are always single.
     """
 
-    def __init__(self, num_simulations=1000, playout_policy=None):
+    def __init__(
+        self,
+        num_simulations=1000,
+        playout_policy=None,
+        transposition_table_size=None,
+        reuse_tree=True,
+        workers=1,
+        parallel="root",
+        pool=None,
+        seed=None,
+        time_budget_ms=None,
+        playout_batch_size=1,
+    ):
         super().__init__()
+        if parallel not in ("root", "leaf"):
+            raise ValueError(f"Unknown parallel mode '{parallel}'. Must be 'root' or 'leaf'.")
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}.")
+        if playout_batch_size < 1:
+            raise ValueError(f"playout_batch_size must be at least 1, got {playout_batch_size}.")
+        if time_budget_ms is not None and time_budget_ms <= 0:
+            raise ValueError(f"time_budget_ms must be positive, got {time_budget_ms}.")
         self.num_simulations = num_simulations
+        self.time_budget_ms = time_budget_ms
+        self.last_search_stats = None
         self.playout_policy = playout_policy
+        self.playout_batch_size = playout_batch_size
+        self.reuse_tree = reuse_tree
+        self.workers = workers
+        self.parallel = parallel
+        self._pool = pool
+        self._owns_pool = False
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self._seed_sequence.spawn(1)[0])
         self.root = None
         self._mcts_player_index = None
+        self.transposition_table = None
+        if transposition_table_size is not None:
+            from src.rl.mcts import TranspositionTable
+
+            self.transposition_table = TranspositionTable(max_size=transposition_table_size)
 
     def _rhoUCT(self, state, actions):
         """UCT with environment model (rho). Returns max_a[Q(s, a)]."""
         from src.entities.game_state import MCTSGameState
-        from src.rl.mcts import Node
 
-        mcts_state = MCTSGameState.from_game_state(state)
-        root = Node(state=mcts_state)
+        start = time.perf_counter()
+        deadline = start + self.time_budget_ms / 1000 if self.time_budget_ms is not None else None
 
         # Track which player we're optimizing for
         self._mcts_player_index = state.game_turn % state.num_players
 
-        # TODO: implement subtree reuse by comparing state representations
-        # (requires Node.__eq__/__hash__ based on state.to_representation())
+        mcts_state = MCTSGameState.from_game_state(state)
+
+        if self.workers > 1 and self.parallel == "root":
+            best_action = self._root_parallel_search(mcts_state, actions, start, deadline)
+            assert best_action in actions, f"Chosen action must be one of {actions}, but was {best_action}."
+            return best_action
 
-        # Run simulations to estimate action values
-        self._run_simulations(root, self.num_simulations)
+        root = self._reuse_root(mcts_state, actions) if self.reuse_tree else None
+        if root is None:
+            # The search owns its root state: expansion applies and undoes moves on it
+            root = self._make_node(mcts_state.clone(with_tracker=False))
+
+        # Run simulations to estimate action values; a reused subtree only needs topping up
+        num_simulations = self.num_simulations
+        if root.children:
+            num_simulations = max(num_simulations - root.num_visits, 0)
+        simulations = self._run_simulations(root, num_simulations, deadline=deadline)
+        self._record_search_stats(start, simulations, *_tree_size_and_depth(root))
 
         # Choose the most-visited child
         best_child = self._best_child(root)
         best_action = best_child.action
 
         assert best_action in actions, f"Chosen action must be one of {actions}, but was {best_action}."
+
+        # Keep only the chosen subtree for the next decision
+        if self.reuse_tree:
+            best_child.parent = None
+            self.root = best_child
         return best_action
 
+    def _reuse_root(self, mcts_state, actions):
+        """Find the node in the retained subtree matching mcts_state and detach it as the new root.
+
+        The match is on the full state representation, searched breadth-first
+        up to _TREE_REUSE_DEPTH plies below the retained root. The matched node
+        takes a copy of the real state (bird names in the tray and hand can
+        differ between states with equal representations); its children are
+        kept only if they cover exactly the legal actions. Returns None when
+        nothing matches.
+        """
+        retained, self.root = self.root, None
+        if retained is None:
+            return None
+
+        representation = mcts_state.to_representation()
+        frontier = [retained]
+        for _ in range(_TREE_REUSE_DEPTH + 1):
+            next_frontier = []
+            for node in frontier:
+                if node.representation == representation:
+                    node.parent = None
+                    node.state = mcts_state.clone(with_tracker=False)
+                    if {child.action for child in node.children} != set(actions):
+                        node.children = []
+                    return node
+                if dict(node.representation)["game_turn"] <= mcts_state.game_turn:
+                    next_frontier.extend(node.children)
+            frontier = next_frontier
+        return None
+
+    def _get_pool(self):
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            self._owns_pool = True
+        return self._pool
+
+    def close(self):
+        """Shut down the process pool if this policy created it."""
+        if self._owns_pool:
+            self._pool.shutdown()
+            self._pool = None
+            self._owns_pool = False
+
+    def _spawn_seeds(self, n):
+        return [int(child.generate_state(1)[0]) for child in self._seed_sequence.spawn(n)]
+
+    def _record_search_stats(self, start, simulations, tree_size, tree_depth):
+        elapsed = time.perf_counter() - start
+        self.last_search_stats = {
+            "simulations": simulations,
+            "elapsed_s": elapsed,
+            "sims_per_sec": simulations / elapsed if elapsed > 0 else 0.0,
+            "tree_size": tree_size,
+            "tree_depth": tree_depth,
+        }
+
+    def _root_parallel_search(self, mcts_state, actions, start, deadline):
+        """Search independent determinizations in the pool and pick the action with most merged visits.
+
+        Workers see birds with the same (points, food_cost) under different
+        names, so their root actions are matched back to the real legal
+        actions by _action_key. Under a time budget every worker searches for
+        the time remaining.
+        """
+        self.root = None
+        representation = mcts_state.to_representation()
+        if deadline is None:
+            chunk_size, remainder = divmod(self.num_simulations, self.workers)
+            sims = [chunk_size + (1 if i < remainder else 0) for i in range(self.workers)]
+            sims = [n for n in sims if n > 0]
+            budget_s = None
+        else:
+            sims = [None] * self.workers
+            budget_s = max(deadline - time.perf_counter(), 0.0)
+        seeds = self._spawn_seeds(len(sims))
+        tasks = [
+            (representation, n, budget_s, self.playout_policy, self.playout_batch_size, self._mcts_player_index, seed)
+            for n, seed in zip(sims, seeds)
+        ]
+
+        visits = {}
+        simulations = tree_size = tree_depth = 0
+        for children, worker_sims, worker_size, worker_depth in self._get_pool().map(_root_search_task, tasks):
+            for key, num_visits in children:
+                visits[key] = visits.get(key, 0) + num_visits
+            simulations += worker_sims
+            tree_size += worker_size
+            tree_depth = max(tree_depth, worker_depth)
+        self._record_search_stats(start, simulations, tree_size, tree_depth)
+
+        key_to_action = {_action_key(mcts_state, action): action for action in actions}
+        best_key = max((key for key in visits if key in key_to_action), key=lambda key: visits[key])
+        return key_to_action[best_key]
+
     def _policy_choose_action(self, state, legal_actions):
         return self._rhoUCT(state=state, actions=legal_actions)
 
@@ -108,23 +320,41 @@ class MCTSPolicy(Policy):
             node = self._select_child(node)
         return node
 
-    def _expand(self, leaf):
-        """Expand the leaf node by generating one child per legal action. Return a random child."""
+    def _make_node(self, state=None, parent=None, action=None, representation=None):
+        """Create a tree node, sharing statistics through the transposition table when enabled.
+
+        Rewards are from the perspective of the MCTS player, so the key includes
+        its seat as well as the state representation.
+        """
         from src.rl.mcts import Node
 
-        if leaf.state.is_game_over():
+        node = Node(state=state, parent=parent, action=action, representation=representation)
+        if self.transposition_table is not None:
+            node.stats = self.transposition_table.lookup((self._mcts_player_index, node.representation))
+        return node
+
+    def _expand(self, leaf):
+        """Expand the leaf node by generating one child per legal action. Return a random child.
+
+        Each child's representation comes from applying its action to the
+        leaf's state and undoing it again; the child's own state is only
+        built if the child is expanded in turn (see Node).
+        """
+        state = leaf.state
+        if state.is_game_over():
             return leaf
 
-        actions = self._get_legal_actions(leaf.state)
+        actions = self._get_legal_actions(state)
         if not actions:
             return leaf
 
         for action in actions:
-            child_state = self._apply_action(leaf.state, action)
-            child = Node(state=child_state, parent=leaf, action=action)
-            leaf.children.append(child)
+            record = state.apply_move(action)
+            representation = state.to_representation()
+            state.undo_move(record)
+            leaf.children.append(self._make_node(parent=leaf, action=action, representation=representation))
 
-        return leaf.children[np.random.randint(len(leaf.children))]
+        return leaf.children[int(self.rng.random() * len(leaf.children))]
 
     def _get_legal_actions(self, state):
         """Enumerate legal actions based on the current phase."""
@@ -143,33 +373,8 @@ class MCTSPolicy(Policy):
 
     def _apply_action(self, state, action):
         """Clone the state and apply a single action, returning the new state."""
-        new_state = copy.deepcopy(state)
-        player = new_state.get_current_player()
-
-        if state.phase == CHOOSE_ACTION:
-            if action == "gain_food":
-                player.gain_food(new_state.get_bird_feeder())
-                new_state.end_player_turn(player)
-            elif action == "play_a_bird":
-                new_state.set_phase(CHOOSE_A_BIRD_TO_PLAY)
-            elif action == "draw_a_bird":
-                new_state.set_phase(CHOOSE_A_BIRD_TO_DRAW)
-            else:
-                raise ValueError(f"Unexpected action '{action}' for phase {state.phase}")
-        elif state.phase == CHOOSE_A_BIRD_TO_PLAY:
-            food_cost = player.bird_hand.get_card(action).get_food_cost()
-            player.food_supply.decrement(food_cost)
-            player.bird_hand.play_bird(action, player.game_board)
-            new_state.end_player_turn(player)
-        elif state.phase == CHOOSE_A_BIRD_TO_DRAW:
-            if action == "deck":
-                player.bird_hand.draw_card_from_deck(new_state.get_bird_deck())
-            else:
-                player.bird_hand.draw_bird_from_tray(new_state.get_tray(), action)
-            new_state.end_player_turn(player)
-        else:
-            raise ValueError(f"Unexpected phase: {state.phase}")
-
+        new_state = state.clone()
+        new_state.apply_move(action)
         return new_state
 
     def _playout(self, node):
@@ -177,29 +382,30 @@ class MCTSPolicy(Policy):
 
         Uses playout_policy if provided, otherwise defaults to RandomPolicy.
         """
+        return self._playout_representation(node.representation)
+
+    def _playout_representation(self, representation):
+        """Determinize a state representation and play it out. Returns the reward."""
         from src.entities.game_state import MCTSGameState
 
         # Clone state via determinization
-        sim_state = MCTSGameState.from_representation(
-            node.state.to_representation(), playout_policy=self.playout_policy
-        )
-
-        with contextlib.redirect_stdout(io.StringIO()):
-            # Complete mid-turn action if needed
+        sim_state = MCTSGameState.from_representation(representation, playout_policy=self.playout_policy, rng=self.rng)
+
+        # Complete mid-turn action if needed
+        current_player = sim_state.get_current_player()
+        if sim_state.phase == CHOOSE_A_BIRD_TO_PLAY:
+            current_player.play_a_bird(sim_state)
+            sim_state.end_player_turn(player=current_player)
+        elif sim_state.phase == CHOOSE_A_BIRD_TO_DRAW:
+            current_player.draw_a_bird(sim_state)
+            sim_state.end_player_turn(player=current_player)
+
+        # Run game to completion
+        while not sim_state.is_game_over():
             current_player = sim_state.get_current_player()
-            if sim_state.phase == CHOOSE_A_BIRD_TO_PLAY:
-                current_player.play_a_bird(sim_state)
-                sim_state.end_player_turn(player=current_player)
-            elif sim_state.phase == CHOOSE_A_BIRD_TO_DRAW:
-                current_player.draw_a_bird(sim_state)
-                sim_state.end_player_turn(player=current_player)
-
-            # Run game to completion
-            while not sim_state.is_game_over():
-                current_player = sim_state.get_current_player()
-                action = current_player.request_action(game_state=sim_state)
-                current_player.take_action(action=action, game_state=sim_state)
-                sim_state.end_player_turn(player=current_player)
+            action = current_player.request_action(game_state=sim_state)
+            current_player.take_action(action=action, game_state=sim_state)
+            sim_state.end_player_turn(player=current_player)
 
         return self._compute_reward(sim_state)
 
@@ -215,21 +421,177 @@ class MCTSPolicy(Policy):
         num_winners = sum(1 for s in scores if s == max_score)
         return 1.0 if num_winners == 1 else 0.5
 
-    def _backpropagate(self, node, reward):
-        """Propagate reward up the tree, updating visits and rewards."""
+    def _playout_batch(self, node, num_playouts):
+        """Play num_playouts independent determinizations of this node to completion at once.
+
+        The determinized states are packed into a BatchGameEngine and advanced
+        with play_batch_games, so the playout policy (playout_policy, or
+        RandomPolicy by default) scores every live game in one batched call
+        per step. Returns an array of num_playouts rewards, as _compute_reward.
+        """
+        from src.entities.batch_game import BatchGameEngine
+        from src.entities.compact_game import CompactGame
+        from src.entities.game_state import MCTSGameState
+        from src.rl.self_play import play_batch_games
+
+        representation = node.representation
+        engine = BatchGameEngine.from_compact_games(
+            [
+                CompactGame.from_game_state(MCTSGameState.from_representation(representation, rng=self.rng))
+                for _ in range(num_playouts)
+            ]
+        )
+        policy = self.playout_policy if self.playout_policy is not None else RandomPolicy(rng=self.rng)
+        seat_policy = np.zeros((num_playouts, engine.num_players), dtype=np.int64)
+        play_batch_games(engine, [policy], seat_policy, rng=self.rng)
+
+        scores = engine.scores
+        max_scores = scores.max(axis=1)
+        num_winners = (scores == max_scores[:, None]).sum(axis=1)
+        won = scores[:, self._mcts_player_index] == max_scores
+        return np.where(won, np.where(num_winners == 1, 1.0, 0.5), 0.0)
+
+    def _backpropagate(self, node, reward, num_visits=1):
+        """Propagate reward up the tree, updating visits and rewards.
+
+        reward is the total over num_visits playouts from node.
+        """
+        while node is not None:
+            node.num_visits += num_visits
+            node.total_reward += reward
+            node = node.parent
+
+    def _add_reward(self, node, reward):
+        """Propagate reward up the tree without counting a visit (already counted at selection)."""
         while node is not None:
-            node.num_visits += 1
             node.total_reward += reward
             node = node.parent
 
-    def _run_simulations(self, root, num_simulations):
-        """Run the MCTS loop: select leaf, expand, playout, backpropagate."""
-        for _ in range(num_simulations):
+    def _run_simulations(self, root, num_simulations, deadline=None):
+        """Run the MCTS loop: select leaf, expand, playout, backpropagate.
+
+        Runs num_simulations playouts, or with a deadline (a time.perf_counter()
+        value) keeps going until it passes, after at least one iteration.
+        With playout_batch_size > 1 each iteration plays that many playouts
+        from the expanded leaf at once. Returns the number of playouts run.
+        """
+        if self.workers > 1 and self.parallel == "leaf":
+            return self._run_simulations_leaf_parallel(root, num_simulations, deadline)
+        simulations = 0
+        while not _search_finished(simulations, num_simulations, deadline):
             leaf = self._select_leaf(root)
             unexplored_node = self._expand(leaf)
-            reward = self._playout(unexplored_node)
-            self._backpropagate(unexplored_node, reward)
+            if self.playout_batch_size > 1:
+                num_playouts = self.playout_batch_size
+                if deadline is None:
+                    num_playouts = min(num_playouts, num_simulations - simulations)
+                reward = float(self._playout_batch(unexplored_node, num_playouts).sum())
+            else:
+                num_playouts = 1
+                reward = self._playout(unexplored_node)
+            self._backpropagate(unexplored_node, reward, num_visits=num_playouts)
+            simulations += num_playouts
+        return simulations
+
+    def _run_simulations_leaf_parallel(self, root, num_simulations, deadline=None):
+        """Select up to workers * _LEAVES_PER_WORKER leaves per step and play them out in the pool.
+
+        Each selected leaf's visit is backpropagated immediately with zero
+        reward (a virtual loss), steering the next selection elsewhere; the
+        real reward is added once the playout returns.
+        """
+        batch_size = self.workers * _LEAVES_PER_WORKER
+        simulations = 0
+        while not _search_finished(simulations, num_simulations, deadline):
+            if deadline is None:
+                batch_size = min(batch_size, num_simulations - simulations)
+            leaves = []
+            for _ in range(batch_size):
+                leaf = self._expand(self._select_leaf(root))
+                self._backpropagate(leaf, 0.0)
+                leaves.append(leaf)
+            seeds = self._spawn_seeds(len(leaves))
+            tasks = [
+                (leaf.representation, self.playout_policy, self._mcts_player_index, seed)
+                for leaf, seed in zip(leaves, seeds)
+            ]
+            rewards = self._get_pool().map(_playout_task, tasks, chunksize=_LEAVES_PER_WORKER)
+            for leaf, reward in zip(leaves, rewards):
+                self._add_reward(leaf, reward)
+            simulations += len(leaves)
+        return simulations
 
     def _best_child(self, node):
         """Choose the child with the highest visit count."""
         return max(node.children, key=lambda child: child.num_visits)
+
+
+def _search_finished(simulations, num_simulations, deadline):
+    if deadline is None:
+        return simulations >= num_simulations
+    return simulations > 0 and time.perf_counter() >= deadline
+
+
+def _tree_size_and_depth(root):
+    """Count the nodes under root (inclusive) and the deepest ply below it."""
+    size = 0
+    depth = 0
+    stack = [(root, 0)]
+    while stack:
+        node, ply = stack.pop()
+        size += 1
+        depth = max(depth, ply)
+        stack.extend((child, ply + 1) for child in node.children)
+    return size, depth
+
+
+def _action_key(state, action):
+    """Identify a decision by what it does: bird choices by (points, food_cost), others by name."""
+    if state.phase == CHOOSE_A_BIRD_TO_PLAY:
+        return state.get_current_player().get_bird_hand().get_card(action).to_representation()
+    if state.phase == CHOOSE_A_BIRD_TO_DRAW and action != "deck":
+        return state.get_tray().birds[action].to_representation()
+    return action
+
+
+def _worker_policy(seed, playout_policy, playout_batch_size=1):
+    """Build a worker's MCTSPolicy seeded from its task seed.
+
+    The playout policy is the task's pickled copy of the parent's; it samples
+    from the search's Generator, since the parent's (or the worker's inherited
+    global) random state would give every worker the same playouts.
+    """
+    policy = MCTSPolicy(
+        playout_policy=playout_policy, reuse_tree=False, playout_batch_size=playout_batch_size, seed=seed
+    )
+    if playout_policy is not None:
+        playout_policy.rng = policy.rng
+    return policy
+
+
+def _root_search_task(args):
+    """Run a serial MCTS search from one determinization of the root in a worker process.
+
+    Top-level function so it's picklable by ProcessPoolExecutor. Searches
+    num_simulations times, or for budget_s seconds when that is set. Returns
+    ([(action key, visits) per root child], simulations, tree size, tree depth).
+    """
+    from src.entities.game_state import MCTSGameState
+    from src.rl.mcts import Node
+
+    representation, num_simulations, budget_s, playout_policy, playout_batch_size, mcts_player_index, seed = args
+    deadline = time.perf_counter() + budget_s if budget_s is not None else None
+    policy = _worker_policy(seed, playout_policy, playout_batch_size)
+    policy._mcts_player_index = mcts_player_index
+    root = Node(state=MCTSGameState.from_representation(representation, playout_policy=playout_policy, rng=policy.rng))
+    simulations = policy._run_simulations(root, num_simulations, deadline=deadline)
+    children = [(_action_key(root.state, child.action), child.num_visits) for child in root.children]
+    return (children, simulations, *_tree_size_and_depth(root))
+
+
+def _playout_task(args):
+    """Play out one state representation in a worker process and return the reward."""
+    representation, playout_policy, mcts_player_index, seed = args
+    policy = _worker_policy(seed, playout_policy)
+    policy._mcts_player_index = mcts_player_index
+    return policy._playout_representation(representation)
@@ -1,41 +1,36 @@
 """Self-play infrastructure for collecting training experience."""
 
-import contextlib
-import io
-from collections import namedtuple
-
 import numpy as np
 
-from src.rl.featurizer import ACTION_INDEX, featurize, featurize_option
+from src.rl.experience import ActionExperience, ExperienceBuffer, SubExperience  # noqa: F401  (re-exported)
+from src.rl.feature_tracker import FeatureTracker
+from src.rl.featurizer import ACTION_INDEX, NUM_FEATURES, featurize, featurize_sub_decision
 from src.rl.policy import Policy
+from src.rl.worker_pool import policy_ref, resolve_policy
+from src.utilities.shared_arrays import map_exported
 
 
 def _play_chunk(args):
     """Play a chunk of self-play games in a worker process.
 
-    Reconstructs the policy from serialized weights to avoid pickling issues.
+    The policy comes from a policy ref (see src.rl.worker_pool): a weights
+    version already broadcast to a PolicyWorkerPool, or the weight arrays.
+    Returns the experiences as a shared memory descriptor (see
+    ExperienceBuffer.to_shared), the reward stats and the weights version
+    the games were played with (None for a weight-array ref).
     Top-level function so it's picklable by ProcessPoolExecutor.
     """
-    weights, sub_weights, num_games, num_turns, seed = args
-
-    # Reseed RNG to ensure independent games across workers
-    np.random.seed(seed)
-
-    from src.rl.linear_policy import LinearPolicy
-
-    policy = LinearPolicy()
-    policy.weights = np.array(weights)
-    policy.sub_weights = np.array(sub_weights)
+    ref, num_games, num_turns, seed, backend = args
 
+    # Games and policy draw from this chunk's own Generator, independent across workers
+    rng = np.random.default_rng(seed)
+    policy, version = resolve_policy(ref)
+    policy.rng = rng
     runner = SelfPlayRunner()
-    return runner.collect_experience(policy, num_games=num_games, num_turns=num_turns)
-
-
-# Action-level experience (CHOOSE_ACTION phase)
-ActionExperience = namedtuple("ActionExperience", ["features", "action_index", "reward"])
-
-# Sub-decision experience (which bird to play/draw)
-SubExperience = namedtuple("SubExperience", ["combined_features", "action_index", "num_options", "reward"])
+    buffer, stats = runner.collect_experience(
+        policy, num_games=num_games, num_turns=num_turns, backend=backend, rng=rng
+    )
+    return buffer.to_shared(), stats, version
 
 
 class LoggingPolicy(Policy):
@@ -63,11 +58,7 @@ class LoggingPolicy(Policy):
         chosen_index = options.index(chosen)
 
         # Build combined features for each option
-        state_features = featurize(state)
-        combined_list = []
-        for option_name in options:
-            option_features = featurize_option(state, option_name)
-            combined_list.append(np.concatenate([state_features, option_features]))
+        combined_list = list(featurize_sub_decision(state, options))
 
         self.sub_log.append((combined_list, chosen_index))
         return chosen
@@ -78,33 +69,171 @@ class LoggingPolicy(Policy):
     def _policy_choose_a_bird_to_draw(self, state, valid_choices):
         return self._log_sub_decision(state, valid_choices)
 
-    def assign_rewards(self, reward):
-        """Convert logged decisions into experience tuples."""
-        action_exps = [ActionExperience(features=f, action_index=a, reward=reward) for f, a in self.action_log]
-        sub_exps = [
-            SubExperience(
-                combined_features=combined_list[chosen_idx],
-                action_index=chosen_idx,
-                num_options=len(combined_list),
-                reward=reward,
+    def assign_rewards(self, reward, buffer=None):
+        """Append the logged decisions, all with the given reward, to an ExperienceBuffer.
+
+        Returns the buffer (a new one if none is given).
+        """
+        if buffer is None:
+            buffer = ExperienceBuffer()
+        if self.action_log:
+            features, action_indices = zip(*self.action_log)
+            buffer.add_actions(np.array(features), action_indices, reward)
+        if self.sub_log:
+            buffer.add_subs(
+                np.array([combined_list[chosen_idx] for combined_list, chosen_idx in self.sub_log]),
+                [chosen_idx for _, chosen_idx in self.sub_log],
+                [len(combined_list) for combined_list, _ in self.sub_log],
+                reward,
             )
-            for combined_list, chosen_idx in self.sub_log
-        ]
-        return action_exps, sub_exps
+        return buffer
 
     def clear(self):
         self.action_log = []
         self.sub_log = []
 
 
+def _sample_rows(probs, rng):
+    """Draw one column index per row of a (N, K) probability array."""
+    cumulative = probs.cumsum(axis=1)
+    threshold = rng.random(len(probs))[:, None] * cumulative[:, -1:]
+    return (cumulative > threshold).argmax(axis=1)
+
+
+def _choose_batch(policies, policy_index, score, mask, rng):
+    """Sample one choice per row, scoring each row with the policy it belongs to.
+
+    score(policy, rows) must return the (len(rows), K) probabilities for those rows.
+    """
+    choices = np.zeros(len(mask), dtype=np.int64)
+    for k, policy in enumerate(policies):
+        rows = np.flatnonzero(policy_index == k)
+        if len(rows) > 0:
+            choices[rows] = _sample_rows(score(policy, rows), rng)
+    return choices
+
+
+def play_batch_games(engine, policies, seat_policy, log_seat=None, rng=None):
+    """Play every game in a BatchGameEngine to completion, one decision per game per step.
+
+    Each step featurizes all unfinished games at once and lets every policy
+    score its games in a single batched call, so policies must implement
+    action_probabilities_batch and option_probabilities_batch (LinearPolicy
+    and RandomPolicy do).
+
+    Args:
+        engine: BatchGameEngine to advance (mutated in place).
+        policies: List of batch-capable policies.
+        seat_policy: Int array (num_games, num_players) indexing policies per game and seat.
+        log_seat: Optional int array (num_games,) seat whose decisions are logged.
+        rng: Optional numpy Generator (defaults to the global np.random state).
+
+    Returns:
+        Tuple of (action_log, sub_log). action_log holds (game, features,
+        action_index); sub_log holds (game, combined_features, action_index,
+        num_options), both in the format used by ActionExperience/SubExperience.
+    """
+    from src.entities.compact_game import (
+        CHOOSE_A_BIRD_TO_DRAW_PHASE,
+        CHOOSE_A_BIRD_TO_PLAY_PHASE,
+        CHOOSE_ACTION_PHASE,
+    )
+    from src.rl.featurizer import DECK_OPTION, _mask_to_ids, featurize_engine, featurize_engine_options
+
+    for policy in policies:
+        if not hasattr(policy, "action_probabilities_batch"):
+            raise TypeError(f"{type(policy).__name__} does not support batched play")
+    if rng is None:
+        rng = np.random
+
+    action_log = []
+    sub_log = []
+
+    while True:
+        live = np.flatnonzero(~engine.is_game_over())
+        if len(live) == 0:
+            break
+
+        player = engine.current_player(live)
+        features = featurize_engine(engine, live)
+        policy_index = seat_policy[live, player]
+        logged = np.zeros(len(live), dtype=bool) if log_seat is None else log_seat[live] == player
+        phase = engine.phase[live]
+
+        # CHOOSE_ACTION: one matmul per policy over all its games
+        rows = np.flatnonzero(phase == CHOOSE_ACTION_PHASE)
+        if len(rows) > 0:
+            games = live[rows]
+            mask = engine.action_mask(games)
+            actions = _choose_batch(
+                policies,
+                policy_index[rows],
+                lambda policy, r: policy.action_probabilities_batch(features[rows[r]], mask[r]),
+                mask,
+                rng,
+            )
+            for r in np.flatnonzero(logged[rows]):
+                action_log.append((games[r], features[rows[r]], int(actions[r])))
+            engine.apply_choose_action(games, actions)
+
+        # Sub-decisions: options are hand birds (play) or tray slots plus the deck (draw)
+        for sub_phase in (CHOOSE_A_BIRD_TO_PLAY_PHASE, CHOOSE_A_BIRD_TO_DRAW_PHASE):
+            rows = np.flatnonzero(phase == sub_phase)
+            if len(rows) == 0:
+                continue
+            games = live[rows]
+            if sub_phase == CHOOSE_A_BIRD_TO_PLAY_PHASE:
+                option_ids = _mask_to_ids(engine.playable_mask(games))
+                mask = option_ids >= 0
+            else:
+                mask = engine.draw_mask(games)
+                option_ids = np.column_stack([engine.tray[games], np.full(len(games), DECK_OPTION)])
+
+            option_features = featurize_engine_options(engine, games, option_ids)
+            state_features = np.broadcast_to(features[rows][:, None, :], option_features.shape[:2] + (NUM_FEATURES,))
+            combined = np.concatenate([state_features, option_features], axis=2)
+
+            choices = _choose_batch(
+                policies,
+                policy_index[rows],
+                lambda policy, r: policy.option_probabilities_batch(combined[r], mask[r]),
+                mask,
+                rng,
+            )
+            for r in np.flatnonzero(logged[rows]):
+                # Index among the valid options only, as in the object engine's option lists
+                chosen_index = int(mask[r, : choices[r]].sum())
+                sub_log.append((games[r], combined[r, choices[r]], chosen_index, int(mask[r].sum())))
+
+            if sub_phase == CHOOSE_A_BIRD_TO_PLAY_PHASE:
+                engine.apply_play(games, option_ids[np.arange(len(games)), choices])
+            else:
+                engine.apply_draw(games, choices)
+
+    return action_log, sub_log
+
+
+def _seat_rewards(scores, seats):
+    """Reward per game for the given seat: 1.0 win, 0.0 loss, 0.5 tie against the best other score."""
+    games = np.arange(len(scores))
+    own = scores[games, seats]
+    others = scores.copy()
+    others[games, seats] = np.iinfo(scores.dtype).min
+    best_other = others.max(axis=1)
+    return np.where(own > best_other, 1.0, np.where(own < best_other, 0.0, 0.5))
+
+
 class SelfPlayRunner:
     """Runs bot-vs-bot games and collects training experience."""
 
-    def run_game(self, policy, opponent_policy=None, num_turns=10):
+    def run_game(self, policy, opponent_policy=None, num_turns=10, buffer=None, rng=None):
         """Play one game and return experiences for the learning player (player 0).
 
+        The experiences are appended to buffer (a new ExperienceBuffer if None).
+        rng (a numpy Generator) deals the game; the policies sample from their own.
+
         Returns:
-            Tuple of (action_experiences, sub_experiences, reward).
+            Tuple of (buffer, reward).
         """
         from src.game import WingspanGame
 
@@ -121,14 +250,15 @@ class SelfPlayRunner:
             call_count[0] += 1
             return policies[idx]
 
-        with contextlib.redirect_stdout(io.StringIO()):
-            game = WingspanGame(
-                num_players=2,
-                num_human=0,
-                num_turns=num_turns,
-                bot_policy_factory=policy_factory,
-            )
-            game.play()
+        game = WingspanGame(
+            num_players=2,
+            num_human=0,
+            num_turns=num_turns,
+            bot_policy_factory=policy_factory,
+            rng=rng,
+        )
+        FeatureTracker.attach(game.game_state)
+        game.play()
 
         scores = game.get_player_scores()
         if scores[0] > scores[1]:
@@ -138,50 +268,89 @@ class SelfPlayRunner:
         else:
             reward = 0.5
 
-        action_exps, sub_exps = logger_0.assign_rewards(reward)
-        return action_exps, sub_exps, reward
+        return logger_0.assign_rewards(reward, buffer), reward
 
-    def collect_experience(self, policy, num_games, opponent_policy=None, num_turns=10):
+    def run_batch(self, policy, num_games, opponent_policy=None, num_turns=10, rng=None):
+        """Play num_games in lockstep on a BatchGameEngine, logging player 0.
+
+        Returns:
+            Tuple of (ExperienceBuffer, rewards array).
+        """
+        from src.entities.batch_game import BatchGameEngine
+
+        if opponent_policy is None:
+            opponent_policy = policy
+
+        engine = BatchGameEngine(num_games, num_players=2, num_turns=num_turns, rng=rng)
+        seat_policy = np.tile([0, 1], (num_games, 1))
+        log_seat = np.zeros(num_games, dtype=np.int64)
+        action_log, sub_log = play_batch_games(engine, [policy, opponent_policy], seat_policy, log_seat, rng=rng)
+
+        rewards = _seat_rewards(engine.scores, log_seat)
+        buffer = ExperienceBuffer(capacity=max(1, len(action_log), len(sub_log)))
+        if action_log:
+            games, features, action_indices = zip(*action_log)
+            buffer.add_actions(np.array(features), action_indices, rewards[list(games)])
+        if sub_log:
+            games, combined, action_indices, num_options = zip(*sub_log)
+            buffer.add_subs(np.array(combined), action_indices, num_options, rewards[list(games)])
+        return buffer, rewards
+
+    def collect_experience(self, policy, num_games, opponent_policy=None, num_turns=10, backend="object", rng=None):
         """Run N games and return aggregated experiences + stats.
 
+        backend="object" plays WingspanGame instances one at a time;
+        backend="batch" plays all games in lockstep on a BatchGameEngine
+        (requires batch-capable policies such as LinearPolicy/RandomPolicy).
+        rng is the numpy Generator the games are dealt from (and, on the batch
+        backend, sampled with); None uses the global random state.
+
         Returns:
-            Tuple of (action_experiences, sub_experiences, stats).
+            Tuple of (ExperienceBuffer, stats).
         """
-        all_action_exps = []
-        all_sub_exps = []
+        if backend == "batch":
+            buffer, rewards = self.run_batch(
+                policy, num_games, opponent_policy=opponent_policy, num_turns=num_turns, rng=rng
+            )
+            return buffer, _reward_stats(rewards)
+        elif backend != "object":
+            raise ValueError(f"Unknown backend '{backend}'. Must be 'object' or 'batch'.")
+
+        buffer = ExperienceBuffer(capacity=max(1, num_games * num_turns))
         rewards = []
 
         for _ in range(num_games):
-            action_exps, sub_exps, reward = self.run_game(policy, opponent_policy=opponent_policy, num_turns=num_turns)
-            all_action_exps.extend(action_exps)
-            all_sub_exps.extend(sub_exps)
+            _, reward = self.run_game(
+                policy, opponent_policy=opponent_policy, num_turns=num_turns, buffer=buffer, rng=rng
+            )
             rewards.append(reward)
 
-        stats = {
-            "wins": sum(1 for r in rewards if r == 1.0),
-            "losses": sum(1 for r in rewards if r == 0.0),
-            "ties": sum(1 for r in rewards if r == 0.5),
-            "mean_reward": np.mean(rewards),
-        }
-
-        return all_action_exps, all_sub_exps, stats
+        return buffer, _reward_stats(rewards)
 
     @staticmethod
-    def collect_experience_parallel(policy, num_games, num_turns=10, pool=None, workers=1):
+    def collect_experience_parallel(policy, num_games, num_turns=10, pool=None, workers=1, backend="object", seed=None):
         """Run N self-play games distributed across a process pool.
 
         Splits games into chunks, dispatches to workers, and merges results.
-        Requires a LinearPolicy (weights are serialized for workers).
+        With a PolicyWorkerPool the weights are broadcast once through shared
+        memory and the chunks carry only their version; a plain executor is
+        sent the weight arrays with every chunk.
+        Workers write their experiences to shared memory and send back only
+        a descriptor; the parent reads each segment in place while merging.
+        Requires a LinearPolicy (its weights are sent to the workers).
 
         Args:
             policy: LinearPolicy with weights/sub_weights attributes.
             num_games: Total games to play.
             num_turns: Turns per game.
-            pool: A ProcessPoolExecutor instance (required).
+            pool: A PolicyWorkerPool or ProcessPoolExecutor instance (required).
             workers: Number of workers to split work across.
+            backend: "object" or "batch", passed to each worker's collect_experience.
+            seed: Seed for the SeedSequence the workers' Generators are spawned
+                from (None for fresh entropy).
 
         Returns:
-            Tuple of (action_experiences, sub_experiences, stats).
+            Tuple of (ExperienceBuffer, stats).
         """
         if pool is None:
             raise ValueError("pool is required for parallel experience collection")
@@ -189,35 +358,38 @@ class SelfPlayRunner:
         chunk_size = num_games // workers
         remainder = num_games % workers
 
-        weights = policy.weights.tolist()
-        sub_weights = policy.sub_weights.tolist()
+        ref = policy_ref(pool, policy)
 
         # Generate independent seeds via SeedSequence for each worker
-        parent_seed = np.random.SeedSequence()
+        parent_seed = np.random.SeedSequence(seed)
         child_seeds = parent_seed.spawn(workers)
 
         chunks = []
         for i in range(workers):
             games = chunk_size + (1 if i < remainder else 0)
             if games > 0:
-                seed = child_seeds[i].generate_state(1)[0]
-                chunks.append((weights, sub_weights, games, num_turns, seed))
-
-        results = list(pool.map(_play_chunk, chunks))
-
-        all_action_exps = []
-        all_sub_exps = []
-        all_rewards = []
-        for action_exps, sub_exps, stats in results:
-            all_action_exps.extend(action_exps)
-            all_sub_exps.extend(sub_exps)
-            all_rewards.extend([1.0] * stats["wins"] + [0.0] * stats["losses"] + [0.5] * stats["ties"])
-
-        merged_stats = {
-            "wins": sum(1 for r in all_rewards if r == 1.0),
-            "losses": sum(1 for r in all_rewards if r == 0.0),
-            "ties": sum(1 for r in all_rewards if r == 0.5),
-            "mean_reward": np.mean(all_rewards),
-        }
-
-        return all_action_exps, all_sub_exps, merged_stats
+                chunk_seed = child_seeds[i].generate_state(1)[0]
+                chunks.append((ref, games, num_turns, chunk_seed, backend))
+
+        results = map_exported(pool, _play_chunk, chunks, descriptor=lambda result: result[0])
+        return _merge_chunk_results([(descriptor, stats) for descriptor, stats, _ in results])
+
+
+def _merge_chunk_results(results):
+    """Merge the (descriptor, stats) results of _play_chunk into one (ExperienceBuffer, stats)."""
+    all_rewards = []
+    for _, stats in results:
+        all_rewards.extend([1.0] * stats["wins"] + [0.0] * stats["losses"] + [0.5] * stats["ties"])
+
+    buffer = ExperienceBuffer.merge_shared(descriptor for descriptor, _ in results)
+    return buffer, _reward_stats(all_rewards)
+
+
+def _reward_stats(rewards):
+    """Summarize a sequence of game rewards as win/loss/tie counts and mean reward."""
+    return {
+        "wins": sum(1 for r in rewards if r == 1.0),
+        "losses": sum(1 for r in rewards if r == 0.0),
+        "ties": sum(1 for r in rewards if r == 0.5),
+        "mean_reward": np.mean(rewards),
+    }
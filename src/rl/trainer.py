@@ -2,6 +2,7 @@
 
 import numpy as np
 
+from src.rl.experience import ExperienceBuffer
 from src.rl.linear_policy import _softmax
 
 
@@ -34,31 +35,65 @@ def compute_sub_gradient(experience, sub_weights, baseline=0.0):
     return combined * advantage
 
 
+def compute_batch_action_gradient(features, action_indices, rewards, weights, num_actions, baseline=0.0):
+    """Sum of compute_action_gradient over a stacked batch, as two matrix products.
+
+    Each sample contributes outer(features, one_hot - probs) * advantage, so the
+    sum is features.T @ ((one_hot - probs) * advantage[:, None]).
+    """
+    logits = features @ weights[:, :num_actions]
+    logits -= logits.max(axis=1, keepdims=True)
+    probs = np.exp(logits)
+    probs /= probs.sum(axis=1, keepdims=True)
+
+    delta = -probs
+    delta[np.arange(len(action_indices)), action_indices] += 1.0
+    delta *= (rewards - baseline)[:, None]
+    return features.T @ delta
+
+
+def compute_batch_sub_gradient(combined_features, rewards, baseline=0.0):
+    """Sum of compute_sub_gradient over a stacked batch."""
+    return (rewards - baseline) @ combined_features
+
+
 def train_batch(policy, action_experiences, sub_experiences, learning_rate=0.01):
+    """Update policy weights using REINFORCE with baseline from lists of experiences.
+
+    Stacks the experiences into an ExperienceBuffer and calls train_buffer.
+    Returns the mean reward (for monitoring).
+    """
+    if not action_experiences and not sub_experiences:
+        return 0.0
+    buffer = ExperienceBuffer.from_experiences(action_experiences, sub_experiences)
+    return train_buffer(policy, buffer, learning_rate=learning_rate)
+
+
+def train_buffer(policy, buffer, learning_rate=0.01):
     """Update policy weights using REINFORCE with baseline.
 
-    Updates both action weights and sub-decision weights.
+    Updates both action weights and sub-decision weights, computing each
+    gradient for the whole ExperienceBuffer at once.
     Returns the mean reward (for monitoring).
     """
-    all_rewards = [e.reward for e in action_experiences] + [e.reward for e in sub_experiences]
-    if not all_rewards:
+    if len(buffer) == 0:
         return 0.0
 
-    baseline = np.mean(all_rewards)
+    action_rewards = buffer.action_rewards
+    sub_rewards = buffer.sub_rewards
+    baseline = np.concatenate([action_rewards, sub_rewards]).mean()
 
     # Update action weights
-    if action_experiences:
+    if len(action_rewards):
         num_actions = policy.num_actions
-        action_grad = np.zeros_like(policy.weights)
-        for exp in action_experiences:
-            action_grad[:, :num_actions] += compute_action_gradient(exp, policy.weights, num_actions, baseline=baseline)
-        policy.weights += learning_rate * action_grad / len(action_experiences)
+        action_grad = compute_batch_action_gradient(
+            buffer.action_features, buffer.action_indices, action_rewards, policy.weights, num_actions, baseline
+        )
+        policy.weights[:, :num_actions] += learning_rate * action_grad / len(action_rewards)
 
     # Update sub-decision weights
-    if sub_experiences:
-        sub_grad = np.zeros_like(policy.sub_weights)
-        for exp in sub_experiences:
-            sub_grad += compute_sub_gradient(exp, policy.sub_weights, baseline=baseline)
-        policy.sub_weights += learning_rate * sub_grad / len(sub_experiences)
+    if len(sub_rewards):
+        sub_grad = compute_batch_sub_gradient(buffer.sub_features, sub_rewards, baseline=baseline)
+        policy.sub_weights += learning_rate * sub_grad / len(sub_rewards)
 
     return baseline
@@ -0,0 +1,186 @@
+"""Long-lived self-play/eval workers that share the learner's weights through shared memory.
+
+PolicyWorkerPool wraps a ProcessPoolExecutor whose workers each build one
+LinearPolicy at startup. Before dispatching work, the parent publishes the
+current weights into a SharedWeights segment, which bumps its version; tasks
+then carry only that version number and each worker copies the weights into
+its policy the first time it sees a new version. The segment holds a single
+set of weights, so a task still queued when newer weights are published plays
+with those instead; resolve_policy reports the version actually used.
+
+Tasks refer to their policy through a "policy ref" (see policy_ref and
+resolve_policy): a version number for a PolicyWorkerPool, or the weight
+arrays themselves for a plain executor.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from src.rl.featurizer import NUM_FEATURES, NUM_SUB_FEATURES
+from src.rl.linear_policy import LinearPolicy
+
+# Attempts before a reader gives up waiting for a consistent snapshot
+_MAX_READ_ATTEMPTS = 10_000
+
+
+class SharedWeights:
+    """LinearPolicy weights in a shared memory segment, guarded by a seqlock version counter.
+
+    The segment holds an int64 version followed by weights and sub_weights.
+    The writer makes the version odd while it copies and even again when
+    done; readers retry until they see the same even version before and
+    after copying, so they never use a half-written update.
+    """
+
+    def __init__(self, num_actions=3, name=None):
+        self.weights_shape = (NUM_FEATURES, num_actions)
+        self.sub_weights_shape = (NUM_SUB_FEATURES,)
+        weights_size = NUM_FEATURES * num_actions
+        size = 8 * (1 + weights_size + NUM_SUB_FEATURES)
+        self._owner = name is None
+        self._shm = SharedMemory(name=name, create=self._owner, size=size if self._owner else 0)
+
+        buffer = np.ndarray(size // 8, dtype=np.float64, buffer=self._shm.buf)
+        self._version = np.ndarray(1, dtype=np.int64, buffer=self._shm.buf)
+        self._weights = buffer[1 : 1 + weights_size].reshape(self.weights_shape)
+        self._sub_weights = buffer[1 + weights_size :]
+        if self._owner:
+            self._version[0] = 0
+        self.num_actions = num_actions
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def version(self):
+        return int(self._version[0])
+
+    def publish(self, weights, sub_weights):
+        """Write new weights and return their (even) version number."""
+        self._version[0] += 1
+        self._weights[...] = weights
+        self._sub_weights[...] = sub_weights
+        self._version[0] += 1
+        return self.version
+
+    def read_into(self, policy):
+        """Copy a consistent snapshot of the weights into policy and return its version."""
+        for _ in range(_MAX_READ_ATTEMPTS):
+            before = self.version
+            if before % 2 == 0:
+                policy.weights[...] = self._weights
+                policy.sub_weights[...] = self._sub_weights
+                if self.version == before:
+                    return before
+        raise RuntimeError("Timed out waiting for a consistent weight snapshot")
+
+    def close(self):
+        """Release this process's mapping; the owner also frees the segment."""
+        self._version = self._weights = self._sub_weights = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+# --- Worker-process state (set once by _init_worker) ---
+
+_worker_weights = None
+_worker_policy = None
+_worker_version = -1
+
+
+def _init_worker(name, num_actions):
+    """Pool initializer: attach the shared weights and build the worker's policy once."""
+    global _worker_weights, _worker_policy, _worker_version
+    _worker_weights = SharedWeights(num_actions=num_actions, name=name)
+    _worker_policy = LinearPolicy(num_actions=num_actions)
+    _worker_version = -1
+
+
+def _synced_worker_policy(version):
+    """Return (policy, version) for this worker, refreshed from shared memory if it moved on.
+
+    The returned version is the latest published one, which may be newer than
+    the version the task asked for.
+    """
+    global _worker_version
+    if _worker_version != _worker_weights.version:
+        _worker_version = _worker_weights.read_into(_worker_policy)
+    if _worker_version < version:
+        raise RuntimeError(f"Expected weights version {version} or newer, found {_worker_version}")
+    return _worker_policy, _worker_version
+
+
+class PolicyWorkerPool:
+    """ProcessPoolExecutor of workers that keep a LinearPolicy in sync via SharedWeights.
+
+    Pass it as the pool of collect_experience_parallel and evaluate_parallel.
+    """
+
+    def __init__(self, workers, num_actions=3):
+        self.workers = workers
+        self.shared_weights = SharedWeights(num_actions=num_actions)
+        self._last_published = None
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.shared_weights.name, num_actions),
+        )
+
+    def publish(self, policy):
+        """Broadcast policy's weights to the workers and return the version to put in tasks.
+
+        Publishing unchanged weights reuses the current version.
+        """
+        current = (policy.weights, policy.sub_weights)
+        if self._last_published is not None and all(
+            np.array_equal(new, old) for new, old in zip(current, self._last_published)
+        ):
+            return self.shared_weights.version
+        self._last_published = (policy.weights.copy(), policy.sub_weights.copy())
+        return self.shared_weights.publish(*current)
+
+    def map(self, fn, *iterables):
+        return self._executor.map(fn, *iterables)
+
+    def submit(self, fn, *args, **kwargs):
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+        self.shared_weights.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+def policy_ref(pool, policy):
+    """Return what a task needs to rebuild policy in a worker of pool.
+
+    A PolicyWorkerPool gets just the published weights version; any other
+    executor gets the (weights, sub_weights) arrays.
+    """
+    if isinstance(pool, PolicyWorkerPool):
+        return pool.publish(policy)
+    return policy.weights, policy.sub_weights
+
+
+def resolve_policy(ref):
+    """Worker side of policy_ref: return (policy, version) for a task to play with.
+
+    version is the shared weights version the policy holds, at least the one
+    in ref, or None when ref carries the weight arrays.
+    """
+    if isinstance(ref, int):
+        return _synced_worker_policy(ref)
+    weights, sub_weights = ref
+    policy = LinearPolicy(num_actions=weights.shape[1])
+    policy.weights = np.array(weights)
+    policy.sub_weights = np.array(sub_weights)
+    return policy, None
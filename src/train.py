@@ -1,14 +1,17 @@
 """CLI for training, evaluating, and visualizing learned policies."""
 
 import argparse
+import cProfile
 import csv
 import os
+import sys
 
-from src.rl.evaluator import evaluate, evaluate_parallel
+from src.rl.evaluator import evaluate, evaluate_parallel, evaluate_sequential
 from src.rl.linear_policy import LinearPolicy
 from src.rl.policy import RandomPolicy
 from src.rl.self_play import SelfPlayRunner
-from src.rl.trainer import train_batch
+from src.rl.trainer import train_buffer
+from src.utilities.timing import PhaseTimer
 
 METRICS_FILENAME = "training_metrics.csv"
 METRICS_FIELDS = [
@@ -25,6 +28,16 @@ METRICS_FIELDS = [
 ]
 
 
+# Per-iteration wall time and throughput, written with --timing
+TIMING_FILENAME = "training_timing.csv"
+TIMING_PHASES = ["self_play", "train", "eval", "log", "checkpoint"]
+TIMING_FIELDS = (
+    ["iteration", "workers", "games", "decisions"]
+    + [f"{phase}_s" for phase in TIMING_PHASES]
+    + ["total_s", "games_per_sec", "decisions_per_sec", "games_per_sec_per_worker", "decisions_per_sec_per_worker"]
+)
+
+
 def _init_metrics_file(output_dir):
     """Create (or overwrite) the metrics CSV with headers. Return path."""
     path = os.path.join(output_dir, METRICS_FILENAME)
@@ -64,8 +77,48 @@ def _append_metrics(path, row):
         writer.writerow(row)
 
 
+def _init_timing_file(output_dir, overwrite):
+    """Create the timing CSV with headers, keeping an existing one unless overwrite. Return path."""
+    path = os.path.join(output_dir, TIMING_FILENAME)
+    if overwrite or not os.path.exists(path):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=TIMING_FIELDS)
+            writer.writeheader()
+    return path
+
+
+def _timing_row(iteration, timer, games, decisions, workers):
+    """One timing CSV row: wall seconds per phase, plus self-play throughput overall and per worker.
+
+    decisions counts the learner's logged decisions (experience rows).
+    """
+    row = {"iteration": iteration, "workers": workers, "games": games, "decisions": decisions}
+    for phase in TIMING_PHASES:
+        row[f"{phase}_s"] = f"{timer.seconds.get(phase, 0.0):.4f}"
+    row["total_s"] = f"{timer.total():.4f}"
+    self_play_s = timer.seconds.get("self_play", 0.0)
+    games_per_sec = games / self_play_s if self_play_s > 0 else 0.0
+    decisions_per_sec = decisions / self_play_s if self_play_s > 0 else 0.0
+    row["games_per_sec"] = f"{games_per_sec:.2f}"
+    row["decisions_per_sec"] = f"{decisions_per_sec:.2f}"
+    row["games_per_sec_per_worker"] = f"{games_per_sec / workers:.2f}"
+    row["decisions_per_sec_per_worker"] = f"{decisions_per_sec / workers:.2f}"
+    return row
+
+
+def _append_timing(path, row):
+    """Append one row to the timing CSV."""
+    with open(path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=TIMING_FIELDS)
+        writer.writerow(row)
+
+
 def train(args):
     """Run the training loop, logging metrics to CSV."""
+    if args.actor_learner and args.workers < 2:
+        print("--actor_learner needs --workers of at least 2.")
+        return
+
     os.makedirs(args.output_dir, exist_ok=True)
 
     if args.resume:
@@ -88,75 +141,146 @@ def train(args):
     use_parallel = args.workers > 1
 
     mode_str = f"{args.workers} workers" if use_parallel else "sequential"
+    if args.actor_learner:
+        mode_str += f", actor-learner, max staleness {args.max_staleness}"
     print(f"Training for {args.num_iterations} iterations, {args.games_per_iteration} games each ({mode_str})")
     print(f"Metrics will be saved to {metrics_path}\n")
 
     pool = None
     if use_parallel:
-        from concurrent.futures import ProcessPoolExecutor
+        from src.rl.worker_pool import PolicyWorkerPool
+
+        pool = PolicyWorkerPool(workers=args.workers)
+
+    actors = None
+    if args.actor_learner:
+        from src.rl.actor_learner import ActorLearner
+
+        # Two chunks per worker in flight make up about one iteration of games
+        actors = ActorLearner(
+            policy,
+            pool,
+            num_turns=args.num_turns,
+            backend=args.backend,
+            games_per_chunk=max(1, args.games_per_iteration // (2 * args.workers)),
+            max_staleness=args.max_staleness,
+        )
 
-        pool = ProcessPoolExecutor(max_workers=args.workers)
+    timer = PhaseTimer()
+    timing_path = _init_timing_file(args.output_dir, overwrite=not args.resume) if args.timing else None
+    if timing_path is not None:
+        print(f"Per-phase timing will be saved to {timing_path}\n")
 
     try:
         for iteration in range(start_iteration + 1, start_iteration + args.num_iterations + 1):
+            timer.reset()
+            profiler = None
+            if iteration == args.profile_iteration:
+                profiler = cProfile.Profile()
+                profiler.enable()
+
             # Collect experience via self-play
-            if pool is not None:
-                action_exps, sub_exps, stats = SelfPlayRunner.collect_experience_parallel(
-                    policy,
-                    num_games=args.games_per_iteration,
-                    num_turns=args.num_turns,
-                    pool=pool,
-                    workers=args.workers,
-                )
-            else:
-                action_exps, sub_exps, stats = runner.collect_experience(
-                    policy, num_games=args.games_per_iteration, num_turns=args.num_turns
-                )
+            with timer.phase("self_play"):
+                if actors is not None:
+                    experiences, stats = actors.next_batch(args.games_per_iteration)
+                elif pool is not None:
+                    experiences, stats = SelfPlayRunner.collect_experience_parallel(
+                        policy,
+                        num_games=args.games_per_iteration,
+                        num_turns=args.num_turns,
+                        pool=pool,
+                        workers=args.workers,
+                        backend=args.backend,
+                    )
+                else:
+                    experiences, stats = runner.collect_experience(
+                        policy, num_games=args.games_per_iteration, num_turns=args.num_turns, backend=args.backend
+                    )
 
             # Train on collected experience
-            train_batch(policy, action_exps, sub_exps, learning_rate=args.learning_rate)
+            with timer.phase("train"):
+                train_buffer(policy, experiences, learning_rate=args.learning_rate)
 
             # Evaluate against random baseline
-            if pool is not None:
-                eval_results = evaluate_parallel(
-                    policy,
-                    num_games=args.eval_games,
-                    num_turns=args.num_turns,
-                    pool=pool,
-                    workers=args.workers,
-                )
-            else:
-                eval_results = evaluate(policy, baseline, num_games=args.eval_games, num_turns=args.num_turns)
+            with timer.phase("eval"):
+                if args.eval_sequential:
+                    eval_results = evaluate_sequential(
+                        policy,
+                        baseline,
+                        max_games=args.eval_games,
+                        batch_size=args.eval_batch_size,
+                        num_turns=args.num_turns,
+                        backend=args.backend,
+                        pool=pool,
+                        workers=args.workers,
+                        paired=args.eval_paired,
+                    )
+                elif pool is not None:
+                    eval_results = evaluate_parallel(
+                        policy,
+                        num_games=args.eval_games,
+                        num_turns=args.num_turns,
+                        pool=pool,
+                        workers=args.workers,
+                        backend=args.backend,
+                        paired=args.eval_paired,
+                    )
+                else:
+                    eval_results = evaluate(
+                        policy,
+                        baseline,
+                        num_games=args.eval_games,
+                        num_turns=args.num_turns,
+                        backend=args.backend,
+                        paired=args.eval_paired,
+                    )
 
             # Log metrics
-            _append_metrics(
-                metrics_path,
-                {
-                    "iteration": iteration,
-                    "self_play_wins": stats["wins"],
-                    "self_play_losses": stats["losses"],
-                    "self_play_ties": stats["ties"],
-                    "self_play_mean_reward": f"{stats['mean_reward']:.3f}",
-                    "eval_win_rate": f"{eval_results['win_rate']:.3f}",
-                    "eval_tie_rate": f"{eval_results['tie_rate']:.3f}",
-                    "eval_mean_score": f"{eval_results['mean_score']:.1f}",
-                    "eval_mean_opponent_score": f"{eval_results['mean_opponent_score']:.1f}",
-                    "eval_mean_score_diff": f"{eval_results['mean_score_diff']:.1f}",
-                },
-            )
-
-            print(
-                f"Iter {iteration:3d} | "
-                f"Self-play: {stats['wins']}W/{stats['losses']}L/{stats['ties']}T | "
-                f"vs Random: {eval_results['win_rate']:.0%} win, "
-                f"score diff {eval_results['mean_score_diff']:+.1f}"
-            )
+            with timer.phase("log"):
+                _append_metrics(
+                    metrics_path,
+                    {
+                        "iteration": iteration,
+                        "self_play_wins": stats["wins"],
+                        "self_play_losses": stats["losses"],
+                        "self_play_ties": stats["ties"],
+                        "self_play_mean_reward": f"{stats['mean_reward']:.3f}",
+                        "eval_win_rate": f"{eval_results['win_rate']:.3f}",
+                        "eval_tie_rate": f"{eval_results['tie_rate']:.3f}",
+                        "eval_mean_score": f"{eval_results['mean_score']:.1f}",
+                        "eval_mean_opponent_score": f"{eval_results['mean_opponent_score']:.1f}",
+                        "eval_mean_score_diff": f"{eval_results['mean_score_diff']:.1f}",
+                    },
+                )
+
+                print(
+                    f"Iter {iteration:3d} | "
+                    f"Self-play: {stats['wins']}W/{stats['losses']}L/{stats['ties']}T | "
+                    f"vs Random: {eval_results['win_rate']:.0%} win "
+                    f"[{eval_results['win_rate_ci'][0]:.0%}, {eval_results['win_rate_ci'][1]:.0%}], "
+                    f"score diff {eval_results['mean_score_diff']:+.1f} "
+                    f"({eval_results['num_games']} games)"
+                )
 
             # Save checkpoint
-            if iteration % args.save_every == 0 or iteration == args.num_iterations:
-                path = os.path.join(args.output_dir, f"policy_iter_{iteration}.npz")
-                policy.save(path)
+            with timer.phase("checkpoint"):
+                if iteration % args.save_every == 0 or iteration == args.num_iterations:
+                    path = os.path.join(args.output_dir, f"policy_iter_{iteration}.npz")
+                    policy.save(path)
+
+            if profiler is not None:
+                profiler.disable()
+                profile_path = os.path.join(args.output_dir, f"profile_iter_{iteration}.pstats")
+                profiler.dump_stats(profile_path)
+                print(f"Profile of iteration {iteration} saved to {profile_path} (inspect with python -m pstats)")
+
+            if timing_path is not None:
+                games = stats["wins"] + stats["losses"] + stats["ties"]
+                _append_timing(timing_path, _timing_row(iteration, timer, games, len(experiences), args.workers))
     finally:
+        if actors is not None:
+            actors.close()
+            print(f"Actor-learner: {actors.games_played} games used, {actors.games_dropped} dropped as stale")
         if pool is not None:
             pool.shutdown(wait=True, cancel_futures=True)
 
@@ -177,18 +301,69 @@ def eval_policy(args):
     elif args.opponent == "mcts":
         from src.rl.policy import MCTSPolicy
 
-        opponent = MCTSPolicy(num_simulations=args.num_simulations)
+        opponent = MCTSPolicy(num_simulations=args.num_simulations, workers=args.mcts_workers)
         opponent_name = f"MCTS ({args.num_simulations} sims)"
 
     print(f"Evaluating {args.policy_path} vs {opponent_name} over {args.eval_games} games\n")
 
-    results = evaluate(policy, opponent, num_games=args.eval_games, num_turns=args.num_turns)
+    results = evaluate(policy, opponent, num_games=args.eval_games, num_turns=args.num_turns, paired=args.paired)
+    if args.opponent == "mcts":
+        opponent.close()
 
-    print(f"Win rate:        {results['win_rate']:.1%}")
+    win_low, win_high = results["win_rate_ci"]
+    diff_low, diff_high = results["mean_score_diff_ci"]
+    print(f"Win rate:        {results['win_rate']:.1%} (95% CI {win_low:.1%} to {win_high:.1%})")
     print(f"Tie rate:        {results['tie_rate']:.1%}")
     print(f"Mean score:      {results['mean_score']:.1f}")
     print(f"Mean opp score:  {results['mean_opponent_score']:.1f}")
-    print(f"Mean score diff: {results['mean_score_diff']:+.1f}")
+    print(f"Mean score diff: {results['mean_score_diff']:+.1f} (95% CI {diff_low:+.1f} to {diff_high:+.1f})")
+    if args.paired:
+        pair_low, pair_high = results["pair_score_ci"]
+        print(
+            f"Pair score:      {results['pair_score']:.1%} over {results['num_pairs']} deals "
+            f"(95% CI {pair_low:.1%} to {pair_high:.1%})"
+        )
+
+
+def run_bench(args):
+    """Measure engine, featurizer, trainer and MCTS throughput and compare it with the stored baseline."""
+    from benchmarks.suite import BENCHMARKS, DEFAULT_BASELINE_PATH, compare, load_results, run_benchmarks, save_results
+
+    unknown = [name for name in args.only or [] if name not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmarks: {', '.join(unknown)}. Choose from: {', '.join(BENCHMARKS)}")
+        return
+    baseline_path = args.baseline or DEFAULT_BASELINE_PATH
+
+    def report(name, result):
+        print(f"{name:<24} {result['value']:>14,.1f} {result['unit']}")
+
+    print(f"Running benchmarks ({'quick' if args.quick else 'full'}, best of {args.repeat})\n")
+    results = run_benchmarks(args.only, seed=args.seed, quick=args.quick, repeat=args.repeat, progress=report)
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults saved to {args.output}")
+    if args.save_baseline:
+        save_results(results, baseline_path)
+        print(f"\nBaseline saved to {baseline_path}")
+        return
+    if not os.path.exists(baseline_path):
+        print(f"\nNo baseline at {baseline_path}. Use --save_baseline to store one.")
+        return
+
+    baseline = load_results(baseline_path)
+    if baseline["config"]["quick"] != results["config"]["quick"]:
+        print("\nWarning: the baseline was measured with a different --quick setting.")
+    rows = compare(results, baseline, threshold=args.threshold)
+    print(f"\nAgainst {baseline_path} (commit {baseline['environment']['git_commit'] or 'unknown'}):")
+    for row in rows:
+        flag = "  REGRESSION" if row["regressed"] else ""
+        print(f"{row['name']:<24} {row['baseline']:>14,.1f} -> {row['value']:>14,.1f} ({row['change']:+.1%}){flag}")
+    regressed = [row["name"] for row in rows if row["regressed"]]
+    if regressed:
+        print(f"\n{len(regressed)} benchmark(s) more than {args.threshold:.0%} slower than the baseline")
+        sys.exit(1)
 
 
 def plot_metrics(args):
@@ -568,7 +743,7 @@ if __name__ == "__main__":
     def _positive_int(value):
         ivalue = int(value)
         if ivalue < 1:
-            raise argparse.ArgumentTypeError(f"--workers must be >= 1, got {value}")
+            raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
         return ivalue
 
     train_parser.add_argument(
@@ -577,6 +752,54 @@ if __name__ == "__main__":
         default=1,
         help="Parallel workers for self-play and eval (default: 1)",
     )
+    train_parser.add_argument(
+        "--backend",
+        type=str,
+        default="object",
+        choices=["object", "batch"],
+        help="Game engine for self-play and eval: one game at a time or all games in lockstep (default: object)",
+    )
+    train_parser.add_argument(
+        "--eval_sequential",
+        action="store_true",
+        help="Stop each evaluation early once an SPRT decides the win rate vs 50%% (--eval_games becomes the cap)",
+    )
+    train_parser.add_argument(
+        "--eval_batch_size",
+        type=_positive_int,
+        default=10,
+        help="With --eval_sequential, games played between SPRT checks (default: 10)",
+    )
+    train_parser.add_argument(
+        "--eval_paired",
+        action="store_true",
+        help="Play each evaluation deal twice with seats swapped (--eval_games and --eval_batch_size must be even)",
+    )
+    train_parser.add_argument(
+        "--actor_learner",
+        action="store_true",
+        help="Keep self-play actors running while the learner trains and evaluates (needs --workers >= 2)",
+    )
+    train_parser.add_argument(
+        "--max_staleness",
+        type=int,
+        default=1,
+        help="With --actor_learner, drop experience more than this many weight updates old (default: 1)",
+    )
+    train_parser.add_argument(
+        "--timing",
+        action="store_true",
+        help=(
+            "Record per-phase wall time and self-play games/decisions per second in training_timing.csv "
+            "(with --actor_learner, self-play time is the wait for fresh experience)"
+        ),
+    )
+    train_parser.add_argument(
+        "--profile_iteration",
+        type=int,
+        default=None,
+        help="Save a cProfile of this iteration (main process only) to profile_iter_N.pstats in output_dir",
+    )
     resume_group = train_parser.add_mutually_exclusive_group(required=True)
     resume_group.add_argument("--resume", action="store_true", help="Resume from policy_latest.npz in output_dir")
     resume_group.add_argument("--fresh", action="store_true", help="Start training from scratch")
@@ -586,7 +809,13 @@ if __name__ == "__main__":
     eval_parser.add_argument("--policy_path", type=str, required=True)
     eval_parser.add_argument("--opponent", type=str, default="random", choices=["random", "mcts"])
     eval_parser.add_argument("--num_simulations", type=int, default=100, help="MCTS simulations (if opponent=mcts)")
+    eval_parser.add_argument(
+        "--mcts_workers", type=int, default=1, help="Worker processes for MCTS root-parallel search (if opponent=mcts)"
+    )
     eval_parser.add_argument("--eval_games", type=int, default=100)
+    eval_parser.add_argument(
+        "--paired", action="store_true", help="Play each deal twice with seats swapped (--eval_games must be even)"
+    )
     eval_parser.add_argument("--num_turns", type=int, default=10)
 
     # Plot subcommand
@@ -629,6 +858,23 @@ if __name__ == "__main__":
     )
     interpret_parser.add_argument("--save", action="store_true", help="Save plots to files")
 
+    # Bench subcommand
+    bench_parser = subparsers.add_parser("bench", help="Run the throughput benchmarks against the stored baseline")
+    bench_parser.add_argument("--only", nargs="+", default=None, help="Benchmarks to run (default: all)")
+    bench_parser.add_argument("--quick", action="store_true", help="Small workloads, for a fast smoke run")
+    bench_parser.add_argument("--repeat", type=_positive_int, default=5, help="Timed runs per benchmark; best is kept")
+    bench_parser.add_argument("--seed", type=int, default=0, help="Seed for the benchmark inputs (default: 0)")
+    bench_parser.add_argument("--output", type=str, default=None, help="Write the results as JSON to this path")
+    bench_parser.add_argument(
+        "--baseline", type=str, default=None, help="Baseline JSON to compare with (default: benchmarks/baseline.json)"
+    )
+    bench_parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Relative slowdown that counts as a regression (default: 0.25)"
+    )
+    bench_parser.add_argument(
+        "--save_baseline", action="store_true", help="Store this run as the baseline instead of comparing"
+    )
+
     # Report subcommand
     report_parser = subparsers.add_parser("report", help="Generate a Jupyter notebook analyzing a policy")
     report_parser.add_argument(
@@ -649,6 +895,8 @@ if __name__ == "__main__":
         plot_metrics(args)
     elif args.command == "interpret":
         interpret_policy(args)
+    elif args.command == "bench":
+        run_bench(args)
     elif args.command == "report":
         from src.rl.report import generate_report
 
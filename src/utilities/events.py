@@ -0,0 +1,31 @@
+"""Game event sinks.
+
+Entities report what happened (a bird drawn from the deck, an empty deck)
+by calling event_sink.emit(event, **details) instead of printing. The base
+EventSink discards everything, so headless games and playouts neither format
+messages nor touch sys.stdout; PrintEventSink renders them for humans.
+"""
+
+DREW_FROM_DECK = "drew_from_deck"
+DECK_EMPTY = "deck_empty"
+
+
+class EventSink:
+    """Receives game events and ignores them."""
+
+    def emit(self, event, **details):
+        pass
+
+
+class PrintEventSink(EventSink):
+    """Prints a one-line message per event to stdout."""
+
+    def emit(self, event, **details):
+        if event == DREW_FROM_DECK:
+            print(f"You drew {details['bird'].get_name()} from the deck.")
+        elif event == DECK_EMPTY:
+            print(f"Error: {details['error']}")
+
+
+# Shared default for entities without their own sink
+NULL_SINK = EventSink()
@@ -7,8 +7,8 @@ def create_human_player(*args, **kwargs):
     return HumanPlayer(*args, **kwargs)
 
 
-def create_bot_player(*args, policy=None, **kwargs):
-    """Create a BotPlayer with the given policy (defaults to RandomPolicy)."""
+def create_bot_player(*args, policy=None, rng=None, **kwargs):
+    """Create a BotPlayer with the given policy (defaults to a RandomPolicy drawing from rng)."""
     if policy is None:
-        policy = RandomPolicy()
+        policy = RandomPolicy(rng=rng)
     return BotPlayer(policy=policy, *args, **kwargs)
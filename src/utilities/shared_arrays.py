@@ -0,0 +1,107 @@
+"""Hand NumPy arrays from worker processes to the parent through shared memory.
+
+A worker packs named arrays into one multiprocessing.shared_memory segment
+with export_arrays and returns the small SharedArrays descriptor instead of
+the data. The parent maps the segment with attach_arrays, reads the arrays
+in place and frees the segment when the block exits. The worker gives up
+ownership on export, so the segment lives until the parent attaches: code
+that receives descriptors must release every one it does not read, even
+when something fails (see map_exported and release_all).
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+# Array starts are aligned to this many bytes within a segment
+_ALIGNMENT = 64
+
+# name: shared memory segment name; layout: tuple of (key, dtype str, shape, byte offset)
+SharedArrays = namedtuple("SharedArrays", ["name", "layout"])
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def export_arrays(arrays):
+    """Copy a dict of arrays into a new shared memory segment and return its SharedArrays descriptor.
+
+    The segment must be released by attach_arrays in some process; this
+    process keeps no handle to it.
+    """
+    layout = []
+    offset = 0
+    for key, array in arrays.items():
+        array = np.asarray(array)
+        offset = _aligned(offset)
+        layout.append((key, array.dtype.str, array.shape, offset))
+        offset += array.nbytes
+
+    shm = SharedMemory(create=True, size=max(offset, 1))
+    try:
+        for (key, dtype, shape, start), array in zip(layout, arrays.values()):
+            np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=start)[...] = array
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    # Ownership passes to the attaching process, which unlinks the segment
+    resource_tracker.unregister(shm._name, "shared_memory")
+    shm.close()
+    return SharedArrays(name=shm.name, layout=tuple(layout))
+
+
+@contextmanager
+def attach_arrays(descriptor):
+    """Map the arrays of an exported segment zero-copy, then free the segment on exit.
+
+    Yields a dict of arrays that view the shared memory; they are emptied
+    when the block exits, so copy anything needed afterwards.
+    """
+    shm = SharedMemory(name=descriptor.name)
+    arrays = {
+        key: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+        for key, dtype, shape, offset in descriptor.layout
+    }
+    try:
+        yield arrays
+    finally:
+        arrays.clear()
+        shm.close()
+        shm.unlink()
+
+
+def release_arrays(descriptor):
+    """Free an exported segment without reading it."""
+    with attach_arrays(descriptor):
+        pass
+
+
+def release_all(descriptors):
+    """Free every segment in descriptors without reading them."""
+    for descriptor in descriptors:
+        release_arrays(descriptor)
+
+
+def map_exported(pool, fn, tasks, descriptor):
+    """Return [fn(task) for task in tasks] run on pool, for results that carry exported segments.
+
+    descriptor(result) returns the SharedArrays descriptor in a result. If
+    any task fails, the queued tasks are cancelled and the segments of all
+    those that finished are released before the exception propagates, since
+    no other process would ever free them.
+    """
+    futures = [pool.submit(fn, task) for task in tasks]
+    try:
+        return [future.result() for future in futures]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        for future in futures:
+            if not future.cancelled() and future.exception() is None:
+                release_arrays(descriptor(future.result()))
+        raise
@@ -0,0 +1,30 @@
+"""Wall-clock timing of named phases, e.g. the stages of a training iteration."""
+
+import time
+from contextlib import contextmanager
+
+
+class PhaseTimer:
+    """Accumulates wall time per named phase.
+
+    Time a block with `with timer.phase("train"): ...`; a phase entered more
+    than once adds up. seconds maps phase names to totals in the order they
+    were first entered.
+    """
+
+    def __init__(self):
+        self.seconds = {}
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - start
+
+    def total(self):
+        return sum(self.seconds.values())
+
+    def reset(self):
+        self.seconds = {}
@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.suite import BENCHMARKS, compare, load_results, run_benchmarks, save_results
+
+
+def _results(values, higher_is_better=True):
+    return {
+        "benchmarks": {
+            name: {"value": value, "unit": "x", "higher_is_better": higher_is_better} for name, value in values.items()
+        }
+    }
+
+
+class TestRunBenchmarks(unittest.TestCase):
+    def test_every_benchmark_runs(self):
+        results = run_benchmarks(quick=True, repeat=1)
+        self.assertEqual(list(results["benchmarks"]), list(BENCHMARKS))
+        for name, result in results["benchmarks"].items():
+            self.assertGreater(result["value"], 0, name)
+            self.assertGreater(result["work"], 0, name)
+            self.assertEqual(result["unit"], BENCHMARKS[name].unit)
+        self.assertEqual(results["config"], {"seed": 0, "quick": True, "repeat": 1})
+        self.assertIn("numpy", results["environment"])
+        json.dumps(results)
+
+    def test_selected_benchmarks_only(self):
+        results = run_benchmarks(["featurize"], quick=True, repeat=2)
+        self.assertEqual(list(results["benchmarks"]), ["featurize"])
+        self.assertEqual(len(results["benchmarks"]["featurize"]["seconds"]), 2)
+
+    def test_unknown_benchmark(self):
+        with self.assertRaises(ValueError):
+            run_benchmarks(["nope"])
+
+    def test_save_and_load(self):
+        results = _results({"a": 1.5})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "results.json")
+            save_results(results, path)
+            self.assertEqual(load_results(path), results)
+
+
+class TestCompare(unittest.TestCase):
+    def test_throughput_regression(self):
+        rows = compare(_results({"a": 70.0, "b": 95.0}), _results({"a": 100.0, "b": 100.0}), threshold=0.2)
+        self.assertEqual([row["regressed"] for row in rows], [True, False])
+        self.assertAlmostEqual(rows[0]["change"], -0.3)
+
+    def test_latency_regression(self):
+        # Higher latency is slower: 150us against 100us is a third slower
+        rows = compare(_results({"a": 150.0}, False), _results({"a": 100.0}, False), threshold=0.2)
+        self.assertTrue(rows[0]["regressed"])
+        self.assertAlmostEqual(rows[0]["change"], 100 / 150 - 1)
+
+    def test_speedup_is_not_a_regression(self):
+        rows = compare(_results({"a": 200.0}), _results({"a": 100.0}))
+        self.assertFalse(rows[0]["regressed"])
+        self.assertAlmostEqual(rows[0]["change"], 1.0)
+
+    def test_skips_benchmarks_missing_from_baseline(self):
+        rows = compare(_results({"a": 1.0, "new": 1.0}), _results({"a": 1.0}))
+        self.assertEqual([row["name"] for row in rows], ["a"])
+
+    def test_invalid_threshold(self):
+        with self.assertRaises(ValueError):
+            compare(_results({}), _results({}), threshold=1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
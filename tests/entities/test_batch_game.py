@@ -0,0 +1,138 @@
+import unittest
+
+import numpy as np
+
+from src.entities.batch_game import BatchGameEngine
+from src.entities.compact_game import (
+    BIRD_COSTS,
+    BIRD_POINTS,
+    CHOOSE_A_BIRD_TO_DRAW_PHASE,
+    CHOOSE_A_BIRD_TO_PLAY_PHASE,
+    CHOOSE_ACTION_PHASE,
+    DECK,
+    DRAW_A_BIRD,
+    EMPTY_SLOT,
+    GAIN_FOOD,
+    NUM_BIRDS,
+    PLAY_A_BIRD,
+    TRAY_CAPACITY,
+    CompactGame,
+)
+
+
+class TestBatchGameSetup(unittest.TestCase):
+    def setUp(self):
+        self.engine = BatchGameEngine(4, num_players=2, num_turns=5, num_starting_cards=3, rng=np.random.default_rng(0))
+
+    def test_hands_dealt(self):
+        self.assertTrue(np.all(self.engine.hand.sum(axis=2) == 3))
+
+    def test_starting_food(self):
+        self.assertTrue(np.all(self.engine.food == 2))
+
+    def test_tray_filled(self):
+        self.assertTrue(np.all(self.engine.tray != EMPTY_SLOT))
+
+    def test_deck_count(self):
+        self.assertEqual(self.engine.deck_count().tolist(), [NUM_BIRDS - 2 * 3 - 3] * 4)
+
+    def test_decks_are_independent_permutations(self):
+        for g in range(4):
+            self.assertEqual(sorted(self.engine.deck[g].tolist()), list(range(NUM_BIRDS)))
+        self.assertFalse(np.array_equal(self.engine.deck[0], self.engine.deck[1]))
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            BatchGameEngine(0)
+        with self.assertRaises(ValueError):
+            BatchGameEngine(2, num_turns=0)
+
+    def test_given_decks_deal_identically(self):
+        decks = np.repeat(BatchGameEngine.shuffled_decks(2, np.random.default_rng(1)), 2, axis=0)
+        engine = BatchGameEngine(4, num_players=2, decks=decks)
+        np.testing.assert_array_equal(engine.deck, decks)
+        np.testing.assert_array_equal(engine.hand[0], engine.hand[1])
+        np.testing.assert_array_equal(engine.tray[2], engine.tray[3])
+        self.assertFalse(np.array_equal(engine.hand[0], engine.hand[2]))
+        with self.assertRaises(ValueError):
+            BatchGameEngine(3, decks=decks)
+
+
+class TestBatchGameActions(unittest.TestCase):
+    def setUp(self):
+        self.engine = BatchGameEngine(3, num_players=2, num_turns=5, num_starting_cards=2, rng=np.random.default_rng(1))
+        self.games = np.arange(3)
+
+    def test_gain_food_ends_turn(self):
+        self.engine.apply_choose_action(self.games, np.full(3, GAIN_FOOD))
+        self.assertTrue(np.all(self.engine.food[:, 0] == 4))
+        self.assertTrue(np.all(self.engine.bird_feeder == 4))
+        self.assertTrue(np.all(self.engine.current_player() == 1))
+        self.assertTrue(np.all(self.engine.turns_remaining[:, 0] == 4))
+
+    def test_mixed_actions_in_one_step(self):
+        self.engine.apply_choose_action(self.games, np.array([PLAY_A_BIRD, GAIN_FOOD, DRAW_A_BIRD]))
+        self.assertEqual(
+            self.engine.phase.tolist(),
+            [CHOOSE_A_BIRD_TO_PLAY_PHASE, CHOOSE_ACTION_PHASE, CHOOSE_A_BIRD_TO_DRAW_PHASE],
+        )
+        self.assertEqual(self.engine.game_turn.tolist(), [0, 1, 0])
+
+    def test_play_a_bird(self):
+        bird_ids = np.array([np.flatnonzero(m)[0] for m in self.engine.playable_mask(self.games)])
+        self.engine.apply_choose_action(self.games, np.full(3, PLAY_A_BIRD))
+        self.engine.apply_play(self.games, bird_ids)
+        self.assertTrue(np.all(self.engine.board[self.games, 0, bird_ids]))
+        self.assertFalse(np.any(self.engine.hand[self.games, 0, bird_ids]))
+        self.assertEqual(self.engine.food[:, 0].tolist(), (3 - BIRD_COSTS[bird_ids]).tolist())
+        self.assertEqual(self.engine.scores[:, 0].tolist(), BIRD_POINTS[bird_ids].tolist())
+
+    def test_draw_from_tray_and_deck(self):
+        tray_bird = self.engine.tray[0, 1]
+        deck_top = self.engine.deck[1, self.engine.deck_top[1]]
+        self.engine.apply_choose_action(self.games[:2], np.full(2, DRAW_A_BIRD))
+        self.engine.apply_draw(self.games[:2], np.array([1, TRAY_CAPACITY]))
+        self.assertTrue(self.engine.hand[0, 0, tray_bird])
+        self.assertTrue(self.engine.hand[1, 0, deck_top])
+        self.assertTrue(np.all(self.engine.tray[:2] != EMPTY_SLOT))
+
+    def test_draw_mask_excludes_empty_slots(self):
+        self.engine.tray[0, :] = EMPTY_SLOT
+        self.engine.deck_top[0] = self.engine.deck_size[0]
+        self.assertEqual(self.engine.draw_mask(self.games)[0].tolist(), [False] * (TRAY_CAPACITY + 1))
+        self.assertFalse(self.engine.action_mask(self.games)[0, DRAW_A_BIRD])
+
+
+class TestBatchGameMatchesCompactGame(unittest.TestCase):
+    """Advance stacked CompactGames through the batch engine and their own engine with the same decisions."""
+
+    def test_same_states_and_scores(self):
+        rng = np.random.default_rng(2)
+        compact = [CompactGame.new(num_players=2, num_turns=6, rng=rng) for _ in range(5)]
+        engine = BatchGameEngine.from_compact_games([g.copy() for g in compact])
+
+        while not engine.is_game_over().all():
+            for g, game in enumerate(compact):
+                if game.is_game_over():
+                    continue
+                games = np.array([g])
+                action = rng.choice(game.legal_actions())
+                if game.phase == CHOOSE_ACTION_PHASE:
+                    engine.apply_choose_action(games, np.array([action]))
+                elif game.phase == CHOOSE_A_BIRD_TO_PLAY_PHASE:
+                    engine.apply_play(games, np.array([action]))
+                else:
+                    slot = TRAY_CAPACITY if action == DECK else int(np.flatnonzero(game.tray == action)[0])
+                    engine.apply_draw(games, np.array([slot]))
+                game.apply_action(action)
+
+                self.assertEqual(engine.phase[g], game.phase)
+                self.assertTrue(np.array_equal(engine.hand[g], game.hand))
+                self.assertTrue(np.array_equal(engine.tray[g], game.tray))
+                self.assertEqual(engine.food[g].tolist(), game.food.tolist())
+
+        self.assertEqual(engine.scores.tolist(), [g.get_scores() for g in compact])
+
+
+if __name__ == "__main__":
+    unittest.main()
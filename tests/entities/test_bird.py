@@ -1,6 +1,9 @@
+import copy
+import pickle
 import unittest
 
-from src.entities.bird import Bird
+from data.bird_list import birds as bird_pool
+from src.entities.bird import Bird, affordable_mask, bird_mask, get_bird
 
 
 class TestBird(unittest.TestCase):
@@ -30,6 +33,40 @@ class TestBird(unittest.TestCase):
         Bird("Osprey", 5, 2)
         # Add test for activation behavior here
 
+    def test_immutable(self):
+        bird = Bird("Osprey", 5, 2)
+        with self.assertRaises(AttributeError):
+            bird.points = 6
+        with self.assertRaises(AttributeError):
+            bird.nickname = "Fish Hawk"
+
+    def test_bird_outside_pool_has_no_id(self):
+        bird = Bird("Osprey", 5, 2)
+        self.assertIsNone(bird.get_id())
+        self.assertEqual(pickle.loads(pickle.dumps(bird)).to_representation(), (5, 2))
+
+
+class TestBirdPool(unittest.TestCase):
+    def test_ids_are_list_positions(self):
+        for i, bird in enumerate(bird_pool):
+            self.assertEqual(bird.get_id(), i)
+            self.assertIs(get_bird(i), bird)
+
+    def test_pool_birds_stay_interned(self):
+        bird = bird_pool[7]
+        self.assertIs(pickle.loads(pickle.dumps(bird)), bird)
+        self.assertIs(copy.deepcopy(bird), bird)
+
+    def test_bird_mask(self):
+        self.assertEqual(bird_mask([bird_pool[0], bird_pool[5]]), 0b100001)
+        self.assertEqual(bird_mask([]), 0)
+        self.assertIsNone(bird_mask([bird_pool[0], Bird("Test", 1, 1)]))
+
+    def test_affordable_mask_matches_food_costs(self):
+        for food in range(-1, 8):
+            expected = bird_mask(b for b in bird_pool if b.get_food_cost() <= food)
+            self.assertEqual(affordable_mask(food), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
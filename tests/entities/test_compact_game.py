@@ -0,0 +1,178 @@
+import unittest
+
+import numpy as np
+
+from src.entities.compact_game import (
+    BIRD_COSTS,
+    BIRD_NAME_TO_ID,
+    BIRD_NAMES,
+    BIRD_POINTS,
+    BOARD_CAPACITY,
+    CHOOSE_A_BIRD_TO_DRAW_PHASE,
+    CHOOSE_A_BIRD_TO_PLAY_PHASE,
+    CHOOSE_ACTION_PHASE,
+    DECK,
+    DRAW_A_BIRD,
+    EMPTY_SLOT,
+    GAIN_FOOD,
+    NUM_BIRDS,
+    PLAY_A_BIRD,
+    CompactGame,
+)
+from src.entities.game_state import MCTSGameState
+from src.game import WingspanGame
+from src.rl.policy import MCTSPolicy
+
+
+class TestCompactGameSetup(unittest.TestCase):
+    def setUp(self):
+        self.game = CompactGame.new(num_players=2, num_turns=5, num_starting_cards=3, rng=np.random.default_rng(0))
+
+    def test_hands_dealt(self):
+        self.assertEqual(self.game.hand.sum(axis=1).tolist(), [3, 3])
+
+    def test_starting_food(self):
+        self.assertEqual(self.game.food.tolist(), [2, 2])
+
+    def test_tray_filled(self):
+        self.assertEqual(len(self.game.get_tray_birds()), 3)
+
+    def test_deck_count(self):
+        self.assertEqual(self.game.get_deck_count(), NUM_BIRDS - 2 * 3 - 3)
+
+    def test_every_bird_in_exactly_one_place(self):
+        remaining = self.game.deck[self.game.deck_top :]
+        dealt = np.concatenate([self.game.get_hand_birds(0), self.game.get_hand_birds(1), self.game.get_tray_birds()])
+        self.assertEqual(sorted(np.concatenate([remaining, dealt]).tolist()), list(range(NUM_BIRDS)))
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            CompactGame.new(num_players=0)
+        with self.assertRaises(ValueError):
+            CompactGame.new(num_turns=0)
+        with self.assertRaises(ValueError):
+            CompactGame.new(num_starting_cards=-1)
+
+
+class TestCompactGameActions(unittest.TestCase):
+    def setUp(self):
+        self.game = CompactGame.new(num_players=2, num_turns=5, num_starting_cards=2, rng=np.random.default_rng(1))
+
+    def test_gain_food_ends_turn(self):
+        self.game.apply_action(GAIN_FOOD)
+        self.assertEqual(self.game.food[0], 4)
+        self.assertEqual(self.game.bird_feeder, 4)
+        self.assertEqual(self.game.get_current_player(), 1)
+        self.assertEqual(self.game.turns_remaining.tolist(), [4, 5])
+
+    def test_feeder_rerolls_when_empty(self):
+        self.game.bird_feeder = 1
+        self.game.apply_action(GAIN_FOOD)
+        self.assertEqual(self.game.bird_feeder, 5)
+
+    def test_play_a_bird(self):
+        self.game.apply_action(PLAY_A_BIRD)
+        self.assertEqual(self.game.phase, CHOOSE_A_BIRD_TO_PLAY_PHASE)
+        bird_id = self.game.legal_actions()[0]
+        self.game.apply_action(bird_id)
+        self.assertTrue(self.game.board[0, bird_id])
+        self.assertFalse(self.game.hand[0, bird_id])
+        self.assertEqual(self.game.food[0], 3 - BIRD_COSTS[bird_id])
+        self.assertEqual(self.game.scores[0], BIRD_POINTS[bird_id])
+        self.assertEqual(self.game.phase, CHOOSE_ACTION_PHASE)
+
+    def test_draw_from_tray_refills(self):
+        self.game.apply_action(DRAW_A_BIRD)
+        self.assertEqual(self.game.phase, CHOOSE_A_BIRD_TO_DRAW_PHASE)
+        bird_id = self.game.get_tray_birds()[0]
+        deck_count = self.game.get_deck_count()
+        self.game.apply_action(bird_id)
+        self.assertTrue(self.game.hand[0, bird_id])
+        self.assertNotIn(bird_id, self.game.get_tray_birds())
+        self.assertEqual(len(self.game.get_tray_birds()), 3)
+        self.assertEqual(self.game.get_deck_count(), deck_count - 1)
+
+    def test_draw_from_deck(self):
+        top = self.game.deck[self.game.deck_top]
+        self.game.apply_action(DRAW_A_BIRD)
+        self.game.apply_action(DECK)
+        self.assertTrue(self.game.hand[0, top])
+
+    def test_draw_choices_include_deck(self):
+        self.game.apply_action(DRAW_A_BIRD)
+        self.assertIn(DECK, self.game.legal_actions())
+
+    def test_cannot_play_unaffordable_bird(self):
+        self.game.food[0] = 0
+        expensive = [i for i in self.game.get_hand_birds(0) if BIRD_COSTS[i] > 0]
+        if expensive:
+            self.game.phase = CHOOSE_A_BIRD_TO_PLAY_PHASE
+            with self.assertRaises(ValueError):
+                self.game.apply_action(expensive[0])
+
+    def test_full_board_blocks_play(self):
+        self.game.board_count[0] = BOARD_CAPACITY
+        self.assertNotIn(PLAY_A_BIRD, self.game.legal_actions())
+
+    def test_copy_is_independent(self):
+        clone = self.game.copy()
+        clone.apply_action(GAIN_FOOD)
+        self.assertEqual(self.game.game_turn, 0)
+        self.assertEqual(self.game.food[0], 3)
+
+    def test_rollout_finishes_game(self):
+        scores = self.game.rollout(rng=np.random.default_rng(2))
+        self.assertTrue(self.game.is_game_over())
+        self.assertEqual(len(scores), 2)
+        self.assertTrue(all(t == 0 for t in self.game.turns_remaining))
+        self.assertLessEqual(self.game.board_count.max(), BOARD_CAPACITY)
+
+    def test_empty_tray_slot_is_not_drawable(self):
+        self.game.tray[:] = EMPTY_SLOT
+        self.game.phase = CHOOSE_A_BIRD_TO_DRAW_PHASE
+        self.assertEqual(self.game.legal_actions(), [DECK])
+
+
+class TestCompactGameMatchesObjectEngine(unittest.TestCase):
+    """Play the object engine and the compact engine side by side with the same decisions."""
+
+    def _to_name(self, action, phase):
+        if phase == CHOOSE_ACTION_PHASE:
+            return ["play_a_bird", "gain_food", "draw_a_bird"][action]
+        return "deck" if action == DECK else BIRD_NAMES[action]
+
+    def _to_code(self, name, phase):
+        if phase == CHOOSE_ACTION_PHASE:
+            return ["play_a_bird", "gain_food", "draw_a_bird"].index(name)
+        return DECK if name == "deck" else BIRD_NAME_TO_ID[name]
+
+    def test_same_legal_actions_and_scores(self):
+        rng = np.random.default_rng(3)
+        mcts = MCTSPolicy()
+        for _ in range(5):
+            game = WingspanGame(num_players=2, num_turns=6, num_starting_cards=2)
+            state = MCTSGameState.from_game_state(game.game_state)
+            compact = CompactGame.from_game_state(state)
+
+            while not state.is_game_over():
+                object_actions = mcts._get_legal_actions(state)
+                compact_actions = compact.legal_actions()
+                codes = sorted(self._to_code(a, compact.phase) for a in object_actions)
+                self.assertEqual(codes, sorted(compact_actions))
+
+                chosen = object_actions[rng.integers(len(object_actions))]
+                code = self._to_code(chosen, compact.phase)
+                state = mcts._apply_action(state, chosen)
+                compact.apply_action(code)
+
+                self.assertEqual(compact.game_turn, state.game_turn)
+                self.assertEqual(compact.get_phase(), state.phase)
+                self.assertEqual(compact.food.tolist(), [p.get_food_supply().amount for p in state.get_players()])
+                self.assertEqual(compact.bird_feeder, state.get_bird_feeder().food_count)
+                self.assertEqual(compact.get_deck_count(), state.get_bird_deck().get_count())
+
+            self.assertEqual(compact.get_scores(), [p.get_score() for p in state.get_players()])
+
+
+if __name__ == "__main__":
+    unittest.main()
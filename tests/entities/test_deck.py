@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from src.entities.bird import Bird
 from src.entities.deck import Deck
 
@@ -36,6 +38,20 @@ class TestDeck(unittest.TestCase):
         # Order has been shuffled
         self.assertNotEqual(self.deck.cards, original_order)
 
+    def test_prepare_deck_with_rng_is_reproducible(self):
+        cards = [f"bird_{i}" for i in range(12)]
+        orders = []
+        for _ in range(2):
+            deck = Deck(rng=np.random.default_rng(7))
+            deck.prepare_deck(cards)
+            orders.append(deck.cards)
+        self.assertEqual(orders[0], orders[1])
+        self.assertEqual(sorted(orders[0]), sorted(cards))
+
+    def test_clone_keeps_rng(self):
+        deck = Deck(rng=np.random.default_rng(0))
+        self.assertIs(deck.clone().rng, deck.rng)
+
     def test_remove_and_return_bird(self):
         for bird in self.birds:
             self.deck.add_card(bird)
@@ -48,6 +64,47 @@ class TestDeck(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.deck.remove_and_return_bird(lambda b: b.get_name() == "Nonexistent")
 
+    def test_remove_and_return_bird_moves_top_card_into_its_place(self):
+        birds = [Bird(f"Bird {i}", i, 1) for i in range(4)]
+        for bird in birds:
+            self.deck.add_card(bird)
+        self.deck.remove_and_return_bird(lambda b: b.get_name() == "Bird 2")
+        self.assertEqual(self.deck.cards, [birds[1], birds[0], birds[3]])
+
+    def test_remove_bird_with_representation(self):
+        birds = [Bird(f"Bird {i}", points, 1) for i, points in enumerate([0, 1, 2, 3, 4, 2])]
+        for bird in birds[:5]:
+            self.deck.add_card(bird)
+        self.assertIs(self.deck.remove_bird_with_representation((4, 1)), birds[4])
+        # The position index stays valid across draws, adds and swaps
+        self.assertIs(self.deck.draw_card(), birds[1])  # birds[0] was swapped into birds[4]'s place
+        self.deck.add_card(birds[5])
+        removed = [self.deck.remove_bird_with_representation((2, 1)) for _ in range(2)]
+        self.assertEqual(set(removed), {birds[2], birds[5]})
+        with self.assertRaises(ValueError):
+            self.deck.remove_bird_with_representation((2, 1))
+        self.assertEqual(sorted(b.get_name() for b in self.deck.cards), ["Bird 0", "Bird 3"])
+        self.assertIs(self.deck.remove_bird_with_representation((3, 1)), birds[3])
+        self.assertEqual(self.deck.cards, [birds[0]])
+
+    def test_peek_and_return_to_top(self):
+        for bird in self.birds:
+            self.deck.add_card(bird)
+        self.assertEqual(self.deck.peek(5), self.birds)
+        drawn = self.deck.draw_card()
+        self.deck.return_to_top([drawn])
+        self.assertEqual(self.deck.cards, self.birds)
+        # Cards that never came from this deck are placed on top too
+        extra = Bird("Willet", 4, 1)
+        self.deck.return_to_top([extra])
+        self.assertEqual(self.deck.cards, [extra] + self.birds)
+
+    def test_cards_setter_replaces_contents(self):
+        self.deck.add_card(self.birds[0])
+        self.deck.cards = [self.birds[1]]
+        self.assertEqual(self.deck.draw_card(), self.birds[1])
+        self.assertEqual(self.deck.get_count(), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import Mock, patch
 
+import numpy as np
+
 from src.constants import CHOOSE_A_BIRD_TO_DRAW, CHOOSE_ACTION
 from src.entities.bird import Bird
 from src.entities.deck import Deck
@@ -214,6 +216,37 @@ class TestMCTSGameState(unittest.TestCase):
             ]
         )
 
+    def test_from_representation_places_boards_before_hidden_hands(self):
+        # (8, 2) is unique in the pool; a large hidden opponent hand must not take it
+        board_rep = ((0, 0), (0, 0), (0, 0), (0, 0), (8, 2))
+        empty_board = ((0, 0),) * 5
+        rep = frozenset(
+            [
+                ("num_turns", 10),
+                ("game_turn", 5),
+                ("phase", "choose_action"),
+                ("bird_deck", 20),
+                ("discard_pile", 34),
+                ("tray", ((1, 1), (1, 2), (3, 1))),
+                ("bird_feeder", 5),
+                ("current_player", frozenset([("food_supply", 3), ("game_board", empty_board), ("hand", ())])),
+                ("opponents", (frozenset([("food_supply", 3), ("game_board", board_rep), ("hand", 122)]),)),
+            ]
+        )
+        for _ in range(20):
+            self.assertEqual(MCTSGameState.from_representation(rep).to_representation(), rep)
+
+    def test_from_representation_accounts_for_every_bird(self):
+        from data.bird_list import birds
+
+        game_state = MCTSGameState.from_representation(self._make_representation())
+        names = [b.get_name() for b in game_state.get_bird_deck().cards + game_state.get_discard_pile().cards]
+        names += game_state.get_tray().see_birds_in_tray()
+        for player in game_state.get_players():
+            names += player.get_bird_hand().get_card_names_in_hand()
+            names += [b.get_name() for b in player.get_game_board().get_birds()]
+        self.assertEqual(sorted(names), sorted(b.get_name() for b in birds))
+
     def test_from_representation_default_uses_random_policy(self):
         rep = self._make_representation()
         game_state = MCTSGameState.from_representation(rep)
@@ -227,6 +260,23 @@ class TestMCTSGameState(unittest.TestCase):
         for player in game_state.get_players():
             self.assertIs(player.policy, custom_policy)
 
+    def test_from_representation_with_rng_is_reproducible(self):
+        rep = self._make_representation()
+
+        def deal(seed):
+            game_state = MCTSGameState.from_representation(rep, rng=np.random.default_rng(seed))
+            hands = [p.get_bird_hand().get_card_names_in_hand() for p in game_state.get_players()]
+            return hands, [b.get_name() for b in game_state.get_bird_deck().cards]
+
+        self.assertEqual(deal(5), deal(5))
+        self.assertNotEqual(deal(5), deal(6))
+
+    def test_from_representation_default_policy_uses_rng(self):
+        rng = np.random.default_rng(0)
+        game_state = MCTSGameState.from_representation(self._make_representation(), rng=rng)
+        for player in game_state.get_players():
+            self.assertIs(player.policy.rng, rng)
+
     def test_from_game_state(self):
         gs = GameState(
             num_turns=10,
@@ -244,5 +294,72 @@ class TestMCTSGameState(unittest.TestCase):
         self.assertEqual(mcts.game_turn, gs.game_turn)
 
 
+class TestCloneAndUndo(unittest.TestCase):
+    def setUp(self):
+        from src.game import WingspanGame
+
+        game = WingspanGame(num_players=2, num_turns=6, num_starting_cards=2)
+        self.state = MCTSGameState.from_game_state(game.game_state)
+
+    def _snapshot(self, state):
+        return (
+            state.to_representation(),
+            [list(p.get_bird_hand().cards) for p in state.get_players()],
+            [b.get_name() for b in state.get_bird_deck().cards],
+            [p.get_score() for p in state.get_players()],
+        )
+
+    def _legal_actions(self, state):
+        from src.rl.policy import MCTSPolicy
+
+        return MCTSPolicy()._get_legal_actions(state)
+
+    def test_clone_is_independent(self):
+        clone = self.state.clone()
+        before = self._snapshot(self.state)
+        for _ in range(6):
+            clone.apply_move(self._legal_actions(clone)[0])
+        self.assertEqual(self._snapshot(self.state), before)
+
+    def test_clone_shares_birds_and_policies(self):
+        clone = self.state.clone()
+        self.assertIsInstance(clone, MCTSGameState)
+        for original, copied in zip(self.state.get_players(), clone.get_players()):
+            self.assertIsNot(copied, original)
+            self.assertIsNot(copied.get_bird_hand(), original.get_bird_hand())
+            self.assertIs(copied.policy, original.policy)
+            for name, bird in original.get_bird_hand().cards.items():
+                self.assertIs(copied.get_bird_hand().get_card(name), bird)
+
+    def test_apply_then_undo_restores_state(self):
+        import random
+
+        rng = random.Random(0)
+        state = self.state.clone()
+        while not state.is_game_over():
+            actions = self._legal_actions(state)
+            before = self._snapshot(state)
+            for action in actions:
+                record = state.apply_move(action)
+                state.undo_move(record)
+                self.assertEqual(self._snapshot(state), before)
+            state.apply_move(rng.choice(actions))
+
+    def test_undo_rebuilds_feature_tracker(self):
+        from src.rl.feature_tracker import FeatureTracker
+        from src.rl.featurizer import featurize
+
+        FeatureTracker.attach(self.state, check=True)
+        clone = self.state.clone()
+        self.assertIsNot(clone.feature_tracker, self.state.feature_tracker)
+        record = clone.apply_move("draw_a_bird")
+        clone.undo_move(record)
+        record = clone.apply_move("gain_food")
+        featurize(clone)
+        clone.undo_move(record)
+        featurize(clone)
+        featurize(self.state)
+
+
 if __name__ == "__main__":
     unittest.main()
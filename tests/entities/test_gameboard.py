@@ -2,6 +2,7 @@ import unittest
 from io import StringIO
 from unittest.mock import patch
 
+from data.bird_list import birds as bird_pool
 from src.entities.bird import Bird
 from src.entities.deck import Deck
 from src.entities.gameboard import GameBoard
@@ -62,6 +63,23 @@ class TestGameBoard(unittest.TestCase):
         self.assertEqual(len(rep), 5)
         self.assertEqual(rep, ((0, 0), (0, 0), (0, 0), (0, 0), (5, 1)))
 
+    def test_get_bird_mask(self):
+        self.assertEqual(self.gameboard.get_bird_mask(), 0)
+        self.gameboard.add_bird(bird_pool[0])
+        self.gameboard.add_bird(bird_pool[5])
+        self.assertEqual(self.gameboard.get_bird_mask(), 0b100001)
+        self.gameboard.add_bird(Bird("Osprey", 5, 1))
+        self.assertIsNone(self.gameboard.get_bird_mask())
+
+    def test_bird_mask_survives_clone_and_reassignment(self):
+        self.gameboard.add_bird(bird_pool[2])
+        clone = self.gameboard.clone()
+        clone.add_bird(bird_pool[4])
+        self.assertEqual(self.gameboard.get_bird_mask(), 1 << 2)
+        self.assertEqual(clone.get_bird_mask(), (1 << 2) | (1 << 4))
+        self.gameboard.birds = [bird_pool[9]]
+        self.assertEqual(self.gameboard.get_bird_mask(), 1 << 9)
+
     def test_from_representation(self):
         deck = Deck()
         deck.add_card(Bird("Osprey", 5, 1))
@@ -2,11 +2,13 @@ import unittest
 from io import StringIO
 from unittest.mock import patch
 
+from data.bird_list import birds as bird_pool
 from src.entities.bird import Bird
 from src.entities.deck import Deck
 from src.entities.gameboard import GameBoard
 from src.entities.hand import BirdHand, Hand
 from src.entities.tray import Tray
+from src.utilities.events import PrintEventSink
 
 
 class TestHand(unittest.TestCase):
@@ -54,10 +56,16 @@ class TestHand(unittest.TestCase):
 
     def test_draw_card_from_empty_deck(self):
         empty_deck = Deck()
+        self.hand.event_sink = PrintEventSink()
         with patch("sys.stdout", new=StringIO()) as fake_out:
-            self.hand.draw_card_from_deck(empty_deck)
+            self.assertIsNone(self.hand.draw_card_from_deck(empty_deck))
             self.assertEqual(fake_out.getvalue().strip(), "Error: Deck is empty")
 
+    def test_draw_card_from_empty_deck_is_silent_by_default(self):
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            self.hand.draw_card_from_deck(Deck())
+            self.assertEqual(fake_out.getvalue(), "")
+
     @patch.object(Hand, "remove_card", return_value="Osprey")
     def test_discard_card(self, remove_card_mock):
         self.hand.add_card(self.test_card, self.test_card.get_name())
@@ -142,5 +150,30 @@ class TestBirdHand(unittest.TestCase):
         self.assertEqual(deck.get_count(), 1)
 
 
+class TestBirdHandMask(unittest.TestCase):
+    def test_mask_tracks_adds_and_removes(self):
+        hand = BirdHand()
+        self.assertEqual(hand.bird_mask, 0)
+        for bird in (bird_pool[3], bird_pool[10]):
+            hand.add_card(bird, bird.get_name())
+        self.assertEqual(hand.bird_mask, (1 << 3) | (1 << 10))
+        hand.remove_card(bird_pool[3].get_name())
+        self.assertEqual(hand.bird_mask, 1 << 10)
+        self.assertEqual(hand.clone().bird_mask, 1 << 10)
+
+    def test_mask_is_none_with_birds_outside_pool(self):
+        hand = BirdHand()
+        hand.add_card(bird_pool[3], bird_pool[3].get_name())
+        hand.add_card(Bird("Test", 1, 1), "Test")
+        self.assertIsNone(hand.bird_mask)
+        hand.remove_card("Test")
+        self.assertEqual(hand.bird_mask, 1 << 3)
+
+    def test_assigning_cards_recomputes_mask(self):
+        hand = BirdHand()
+        hand.cards = {bird.get_name(): bird for bird in bird_pool[:4]}
+        self.assertEqual(hand.bird_mask, 0b1111)
+
+
 if __name__ == "__main__":
     unittest.main()
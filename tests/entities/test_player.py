@@ -2,6 +2,7 @@ import unittest
 from io import StringIO
 from unittest.mock import Mock, patch
 
+from data.bird_list import birds as bird_pool
 from src.entities.bird import Bird
 from src.entities.birdfeeder import BirdFeeder
 from src.entities.deck import Deck
@@ -12,6 +13,7 @@ from src.entities.hand import BirdHand
 from src.entities.player import BotPlayer, HumanPlayer, Player
 from src.entities.tray import Tray
 from src.rl.policy import RandomPolicy
+from src.utilities.events import DREW_FROM_DECK
 
 
 class TestPlayerBase(unittest.TestCase):
@@ -159,6 +161,20 @@ class TestPlayer(TestPlayerBase):
             self.player.draw_a_bird(game_state=self.game_state)
             self.assertIn("Anhinga", self.player.bird_hand.get_card_names_in_hand())
 
+    def test_draw_a_bird_from_deck_emits_event(self):
+        sink = Mock()
+        player = Player(
+            name=self.name,
+            bird_hand=self.bird_hand,
+            food_supply=self.food_supply,
+            num_turns_remaining=self.num_turns,
+            event_sink=sink,
+        )
+        self.assertIs(player.bird_hand.event_sink, sink)
+        with patch.object(player, "_choose_a_bird_to_draw", return_value="deck"):
+            player.draw_a_bird(game_state=self.game_state)
+        sink.emit.assert_called_once_with(DREW_FROM_DECK, bird=player.bird_hand.get_card("Anhinga"))
+
     def test_end_turn(self):
         initial_turns = self.player.get_turns_remaining()
         self.player.end_turn()
@@ -172,6 +188,22 @@ class TestPlayer(TestPlayerBase):
         self.assertEqual(self.player.get_turns_remaining(), self.num_turns)
 
 
+class TestPlayerPoolBirds(unittest.TestCase):
+    """Legality checks on pool birds go through the hand's bitmask."""
+
+    def test_playable_birds_match_food_costs(self):
+        hand = BirdHand()
+        for bird in bird_pool[::9]:
+            hand.add_card(bird, bird.get_name())
+        for food in range(5):
+            player = Player("P", hand, FoodSupply(food), num_turns_remaining=1)
+            expected = [b.get_name() for b in hand.get_cards_in_hand() if b.get_food_cost() <= food]
+            self.assertEqual(player._enumerate_playable_birds(), expected)
+            self.assertEqual(player._can_play_a_bird(), bool(expected))
+            legal = player._enumerate_legal_actions(Tray(), Deck())
+            self.assertEqual("play_a_bird" in legal, bool(expected))
+
+
 class TestHumanPlayer(TestPlayerBase):
     def setUp(self):
         super().setUp()
@@ -183,6 +215,12 @@ class TestHumanPlayer(TestPlayerBase):
         )
         self.game_state.players = [self.player]
 
+    def test_draw_from_deck_prints_bird(self):
+        captured = StringIO()
+        with patch("sys.stdout", captured), patch.object(self.player, "_choose_a_bird_to_draw", return_value="deck"):
+            self.player.draw_a_bird(game_state=self.game_state)
+        self.assertEqual(captured.getvalue().strip(), "You drew Anhinga from the deck.")
+
     @patch("builtins.input", return_value="1")
     def test_choose_action(self, mock_input):
         legal_actions = ["play_a_bird", "gain_food", "draw_a_bird"]
@@ -289,6 +327,12 @@ class TestBotPlayer(TestPlayerBase):
         )
         self.game_state.players = [self.player]
 
+    def test_draw_from_deck_prints_nothing(self):
+        captured = StringIO()
+        with patch("sys.stdout", captured), patch.object(self.player, "_choose_a_bird_to_draw", return_value="deck"):
+            self.player.draw_a_bird(game_state=self.game_state)
+        self.assertEqual(captured.getvalue(), "")
+
     def test_choose_action(self):
         legal_actions = self.player._enumerate_legal_actions(self.tray, self.bird_deck)
         action = self.player._choose_action(legal_actions=legal_actions, game_state=self.game_state)
@@ -2,6 +2,7 @@ import unittest
 from io import StringIO
 from unittest.mock import patch
 
+from data.bird_list import birds as bird_pool
 from src.entities.bird import Bird
 from src.entities.deck import Deck
 from src.entities.tray import Tray
@@ -35,6 +36,33 @@ class TestTray(unittest.TestCase):
             self.tray.add_bird(bird)
         self.assertEqual(self.tray.get_birds_in_tray(), self.birds)
 
+    def test_get_bird_ids(self):
+        pool_bird = bird_pool[3]
+        self.tray.add_bird(pool_bird)
+        self.tray.add_bird(self.birds[0])
+        self.assertEqual(self.tray.get_bird_ids(), [3, None])
+
+    def test_get_bird_mask(self):
+        self.tray.add_bird(bird_pool[3])
+        self.tray.add_bird(bird_pool[7])
+        self.assertEqual(self.tray.get_bird_mask(), (1 << 3) | (1 << 7))
+        self.tray.add_bird(self.birds[0])
+        self.assertIsNone(self.tray.get_bird_mask())
+
+    def test_bird_mask_tracks_moves(self):
+        for bird in (bird_pool[3], bird_pool[7]):
+            self.tray.add_bird(bird)
+        self.tray.draw_bird(bird_pool[3].get_name())
+        self.assertEqual(self.tray.get_bird_mask(), 1 << 7)
+        self.assertEqual(self.tray.clone().get_bird_mask(), 1 << 7)
+        self.tray.birds = {bird_pool[1].get_name(): bird_pool[1]}
+        self.assertEqual(self.tray.get_bird_mask(), 1 << 1)
+        self.tray.add_bird(self.birds[0])
+        self.tray.draw_bird(self.birds[0].get_name())
+        self.assertEqual(self.tray.get_bird_mask(), 1 << 1)
+        self.tray.flush(discard_pile=Deck(), bird_deck=Deck())
+        self.assertEqual(self.tray.get_bird_mask(), 0)
+
     def test_see_birds_in_tray(self):
         # Test when the tray is empty
         self.assertEqual(self.tray.see_birds_in_tray(), [])
@@ -0,0 +1,78 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from src.rl.actor_learner import ActorLearner
+from src.rl.linear_policy import LinearPolicy
+from src.rl.worker_pool import PolicyWorkerPool
+
+
+def _failing_chunk():
+    raise RuntimeError("chunk failed")
+
+
+class TestActorLearner(unittest.TestCase):
+    def setUp(self):
+        self.pool = PolicyWorkerPool(workers=2)
+        self.addCleanup(self.pool.shutdown)
+        self.policy = LinearPolicy()
+
+    def _actors(self, **kwargs):
+        actors = ActorLearner(self.policy, self.pool, num_turns=2, backend="batch", **kwargs)
+        self.addCleanup(actors.close)
+        return actors
+
+    def test_requires_policy_worker_pool(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(ValueError):
+                ActorLearner(self.policy, executor)
+
+    def test_rejects_negative_staleness(self):
+        with self.assertRaises(ValueError):
+            ActorLearner(self.policy, self.pool, max_staleness=-1)
+
+    def test_next_batch_collects_enough_games(self):
+        actors = self._actors(games_per_chunk=2)
+        buffer, stats = actors.next_batch(5)
+        num_games = stats["wins"] + stats["losses"] + stats["ties"]
+        self.assertGreaterEqual(num_games, 5)
+        self.assertEqual(num_games % 2, 0)
+        self.assertEqual(buffer.num_actions, num_games * 2)
+        self.assertEqual(actors.games_played, num_games)
+
+    def test_stale_chunks_are_dropped_after_update(self):
+        actors = self._actors(games_per_chunk=1, max_staleness=0, chunks_in_flight=4)
+        actors.next_batch(1)
+        wait(actors._pending)  # every queued chunk has played with the old weights
+        self.policy.weights[:] = 1.0
+        buffer, stats = actors.next_batch(2)
+        self.assertGreater(actors.games_dropped, 0)
+        self.assertGreaterEqual(stats["wins"] + stats["losses"] + stats["ties"], 2)
+
+    def test_stale_chunks_kept_within_tolerance(self):
+        actors = self._actors(games_per_chunk=1, max_staleness=1, chunks_in_flight=4)
+        actors.next_batch(1)
+        wait(actors._pending)
+        self.policy.weights[:] = 1.0
+        actors.next_batch(2)
+        self.assertEqual(actors.games_dropped, 0)
+
+    def test_publish_while_chunks_are_queued(self):
+        # Queued chunks start after newer weights are published and play with those
+        actors = ActorLearner(self.policy, self.pool, num_turns=10, games_per_chunk=4, chunks_in_flight=8)
+        self.addCleanup(actors.close)
+        for _ in range(5):
+            buffer, stats = actors.next_batch(4)
+            self.assertGreaterEqual(stats["wins"] + stats["losses"] + stats["ties"], 4)
+            self.policy.weights += 0.01
+        self.assertGreaterEqual(actors.games_played, 20)
+
+    def test_close_skips_failed_chunks(self):
+        actors = self._actors()
+        actors.next_batch(1)
+        actors._pending.add(self.pool.submit(_failing_chunk))
+        actors.close()
+        self.assertEqual(actors._pending, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
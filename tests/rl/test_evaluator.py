@@ -1,14 +1,35 @@
 import unittest
+from unittest.mock import patch
 
-from src.rl.evaluator import evaluate, evaluate_parallel
+import numpy as np
+
+from src.rl.evaluator import (
+    evaluate,
+    evaluate_parallel,
+    evaluate_sequential,
+    mean_interval,
+    sprt_decision,
+    wilson_interval,
+)
 from src.rl.linear_policy import LinearPolicy
 from src.rl.policy import RandomPolicy
 
+EXPECTED_KEYS = {
+    "num_games",
+    "win_rate",
+    "win_rate_ci",
+    "tie_rate",
+    "mean_score",
+    "mean_opponent_score",
+    "mean_score_diff",
+    "mean_score_diff_ci",
+}
+
 
 class TestEvaluate(unittest.TestCase):
     def test_returns_expected_keys(self):
         results = evaluate(RandomPolicy(), RandomPolicy(), num_games=4, num_turns=2)
-        expected = {"win_rate", "tie_rate", "mean_score", "mean_opponent_score", "mean_score_diff"}
+        expected = EXPECTED_KEYS
         self.assertEqual(set(results.keys()), expected)
 
     def test_win_rate_bounded(self):
@@ -16,6 +37,27 @@ class TestEvaluate(unittest.TestCase):
         self.assertGreaterEqual(results["win_rate"], 0.0)
         self.assertLessEqual(results["win_rate"], 1.0)
 
+    def test_batch_backend_returns_expected_keys(self):
+        results = evaluate(LinearPolicy(), RandomPolicy(), num_games=6, num_turns=2, backend="batch")
+        expected = EXPECTED_KEYS
+        self.assertEqual(set(results.keys()), expected)
+        self.assertLessEqual(results["win_rate"] + results["tie_rate"], 1.0)
+
+    def test_rng_makes_results_reproducible(self):
+        for backend in ("object", "batch"):
+            runs = [
+                evaluate(
+                    LinearPolicy(rng=np.random.default_rng(1)),
+                    RandomPolicy(rng=np.random.default_rng(2)),
+                    num_games=4,
+                    num_turns=2,
+                    backend=backend,
+                    rng=np.random.default_rng(3),
+                )
+                for _ in range(2)
+            ]
+            self.assertEqual(runs[0], runs[1])
+
 
 class TestEvaluateParallel(unittest.TestCase):
     def test_returns_expected_keys(self):
@@ -24,7 +66,7 @@ class TestEvaluateParallel(unittest.TestCase):
         policy = LinearPolicy()
         with ProcessPoolExecutor(max_workers=2) as pool:
             results = evaluate_parallel(policy, num_games=4, num_turns=2, pool=pool, workers=2)
-        expected = {"win_rate", "tie_rate", "mean_score", "mean_opponent_score", "mean_score_diff"}
+        expected = EXPECTED_KEYS
         self.assertEqual(set(results.keys()), expected)
 
     def test_rates_are_valid(self):
@@ -38,6 +80,121 @@ class TestEvaluateParallel(unittest.TestCase):
         self.assertGreaterEqual(results["tie_rate"], 0.0)
         self.assertLessEqual(results["win_rate"] + results["tie_rate"], 1.0)
 
+    def test_seed_makes_results_reproducible(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        policy = LinearPolicy()
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            runs = [evaluate_parallel(policy, num_games=4, num_turns=2, pool=pool, workers=2, seed=7) for _ in range(2)]
+        self.assertEqual(runs[0], runs[1])
+
+
+class TestIntervals(unittest.TestCase):
+    def test_wilson_interval_contains_estimate(self):
+        low, high = wilson_interval(30, 50)
+        self.assertLess(low, 0.6)
+        self.assertGreater(high, 0.6)
+        self.assertAlmostEqual(low, 0.4618, places=3)
+        self.assertAlmostEqual(high, 0.7239, places=3)
+
+    def test_wilson_interval_stays_in_unit_range(self):
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0))
+        low, high = wilson_interval(10, 10)
+        self.assertGreater(low, 0.6)
+        self.assertLessEqual(high, 1.0)
+
+    def test_mean_interval(self):
+        low, high = mean_interval([1.0, 2.0, 3.0, 4.0])
+        self.assertAlmostEqual((low + high) / 2, 2.5)
+        self.assertEqual(mean_interval([5.0]), (5.0, 5.0))
+
+
+class TestSequentialEvaluation(unittest.TestCase):
+    def test_sprt_decisions(self):
+        self.assertEqual(sprt_decision(40, 50), "above")
+        self.assertEqual(sprt_decision(10, 50), "below")
+        self.assertIsNone(sprt_decision(5, 10))
+
+    def test_stops_early_once_decided(self):
+        # A wide indifference zone decides after a short run of games
+        results = evaluate_sequential(
+            RandomPolicy(), RandomPolicy(), max_games=40, batch_size=2, num_turns=2, margin=0.45
+        )
+        self.assertIn(results["decision"], ("above", "below"))
+        self.assertLess(results["num_games"], 40)
+        self.assertEqual(results["num_games"] % 2, 0)
+
+    def test_stops_at_max_games_when_undecided(self):
+        results = evaluate_sequential(
+            LinearPolicy(), RandomPolicy(), max_games=6, batch_size=4, num_turns=2, margin=0.01, backend="batch"
+        )
+        self.assertEqual(results["num_games"], 6)
+        self.assertEqual(results["decision"], "undecided")
+        self.assertEqual(set(results), EXPECTED_KEYS | {"decision"})
+
+    def test_rejects_invalid_threshold(self):
+        with self.assertRaises(ValueError):
+            evaluate_sequential(RandomPolicy(), RandomPolicy(), threshold=0.95, margin=0.1)
+
+    def test_parallel_requires_random_baseline(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            with self.assertRaises(ValueError):
+                evaluate_sequential(LinearPolicy(), LinearPolicy(), pool=pool)
+
+
+class TestPairedEvaluation(unittest.TestCase):
+    def test_pairs_replay_the_same_deal(self):
+        import src.game
+
+        real_game = src.game.WingspanGame
+        deals = []
+
+        def recording_game(*args, **kwargs):
+            game = real_game(*args, **kwargs)
+            state = game.game_state
+            hands = [tuple(p.get_bird_hand().get_card_names_in_hand()) for p in state.get_players()]
+            deals.append((tuple(b.get_name() for b in state.get_bird_deck().cards), tuple(hands)))
+            return game
+
+        with patch("src.game.WingspanGame", side_effect=recording_game):
+            results = evaluate(RandomPolicy(), RandomPolicy(), num_games=4, num_turns=2, paired=True)
+        self.assertEqual(deals[0], deals[1])
+        self.assertEqual(deals[2], deals[3])
+        self.assertNotEqual(deals[0], deals[2])
+        self.assertEqual(results["num_pairs"], 2)
+
+    def test_batch_backend_pairs(self):
+        results = evaluate(LinearPolicy(), RandomPolicy(), num_games=6, num_turns=2, backend="batch", paired=True)
+        self.assertEqual(results["num_pairs"], 3)
+        self.assertEqual(set(results), EXPECTED_KEYS | {"num_pairs", "pair_score", "pair_score_ci"})
+        low, high = results["pair_score_ci"]
+        self.assertLessEqual(low, results["pair_score"])
+        self.assertGreaterEqual(high, results["pair_score"])
+
+    def test_pair_score_counts_ties_as_half(self):
+        from src.rl.evaluator import _build_eval_results
+
+        # Pair 1: win then tie; pair 2: loss then loss
+        results = _build_eval_results(1, 1, [5, 3, 1, 2], [4, 3, 6, 7], paired=True)
+        self.assertAlmostEqual(results["pair_score"], (0.75 + 0.0) / 2)
+
+    def test_odd_game_count_rejected(self):
+        with self.assertRaises(ValueError):
+            evaluate(RandomPolicy(), RandomPolicy(), num_games=3, num_turns=2, paired=True)
+
+    def test_parallel_paired(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = evaluate_parallel(LinearPolicy(), num_games=6, num_turns=2, pool=pool, workers=2, paired=True)
+        self.assertEqual(results["num_pairs"], 3)
+
+    def test_sequential_paired_needs_even_batches(self):
+        with self.assertRaises(ValueError):
+            evaluate_sequential(RandomPolicy(), RandomPolicy(), batch_size=3, paired=True)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+import pickle
+import unittest
+
+import numpy as np
+
+from src.rl.experience import ActionExperience, ExperienceBuffer, SubExperience
+from src.rl.featurizer import NUM_FEATURES, NUM_SUB_FEATURES
+
+
+def _fill(buffer, num_actions, num_subs, reward=1.0):
+    buffer.add_actions(np.ones((num_actions, NUM_FEATURES)), np.arange(num_actions) % 3, reward)
+    buffer.add_subs(np.ones((num_subs, NUM_SUB_FEATURES)), np.zeros(num_subs, dtype=int), 3, reward)
+
+
+class TestExperienceBuffer(unittest.TestCase):
+    def test_starts_empty(self):
+        buffer = ExperienceBuffer()
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.action_features.shape, (0, NUM_FEATURES))
+        self.assertEqual(buffer.sub_features.shape, (0, NUM_SUB_FEATURES))
+
+    def test_grows_past_capacity(self):
+        buffer = ExperienceBuffer(capacity=2)
+        for _ in range(5):
+            _fill(buffer, num_actions=3, num_subs=1)
+        self.assertEqual(buffer.num_actions, 15)
+        self.assertEqual(buffer.num_subs, 5)
+        np.testing.assert_array_equal(buffer.action_indices, np.tile([0, 1, 2], 5))
+
+    def test_pickle_keeps_only_filled_rows(self):
+        buffer = ExperienceBuffer(capacity=1000)
+        _fill(buffer, num_actions=4, num_subs=2, reward=0.5)
+        restored = pickle.loads(pickle.dumps(buffer))
+        self.assertEqual(restored._action_features.shape, (4, NUM_FEATURES))
+        np.testing.assert_array_equal(restored.action_features, buffer.action_features)
+        np.testing.assert_array_equal(restored.sub_rewards, [0.5, 0.5])
+        _fill(restored, num_actions=1, num_subs=1)
+        self.assertEqual(restored.num_actions, 5)
+
+    def test_concatenate_preserves_order(self):
+        first, second = ExperienceBuffer(), ExperienceBuffer()
+        _fill(first, num_actions=2, num_subs=1, reward=1.0)
+        _fill(second, num_actions=1, num_subs=2, reward=0.0)
+        merged = ExperienceBuffer.concatenate([first, second])
+        np.testing.assert_array_equal(merged.action_rewards, [1.0, 1.0, 0.0])
+        np.testing.assert_array_equal(merged.sub_rewards, [1.0, 0.0, 0.0])
+
+    def test_shared_memory_round_trip(self):
+        first, second = ExperienceBuffer(), ExperienceBuffer()
+        _fill(first, num_actions=3, num_subs=2, reward=1.0)
+        _fill(second, num_actions=2, num_subs=0, reward=0.0)
+        merged = ExperienceBuffer.merge_shared([first.to_shared(), second.to_shared()])
+        expected = ExperienceBuffer.concatenate([first, second])
+        for column in ("action_features", "action_indices", "action_rewards", "sub_features", "sub_num_options"):
+            np.testing.assert_array_equal(getattr(merged, column), getattr(expected, column))
+
+    def test_round_trips_experience_tuples(self):
+        features = np.arange(NUM_FEATURES, dtype=float)
+        combined = np.arange(NUM_SUB_FEATURES, dtype=float)
+        action_exps = [ActionExperience(features=features, action_index=2, reward=1.0)]
+        sub_exps = [SubExperience(combined_features=combined, action_index=1, num_options=3, reward=0.5)]
+        buffer = ExperienceBuffer.from_experiences(action_exps, sub_exps)
+        (action,) = buffer.action_experiences()
+        (sub,) = buffer.sub_experiences()
+        np.testing.assert_array_equal(action.features, features)
+        self.assertEqual((action.action_index, action.reward), (2, 1.0))
+        np.testing.assert_array_equal(sub.combined_features, combined)
+        self.assertEqual((sub.action_index, sub.num_options, sub.reward), (1, 3, 0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+
+from src.entities.bird import Bird
+from src.entities.game_state import MCTSGameState
+from src.entities.hand import BirdHand
+from src.game import WingspanGame
+from src.rl.feature_tracker import FeatureTracker
+from src.rl.featurizer import _featurize_full, featurize
+from src.rl.linear_policy import LinearPolicy
+from src.rl.policy import MCTSPolicy, RandomPolicy
+
+
+class TestFeatureTracker(unittest.TestCase):
+    def setUp(self):
+        self.game = WingspanGame(num_players=2, num_turns=6, num_starting_cards=2)
+        self.state = self.game.game_state
+
+    def test_attach_hooks_state_and_hands(self):
+        tracker = FeatureTracker.attach(self.state)
+        self.assertIs(self.state.feature_tracker, tracker)
+        for player in self.state.get_players():
+            self.assertIs(player.get_bird_hand().feature_tracker, tracker)
+
+    def test_matches_featurize_at_start(self):
+        FeatureTracker.attach(self.state)
+        np.testing.assert_array_equal(featurize(self.state), _featurize_full(self.state))
+
+    def test_check_mode_through_full_games(self):
+        # check=True raises on the first decision where the tracker drifts
+        for policy in (RandomPolicy(), LinearPolicy()):
+            game = WingspanGame(
+                num_players=3, num_human=0, num_turns=8, num_starting_cards=2, bot_policy_factory=lambda: policy
+            )
+            FeatureTracker.attach(game.game_state, check=True)
+            state = game.game_state
+            while not state.is_game_over():
+                player = state.get_current_player()
+                featurize(state)
+                player.take_action(action=player.request_action(game_state=state), game_state=state)
+                state.end_player_turn(player=player)
+                featurize(state)
+
+    def test_check_mode_through_mcts_copies(self):
+        FeatureTracker.attach(self.state, check=True)
+        rng = np.random.default_rng(0)
+        mcts = MCTSPolicy()
+        state = MCTSGameState.from_game_state(self.state)
+        self.assertIs(state.feature_tracker, self.state.feature_tracker)
+        while not state.is_game_over():
+            featurize(state)
+            actions = mcts._get_legal_actions(state)
+            state = mcts._apply_action(state, actions[rng.integers(len(actions))])
+
+    def test_mcts_search_leaves_tracked_state_untouched(self):
+        tracker = FeatureTracker.attach(self.state, check=True)
+        representation = MCTSGameState.from_game_state(self.state).to_representation()
+        mcts = MCTSPolicy(num_simulations=30, seed=0)
+        mcts._rhoUCT(self.state, mcts._get_legal_actions(self.state))
+        self.assertIs(self.state.feature_tracker, tracker)
+        self.assertEqual(MCTSGameState.from_game_state(self.state).to_representation(), representation)
+        featurize(self.state)  # check mode: tracker still matches the state
+
+    def test_check_mode_detects_untracked_moves(self):
+        FeatureTracker.attach(self.state, check=True)
+        hand = self.state.get_current_player().get_bird_hand()
+        hand.add_card(Bird("Untracked Bird", 9, 0), "Untracked Bird")
+        with self.assertRaises(AssertionError) as ctx:
+            featurize(self.state)
+        self.assertIn("hand_count", str(ctx.exception))
+
+    def test_untracked_hand_raises(self):
+        tracker = FeatureTracker(self.state)
+        with self.assertRaises(ValueError):
+            tracker.on_add_to_hand(BirdHand(), Bird("Any Bird", 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
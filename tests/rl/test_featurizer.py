@@ -1,18 +1,33 @@
 import unittest
+from fractions import Fraction
 
 import numpy as np
 
+from data.bird_list import birds as bird_pool
+from src.entities.batch_game import BatchGameEngine
 from src.entities.bird import Bird
+from src.entities.compact_game import BIRD_NAME_TO_ID, CompactGame
+from src.entities.game_state import MCTSGameState
 from src.game import WingspanGame
 from src.rl.featurizer import (
+    _POOL_RATIOS,
+    DECK_OPTION,
     FEATURE_NAMES,
     NUM_FEATURES,
     NUM_OPTION_FEATURES,
     OPTION_FEATURE_NAMES,
     _max_achievable_vp,
+    _unseen_bird_stats,
+    _visible_pool_mask,
     featurize,
+    featurize_batch,
+    featurize_engine,
+    featurize_engine_options,
     featurize_option,
+    featurize_option_batch,
+    featurize_sub_decision,
 )
+from src.rl.policy import MCTSPolicy
 
 
 class TestFeaturizer(unittest.TestCase):
@@ -40,6 +55,29 @@ class TestFeaturizer(unittest.TestCase):
         can_play_idx = FEATURE_NAMES.index("can_play_bird")
         self.assertIn(features[can_play_idx], (0.0, 1.0))
 
+    def test_visible_pool_mask(self):
+        player = self.state.get_current_player()
+        self.state.get_tray().refill(self.state.get_bird_deck())
+        visible = [*player.get_bird_hand().get_cards_in_hand(), *self.state.get_tray().get_birds_in_tray()]
+        expected = np.zeros(len(bird_pool), dtype=bool)
+        expected[[bird.bird_id for bird in visible]] = True
+        np.testing.assert_array_equal(_visible_pool_mask(self.state, player), expected)
+
+        player.get_game_board().add_bird(Bird("Test Bird", 1, 1))
+        self.assertIsNone(_visible_pool_mask(self.state, player))
+
+    def test_unseen_mean_ratio_is_exact(self):
+        # The integer-unit mean is the correctly rounded mean of the ratios, at
+        # most a few ulps from the float mean featurize used to compute
+        player = self.state.get_current_player()
+        unseen = ~_visible_pool_mask(self.state, player)
+        ratios = [Fraction(b.get_points(), b.get_food_cost()) if b.get_food_cost() else Fraction(5) for b in bird_pool]
+        exact = sum(r for r, u in zip(ratios, unseen) if u) / int(unseen.sum())
+        float_mean = _POOL_RATIOS[unseen].mean()
+        mean_ratio = _unseen_bird_stats(self.state, player)[0]
+        self.assertEqual(mean_ratio, float(exact))
+        self.assertLessEqual(abs(mean_ratio - float_mean), 4 * np.spacing(mean_ratio))
+
     def test_features_change_after_turn(self):
         features_before = featurize(self.state)
         player = self.state.get_current_player()
@@ -272,5 +310,89 @@ class TestFeaturizeOption(unittest.TestCase):
             self.assertEqual(features[affordable_idx], 0.0)
 
 
+class TestFeaturizeEngine(unittest.TestCase):
+    """featurize_engine must reproduce featurize exactly on the equivalent object state."""
+
+    def _sort_hands_by_id(self, state):
+        # The engine orders hands by bird id; featurize depends on hand order only through tie-breaks
+        for player in state.get_players():
+            hand = player.get_bird_hand()
+            hand.cards = dict(sorted(hand.cards.items(), key=lambda item: BIRD_NAME_TO_ID[item[0]]))
+
+    def test_matches_featurize_through_random_games(self):
+        rng = np.random.default_rng(4)
+        mcts = MCTSPolicy()
+        for _ in range(3):
+            game = WingspanGame(num_players=2, num_turns=6, num_starting_cards=2)
+            state = MCTSGameState.from_game_state(game.game_state)
+            while not state.is_game_over():
+                self._sort_hands_by_id(state)
+                engine = BatchGameEngine.from_compact_games([CompactGame.from_game_state(state)])
+                games = np.array([0])
+                np.testing.assert_array_equal(featurize_engine(engine, games)[0], featurize(state))
+
+                tray = [BIRD_NAME_TO_ID[name] for name in state.get_tray().see_birds_in_tray()]
+                option_ids = np.array([tray + [DECK_OPTION]])
+                expected = [featurize_option(state, name) for name in state.get_tray().see_birds_in_tray()]
+                expected.append(featurize_option(state, "deck"))
+                np.testing.assert_array_equal(featurize_engine_options(engine, games, option_ids)[0], expected)
+
+                actions = mcts._get_legal_actions(state)
+                state = mcts._apply_action(state, actions[rng.integers(len(actions))])
+
+    def test_empty_hands(self):
+        engine = BatchGameEngine(3, num_players=2, num_turns=4, num_starting_cards=0)
+        features = featurize_engine(engine, np.arange(3))
+        self.assertEqual(features.shape, (3, NUM_FEATURES))
+        self.assertTrue(np.all(features[:, FEATURE_NAMES.index("hand_min_cost")] == 0.0))
+
+
+class TestFeaturizeBatch(unittest.TestCase):
+    """featurize_batch/featurize_option_batch must match the scalar featurizer bit for bit."""
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        mcts = MCTSPolicy()
+        self.states = []
+        for num_players in (2, 3):
+            game = WingspanGame(num_players=num_players, num_turns=6, num_starting_cards=2)
+            state = MCTSGameState.from_game_state(game.game_state)
+            while not state.is_game_over():
+                self.states.append(state)
+                actions = mcts._get_legal_actions(state)
+                state = mcts._apply_action(state, actions[rng.integers(len(actions))])
+
+    def test_matches_featurize(self):
+        expected = np.array([featurize(state) for state in self.states])
+        np.testing.assert_array_equal(featurize_batch(self.states), expected)
+
+    def test_empty_batch(self):
+        self.assertEqual(featurize_batch([]).shape, (0, NUM_FEATURES))
+
+    def test_bird_outside_pool_falls_back_to_scalar(self):
+        state = self.states[0]
+        state.get_current_player().get_bird_hand().add_card(Bird("Custom Bird", 7, 1), "Custom Bird")
+        np.testing.assert_array_equal(featurize_batch([state])[0], featurize(state))
+
+    def test_option_batch_matches_featurize_option(self):
+        options = [
+            state.get_current_player().get_bird_hand().get_card_names_in_hand()
+            + state.get_tray().see_birds_in_tray()
+            + ["deck", "Nonexistent Bird"]
+            for state in self.states
+        ]
+        for state, names, features in zip(self.states, options, featurize_option_batch(self.states, options)):
+            expected = np.array([featurize_option(state, name) for name in names])
+            np.testing.assert_array_equal(features, expected)
+
+    def test_sub_decision_concatenates_state_and_options(self):
+        state = self.states[0]
+        options = state.get_tray().see_birds_in_tray() + ["deck"]
+        combined = featurize_sub_decision(state, options)
+        self.assertEqual(combined.shape, (len(options), NUM_FEATURES + NUM_OPTION_FEATURES))
+        for row, name in zip(combined, options):
+            np.testing.assert_array_equal(row, np.concatenate([featurize(state), featurize_option(state, name)]))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -57,6 +57,15 @@ class TestLinearPolicy(unittest.TestCase):
         self.assertEqual(np.argmax(all_probs), 1)
         self.assertEqual(np.argmax(sub_probs), 0)
 
+    def test_rng_makes_choices_reproducible(self):
+        actions = ["play_a_bird", "gain_food", "draw_a_bird"]
+        self.state.phase = "choose_action"
+        choices = []
+        for _ in range(2):
+            self.policy.rng = np.random.default_rng(3)
+            choices.append([self.policy(self.state, actions) for _ in range(20)])
+        self.assertEqual(choices[0], choices[1])
+
     def test_save_and_load(self):
         self.policy.weights = np.random.randn(NUM_FEATURES, 3)
         self.policy.sub_weights = np.random.randn(NUM_SUB_FEATURES)
@@ -0,0 +1,59 @@
+import unittest
+
+from src.rl.mcts import Node, NodeStats, TranspositionTable
+
+
+class TestNodeStats(unittest.TestCase):
+    def test_nodes_sharing_stats_see_each_others_visits(self):
+        stats = NodeStats()
+        a = Node(state=None, stats=stats)
+        b = Node(state=None, stats=stats)
+        a.num_visits += 1
+        a.total_reward += 1.0
+        self.assertEqual(b.num_visits, 1)
+        self.assertEqual(b.total_reward, 1.0)
+
+    def test_default_stats_are_private(self):
+        a = Node(state=None)
+        b = Node(state=None)
+        a.num_visits += 1
+        self.assertEqual(b.num_visits, 0)
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_lookup_counts_hits_and_misses(self):
+        table = TranspositionTable(max_size=10)
+        first = table.lookup("s")
+        second = table.lookup("s")
+        table.lookup("t")
+        self.assertIs(first, second)
+        self.assertEqual((table.hits, table.misses), (1, 2))
+        self.assertAlmostEqual(table.hit_rate, 1 / 3)
+
+    def test_evicts_least_recently_used(self):
+        table = TranspositionTable(max_size=2)
+        table.lookup("a")
+        table.lookup("b")
+        table.lookup("a")  # "b" is now least recently used
+        table.lookup("c")
+        self.assertEqual(len(table), 2)
+        self.assertIn("a", table)
+        self.assertNotIn("b", table)
+        self.assertEqual(table.evictions, 1)
+
+    def test_reset_counters_keeps_entries(self):
+        table = TranspositionTable(max_size=2)
+        table.lookup("a")
+        table.reset_counters()
+        self.assertEqual((table.hits, table.misses, table.evictions), (0, 0, 0))
+        self.assertIn("a", table)
+        table.clear()
+        self.assertEqual(len(table), 0)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            TranspositionTable(max_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
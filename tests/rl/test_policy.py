@@ -2,11 +2,14 @@ import unittest
 from io import StringIO
 from unittest.mock import Mock, patch
 
+import numpy as np
+
 from src.constants import CHOOSE_A_BIRD_TO_DRAW, CHOOSE_A_BIRD_TO_PLAY, CHOOSE_ACTION
 from src.entities.game_state import MCTSGameState
 from src.game import WingspanGame
+from src.rl.linear_policy import LinearPolicy
 from src.rl.mcts import Node
-from src.rl.policy import MCTSPolicy, RandomPolicy
+from src.rl.policy import MCTSPolicy, RandomPolicy, _root_search_task
 
 
 class TestRandomPolicy(unittest.TestCase):
@@ -40,6 +43,16 @@ class TestRandomPolicy(unittest.TestCase):
         mock_choice.assert_called_once_with(actions)
         self.assertEqual(result, "deck")
 
+    def test_rng_makes_choices_reproducible(self):
+        state = Mock()
+        state.phase = "choose_action"
+        actions = ["play_a_bird", "gain_food", "draw_a_bird"]
+        choices = []
+        for _ in range(2):
+            policy = RandomPolicy(rng=np.random.default_rng(9))
+            choices.append([policy(state, actions) for _ in range(20)])
+        self.assertEqual(choices[0], choices[1])
+
     def test_call_dispatches_by_phase(self):
         for phase in ["choose_action", "choose_a_bird_to_play", "choose_a_bird_to_draw"]:
             state = Mock()
@@ -196,6 +209,15 @@ class TestExpand(unittest.TestCase):
         repr_after = leaf.state.to_representation()
         self.assertEqual(repr_before, repr_after)
 
+    def test_children_states_are_built_lazily(self):
+        leaf = Node(state=self.mcts_state)
+        self.policy._expand(leaf)
+        for child in leaf.children:
+            self.assertIsNone(child._state)
+            expected = self.policy._apply_action(self.mcts_state, child.action).to_representation()
+            self.assertEqual(child.representation, expected)
+            self.assertEqual(child.state.to_representation(), expected)
+
     def test_gain_food_child_has_more_food(self):
         leaf = Node(state=self.mcts_state)
         player_idx = leaf.state.game_turn % leaf.state.num_players
@@ -250,6 +272,210 @@ class TestRunSimulationsIntegration(unittest.TestCase):
         best = policy._best_child(root)
         self.assertIn(best.action, ["play_a_bird", "gain_food", "draw_a_bird"])
 
+    def test_seeded_search_is_reproducible(self):
+        game = WingspanGame(num_players=2, num_turns=2, num_starting_cards=2, rng=np.random.default_rng(1))
+        mcts_state = MCTSGameState.from_game_state(game.game_state)
+        visits = []
+        for _ in range(2):
+            policy = MCTSPolicy(num_simulations=20, seed=4)
+            policy._mcts_player_index = 0
+            root = Node(state=mcts_state)
+            policy._run_simulations(root, 20)
+            visits.append([(child.action, child.num_visits, child.total_reward) for child in root.children])
+        self.assertEqual(visits[0], visits[1])
+
+
+class TestTreeReuse(unittest.TestCase):
+    def setUp(self):
+        self.policy = MCTSPolicy(num_simulations=30)
+        self.game = WingspanGame(num_players=2, num_turns=2, num_starting_cards=2)
+        self.state = self.game.game_state
+
+    def test_keeps_chosen_child_as_detached_root(self):
+        action = self.policy._rhoUCT(self.state, self.policy._get_legal_actions(self.state))
+        self.assertEqual(self.policy.root.action, action)
+        self.assertIsNone(self.policy.root.parent)
+
+    def test_sub_decision_continues_from_chosen_child(self):
+        self.policy._mcts_player_index = 0
+        root = Node(state=MCTSGameState.from_game_state(self.state))
+        self.policy._run_simulations(root, 30)
+        draw_child = next(c for c in root.children if c.action == "draw_a_bird")
+        self.policy.root = draw_child
+
+        self.state.set_phase(CHOOSE_A_BIRD_TO_DRAW)
+        mcts_state = MCTSGameState.from_game_state(self.state)
+        reused = self.policy._reuse_root(mcts_state, self.policy._get_legal_actions(self.state))
+        self.assertIs(reused, draw_child)
+        # The search gets its own copy of the real state
+        self.assertIsNot(reused.state, mcts_state)
+        self.assertEqual(reused.state.to_representation(), mcts_state.to_representation())
+        self.assertIsNone(reused.parent)
+
+    def test_unrelated_state_is_not_reused(self):
+        self.policy._mcts_player_index = 0
+        other = WingspanGame(num_players=2, num_turns=2, num_starting_cards=2).game_state
+        other.game_turn = 1
+        self.policy.root = Node(state=MCTSGameState.from_game_state(other))
+        mcts_state = MCTSGameState.from_game_state(self.state)
+        self.assertIsNone(self.policy._reuse_root(mcts_state, self.policy._get_legal_actions(self.state)))
+        self.assertIsNone(self.policy.root)
+
+    def test_disabled(self):
+        policy = MCTSPolicy(num_simulations=5, reuse_tree=False)
+        policy._rhoUCT(self.state, policy._get_legal_actions(self.state))
+        self.assertIsNone(policy.root)
+
+
+class TestParallelMCTS(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from concurrent.futures import ProcessPoolExecutor
+
+        cls.pool = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def setUp(self):
+        self.game = WingspanGame(num_players=2, num_turns=2, num_starting_cards=2)
+        self.state = self.game.game_state
+
+    def test_root_parallel_returns_legal_action(self):
+        policy = MCTSPolicy(num_simulations=12, workers=2, parallel="root", pool=self.pool, seed=0)
+        actions = policy._get_legal_actions(self.state)
+        self.assertIn(policy._rhoUCT(self.state, actions), actions)
+        self.assertIsNone(policy.root)
+        self.assertEqual(policy.last_search_stats["simulations"], 12)
+
+    def test_root_parallel_time_budget(self):
+        policy = MCTSPolicy(workers=2, parallel="root", pool=self.pool, seed=0, time_budget_ms=30)
+        actions = policy._get_legal_actions(self.state)
+        self.assertIn(policy._rhoUCT(self.state, actions), actions)
+        self.assertGreaterEqual(policy.last_search_stats["simulations"], 2)
+
+    def test_root_parallel_bird_choice_maps_to_real_names(self):
+        self.state.set_phase(CHOOSE_A_BIRD_TO_DRAW)
+        policy = MCTSPolicy(num_simulations=12, workers=2, parallel="root", pool=self.pool, seed=0)
+        actions = policy._get_legal_actions(self.state)
+        self.assertIn(policy._rhoUCT(self.state, actions), actions)
+
+    def test_leaf_parallel_counts_every_simulation(self):
+        policy = MCTSPolicy(num_simulations=10, workers=2, parallel="leaf", pool=self.pool, seed=0)
+        policy._mcts_player_index = 0
+        root = Node(state=MCTSGameState.from_game_state(self.state))
+        policy._run_simulations(root, 10)
+        self.assertEqual(root.num_visits, 10)
+        self.assertEqual(sum(child.num_visits for child in root.children), 10)
+        self.assertLessEqual(root.total_reward, 10)
+
+    def test_root_search_task_is_deterministic_given_seed(self):
+        representation = MCTSGameState.from_game_state(self.state).to_representation()
+        task = (representation, 8, None, None, 1, 0, 123)
+        self.assertEqual(_root_search_task(task), _root_search_task(task))
+
+    def test_owned_pool_is_closed(self):
+        policy = MCTSPolicy(num_simulations=4, workers=2)
+        policy._get_pool()
+        policy.close()
+        self.assertIsNone(policy._pool)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            MCTSPolicy(parallel="tree")
+        with self.assertRaises(ValueError):
+            MCTSPolicy(workers=0)
+
+
+class TestSearchBudget(unittest.TestCase):
+    def setUp(self):
+        self.state = WingspanGame(num_players=2, num_turns=2, num_starting_cards=2).game_state
+
+    def test_fixed_count_stats(self):
+        policy = MCTSPolicy(num_simulations=15, reuse_tree=False)
+        policy._rhoUCT(self.state, policy._get_legal_actions(self.state))
+        stats = policy.last_search_stats
+        self.assertEqual(stats["simulations"], 15)
+        self.assertGreater(stats["tree_size"], 1)
+        self.assertGreaterEqual(stats["tree_depth"], 1)
+        self.assertGreater(stats["sims_per_sec"], 0)
+
+    def test_time_budget_runs_until_deadline(self):
+        policy = MCTSPolicy(num_simulations=1, time_budget_ms=30, reuse_tree=False)
+        actions = policy._get_legal_actions(self.state)
+        self.assertIn(policy._rhoUCT(self.state, actions), actions)
+        stats = policy.last_search_stats
+        self.assertGreaterEqual(stats["elapsed_s"], 0.03)
+        self.assertGreaterEqual(stats["simulations"], 1)
+
+    def test_time_budget_runs_at_least_one_simulation(self):
+        policy = MCTSPolicy()
+        policy._mcts_player_index = 0
+        root = Node(state=MCTSGameState.from_game_state(self.state))
+        self.assertEqual(policy._run_simulations(root, 100, deadline=0.0), 1)
+
+    def test_invalid_budget(self):
+        with self.assertRaises(ValueError):
+            MCTSPolicy(time_budget_ms=0)
+
+
+class TestBatchedPlayouts(unittest.TestCase):
+    def setUp(self):
+        self.policy = MCTSPolicy(playout_batch_size=4)
+        self.policy._mcts_player_index = 0
+        game = WingspanGame(num_players=2, num_turns=2, num_starting_cards=2)
+        self.mcts_state = MCTSGameState.from_game_state(game.game_state)
+
+    def test_returns_one_reward_per_playout(self):
+        rewards = self.policy._playout_batch(Node(state=self.mcts_state), 5)
+        self.assertEqual(len(rewards), 5)
+        self.assertTrue(set(rewards.tolist()) <= {0.0, 0.5, 1.0})
+
+    def test_mid_turn_node(self):
+        self.mcts_state.set_phase(CHOOSE_A_BIRD_TO_DRAW)
+        rewards = self.policy._playout_batch(Node(state=self.mcts_state), 3)
+        self.assertEqual(len(rewards), 3)
+
+    def test_finished_game_matches_compute_reward(self):
+        self.mcts_state.game_turn = self.mcts_state.num_turns * self.mcts_state.num_players
+        expected = self.policy._compute_reward(self.mcts_state)
+        rewards = self.policy._playout_batch(Node(state=self.mcts_state), 3)
+        self.assertEqual(rewards.tolist(), [expected] * 3)
+
+    def test_with_learned_playout_policy(self):
+        policy = MCTSPolicy(playout_policy=LinearPolicy(), playout_batch_size=4)
+        policy._mcts_player_index = 0
+        self.assertEqual(len(policy._playout_batch(Node(state=self.mcts_state), 4)), 4)
+
+    def test_simulations_count_each_playout(self):
+        root = Node(state=self.mcts_state)
+        self.assertEqual(self.policy._run_simulations(root, 10), 10)
+        self.assertEqual(root.num_visits, 10)
+        self.assertLessEqual(root.total_reward, 10)
+
+
+class TestTranspositionTableSearch(unittest.TestCase):
+    def test_next_search_from_same_state_reuses_visits(self):
+        policy = MCTSPolicy(num_simulations=10, transposition_table_size=1000)
+        game = WingspanGame(num_players=2, num_turns=2, num_starting_cards=2)
+        state = game.game_state
+        actions = policy._get_legal_actions(state)
+
+        policy._rhoUCT(state, actions)
+        misses = policy.transposition_table.misses
+        self.assertGreater(misses, 0)
+
+        policy._rhoUCT(state, actions)
+        self.assertGreater(policy.transposition_table.hits, 0)
+        root_stats = policy.transposition_table.lookup(
+            (policy._mcts_player_index, MCTSGameState.from_game_state(state).to_representation())
+        )
+        self.assertEqual(root_stats.num_visits, 20)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(MCTSPolicy().transposition_table)
+
 
 if __name__ == "__main__":
     unittest.main()
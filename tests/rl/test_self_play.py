@@ -1,9 +1,12 @@
 import unittest
 
+import numpy as np
+
+from src.rl.experience import ExperienceBuffer
 from src.rl.featurizer import ACTION_INDEX, NUM_FEATURES, NUM_SUB_FEATURES
 from src.rl.linear_policy import LinearPolicy
 from src.rl.policy import RandomPolicy
-from src.rl.self_play import ActionExperience, LoggingPolicy, SelfPlayRunner, SubExperience
+from src.rl.self_play import LoggingPolicy, SelfPlayRunner
 
 
 class TestLoggingPolicy(unittest.TestCase):
@@ -52,11 +55,12 @@ class TestLoggingPolicy(unittest.TestCase):
         choices = state.get_tray().see_birds_in_tray() + ["deck"]
         self.logger(state, choices)
 
-        action_exps, sub_exps = self.logger.assign_rewards(1.0)
-        self.assertEqual(len(action_exps), 1)
-        self.assertIsInstance(action_exps[0], ActionExperience)
-        self.assertEqual(len(sub_exps), 1)
-        self.assertIsInstance(sub_exps[0], SubExperience)
+        buffer = self.logger.assign_rewards(1.0)
+        self.assertIsInstance(buffer, ExperienceBuffer)
+        self.assertEqual(buffer.num_actions, 1)
+        self.assertEqual(buffer.num_subs, 1)
+        self.assertEqual(buffer.sub_num_options[0], len(choices))
+        self.assertEqual(list(buffer.action_rewards) + list(buffer.sub_rewards), [1.0, 1.0])
 
     def test_clear(self):
         from src.game import WingspanGame
@@ -76,24 +80,58 @@ class TestSelfPlayRunner(unittest.TestCase):
         self.policy = RandomPolicy()
 
     def test_run_game_returns_both_experience_types(self):
-        action_exps, sub_exps, reward = self.runner.run_game(self.policy, num_turns=2)
-        self.assertGreater(len(action_exps), 0)
+        buffer, reward = self.runner.run_game(self.policy, num_turns=2)
+        self.assertGreater(buffer.num_actions, 0)
         self.assertIn(reward, (0.0, 0.5, 1.0))
         # Sub experiences may or may not exist depending on actions chosen
-        for exp in action_exps:
-            self.assertEqual(exp.features.shape, (NUM_FEATURES,))
-            self.assertIn(exp.action_index, (0, 1, 2))
+        self.assertEqual(buffer.action_features.shape, (buffer.num_actions, NUM_FEATURES))
+        self.assertTrue(set(buffer.action_indices) <= {0, 1, 2})
 
     def test_run_game_with_different_opponent(self):
         opponent = LinearPolicy()
-        action_exps, sub_exps, reward = self.runner.run_game(self.policy, opponent_policy=opponent, num_turns=2)
-        self.assertGreater(len(action_exps), 0)
+        buffer, reward = self.runner.run_game(self.policy, opponent_policy=opponent, num_turns=2)
+        self.assertGreater(buffer.num_actions, 0)
+
+    def test_run_game_appends_to_given_buffer(self):
+        buffer = ExperienceBuffer()
+        self.runner.run_game(self.policy, num_turns=2, buffer=buffer)
+        first = buffer.num_actions
+        self.runner.run_game(self.policy, num_turns=2, buffer=buffer)
+        self.assertGreater(buffer.num_actions, first)
 
     def test_collect_experience(self):
-        action_exps, sub_exps, stats = self.runner.collect_experience(self.policy, num_games=5, num_turns=2)
-        self.assertGreater(len(action_exps), 0)
+        buffer, stats = self.runner.collect_experience(self.policy, num_games=5, num_turns=2)
+        self.assertGreater(buffer.num_actions, 0)
         self.assertEqual(stats["wins"] + stats["losses"] + stats["ties"], 5)
 
+    def test_collect_experience_batch_backend(self):
+        buffer, stats = self.runner.collect_experience(LinearPolicy(), num_games=8, num_turns=3, backend="batch")
+        self.assertEqual(stats["wins"] + stats["losses"] + stats["ties"], 8)
+        # Player 0 makes exactly num_turns CHOOSE_ACTION decisions per game
+        self.assertEqual(buffer.num_actions, 8 * 3)
+        self.assertEqual(buffer.action_features.shape, (8 * 3, NUM_FEATURES))
+        self.assertTrue(set(buffer.action_rewards) <= {0.0, 0.5, 1.0})
+        self.assertEqual(buffer.sub_features.shape, (buffer.num_subs, NUM_SUB_FEATURES))
+        self.assertTrue((buffer.sub_indices < buffer.sub_num_options).all())
+
+    def test_collect_experience_with_rng_is_reproducible(self):
+        for backend in ("object", "batch"):
+            runs = []
+            for _ in range(2):
+                policy = LinearPolicy(rng=np.random.default_rng(1))
+                buffer, stats = self.runner.collect_experience(
+                    policy, num_games=3, num_turns=2, backend=backend, rng=np.random.default_rng(2)
+                )
+                runs.append((buffer.action_features, buffer.action_indices, buffer.sub_indices, stats))
+            np.testing.assert_array_equal(runs[0][0], runs[1][0])
+            np.testing.assert_array_equal(runs[0][1], runs[1][1])
+            np.testing.assert_array_equal(runs[0][2], runs[1][2])
+            self.assertEqual(runs[0][3], runs[1][3])
+
+    def test_collect_experience_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            self.runner.collect_experience(self.policy, num_games=1, num_turns=2, backend="gpu")
+
 
 class TestParallelSelfPlay(unittest.TestCase):
     def test_collect_experience_parallel(self):
@@ -101,13 +139,27 @@ class TestParallelSelfPlay(unittest.TestCase):
 
         policy = LinearPolicy()
         with ProcessPoolExecutor(max_workers=2) as pool:
-            action_exps, sub_exps, stats = SelfPlayRunner.collect_experience_parallel(
+            buffer, stats = SelfPlayRunner.collect_experience_parallel(
                 policy, num_games=6, num_turns=2, pool=pool, workers=2
             )
-        self.assertGreater(len(action_exps), 0)
+        self.assertGreater(buffer.num_actions, 0)
         self.assertEqual(stats["wins"] + stats["losses"] + stats["ties"], 6)
-        for exp in action_exps:
-            self.assertEqual(exp.features.shape, (NUM_FEATURES,))
+        self.assertEqual(buffer.action_features.shape, (buffer.num_actions, NUM_FEATURES))
+
+    def test_seed_makes_parallel_collection_reproducible(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        policy = LinearPolicy()
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            runs = [
+                SelfPlayRunner.collect_experience_parallel(
+                    policy, num_games=4, num_turns=2, pool=pool, workers=2, seed=3
+                )
+                for _ in range(2)
+            ]
+        np.testing.assert_array_equal(runs[0][0].action_features, runs[1][0].action_features)
+        np.testing.assert_array_equal(runs[0][0].sub_indices, runs[1][0].sub_indices)
+        self.assertEqual(runs[0][1], runs[1][1])
 
     def test_parallel_matches_serial_stats_structure(self):
         from concurrent.futures import ProcessPoolExecutor
@@ -115,9 +167,9 @@ class TestParallelSelfPlay(unittest.TestCase):
         policy = LinearPolicy()
         runner = SelfPlayRunner()
 
-        serial_a, serial_s, serial_stats = runner.collect_experience(policy, num_games=4, num_turns=2)
+        _, serial_stats = runner.collect_experience(policy, num_games=4, num_turns=2)
         with ProcessPoolExecutor(max_workers=2) as pool:
-            par_a, par_s, par_stats = SelfPlayRunner.collect_experience_parallel(
+            _, par_stats = SelfPlayRunner.collect_experience_parallel(
                 policy, num_games=4, num_turns=2, pool=pool, workers=2
             )
 
@@ -2,10 +2,17 @@ import unittest
 
 import numpy as np
 
+from src.rl.experience import ActionExperience, ExperienceBuffer, SubExperience
 from src.rl.featurizer import NUM_FEATURES, NUM_SUB_FEATURES
 from src.rl.linear_policy import LinearPolicy
-from src.rl.self_play import ActionExperience, SubExperience
-from src.rl.trainer import compute_action_gradient, compute_sub_gradient, train_batch
+from src.rl.trainer import (
+    compute_action_gradient,
+    compute_batch_action_gradient,
+    compute_batch_sub_gradient,
+    compute_sub_gradient,
+    train_batch,
+    train_buffer,
+)
 
 
 class TestComputeActionGradient(unittest.TestCase):
@@ -94,5 +101,80 @@ class TestTrainBatch(unittest.TestCase):
         self.assertAlmostEqual(baseline, 0.5)
 
 
+def _random_experiences(rng, num_action, num_sub, num_actions=3):
+    action_exps = [
+        ActionExperience(
+            features=rng.standard_normal(NUM_FEATURES),
+            action_index=int(rng.integers(num_actions)),
+            reward=float(rng.integers(2)),
+        )
+        for _ in range(num_action)
+    ]
+    sub_exps = [
+        SubExperience(
+            combined_features=rng.standard_normal(NUM_SUB_FEATURES),
+            action_index=0,
+            num_options=3,
+            reward=float(rng.integers(2)),
+        )
+        for _ in range(num_sub)
+    ]
+    return action_exps, sub_exps
+
+
+class TestBatchGradient(unittest.TestCase):
+    """The vectorized gradients equal the sum of the per-sample gradients."""
+
+    def test_action_gradient_matches_per_sample_loop(self):
+        rng = np.random.default_rng(0)
+        action_exps, _ = _random_experiences(rng, num_action=50, num_sub=0)
+        weights = rng.standard_normal((NUM_FEATURES, 3))
+        expected = sum(compute_action_gradient(e, weights, 3, baseline=0.4) for e in action_exps)
+        buffer = ExperienceBuffer.from_experiences(action_exps, [])
+        grad = compute_batch_action_gradient(
+            buffer.action_features, buffer.action_indices, buffer.action_rewards, weights, 3, baseline=0.4
+        )
+        np.testing.assert_allclose(grad, expected, atol=1e-10)
+
+    def test_sub_gradient_matches_per_sample_loop(self):
+        rng = np.random.default_rng(1)
+        _, sub_exps = _random_experiences(rng, num_action=0, num_sub=40)
+        sub_weights = np.zeros(NUM_SUB_FEATURES)
+        expected = sum(compute_sub_gradient(e, sub_weights, baseline=0.6) for e in sub_exps)
+        buffer = ExperienceBuffer.from_experiences([], sub_exps)
+        grad = compute_batch_sub_gradient(buffer.sub_features, buffer.sub_rewards, baseline=0.6)
+        np.testing.assert_allclose(grad, expected, atol=1e-10)
+
+    def test_train_batch_matches_per_sample_update(self):
+        rng = np.random.default_rng(2)
+        action_exps, sub_exps = _random_experiences(rng, num_action=30, num_sub=20)
+        policy = LinearPolicy()
+        policy.weights = rng.standard_normal(policy.weights.shape)
+        weights, sub_weights = policy.weights.copy(), policy.sub_weights.copy()
+
+        baseline = np.mean([e.reward for e in action_exps] + [e.reward for e in sub_exps])
+        n = policy.num_actions
+        action_grad = sum(compute_action_gradient(e, weights, n, baseline=baseline) for e in action_exps)
+        sub_grad = sum(compute_sub_gradient(e, sub_weights, baseline=baseline) for e in sub_exps)
+        weights[:, :n] += 0.1 * action_grad / len(action_exps)
+        sub_weights += 0.1 * sub_grad / len(sub_exps)
+
+        self.assertAlmostEqual(train_batch(policy, action_exps, sub_exps, learning_rate=0.1), baseline)
+        np.testing.assert_allclose(policy.weights, weights, atol=1e-10)
+        np.testing.assert_allclose(policy.sub_weights, sub_weights, atol=1e-10)
+
+    def test_train_buffer_matches_train_batch(self):
+        rng = np.random.default_rng(3)
+        action_exps, sub_exps = _random_experiences(rng, num_action=12, num_sub=7)
+        from_lists, from_buffer = LinearPolicy(), LinearPolicy()
+        train_batch(from_lists, action_exps, sub_exps, learning_rate=0.1)
+        train_buffer(from_buffer, ExperienceBuffer.from_experiences(action_exps, sub_exps), learning_rate=0.1)
+        np.testing.assert_allclose(from_buffer.weights, from_lists.weights)
+        np.testing.assert_allclose(from_buffer.sub_weights, from_lists.sub_weights)
+
+    def test_train_buffer_empty_returns_zero(self):
+        self.assertEqual(train_buffer(LinearPolicy(), ExperienceBuffer()), 0.0)
+
+
 if __name__ == "__main__":
     unittest.main()
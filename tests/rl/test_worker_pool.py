@@ -0,0 +1,85 @@
+import unittest
+
+import numpy as np
+
+from src.rl.evaluator import evaluate_parallel
+from src.rl.linear_policy import LinearPolicy
+from src.rl.self_play import SelfPlayRunner
+from src.rl.worker_pool import PolicyWorkerPool, SharedWeights, policy_ref, resolve_policy
+
+
+def _worker_weights_sum(version):
+    policy, _ = resolve_policy(version)
+    return float(policy.weights.sum() + policy.sub_weights.sum())
+
+
+def _worker_version_used(version):
+    return resolve_policy(version)[1]
+
+
+class TestSharedWeights(unittest.TestCase):
+    def setUp(self):
+        self.shared = SharedWeights()
+        self.addCleanup(self.shared.close)
+
+    def test_publish_bumps_even_version(self):
+        policy = LinearPolicy()
+        self.assertEqual(self.shared.version, 0)
+        self.assertEqual(self.shared.publish(policy.weights, policy.sub_weights), 2)
+        self.assertEqual(self.shared.publish(policy.weights, policy.sub_weights), 4)
+
+    def test_reader_sees_published_weights(self):
+        source = LinearPolicy()
+        source.weights[:] = np.random.randn(*source.weights.shape)
+        source.sub_weights[:] = np.random.randn(*source.sub_weights.shape)
+        version = self.shared.publish(source.weights, source.sub_weights)
+
+        reader = SharedWeights(name=self.shared.name)
+        self.addCleanup(reader.close)
+        target = LinearPolicy()
+        self.assertEqual(reader.read_into(target), version)
+        np.testing.assert_array_equal(target.weights, source.weights)
+        np.testing.assert_array_equal(target.sub_weights, source.sub_weights)
+
+
+class TestPolicyWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = PolicyWorkerPool(workers=2)
+        self.addCleanup(self.pool.shutdown)
+
+    def test_unchanged_weights_keep_version(self):
+        policy = LinearPolicy()
+        version = self.pool.publish(policy)
+        self.assertEqual(self.pool.publish(policy), version)
+        policy.weights[0, 0] = 1.0
+        self.assertGreater(self.pool.publish(policy), version)
+
+    def test_workers_follow_weight_updates(self):
+        policy = LinearPolicy()
+        for value in (0.5, -2.0):
+            policy.weights[:] = value
+            version = policy_ref(self.pool, policy)
+            expected = float(policy.weights.sum())
+            self.assertEqual(list(self.pool.map(_worker_weights_sum, [version] * 4)), [expected] * 4)
+
+    def test_task_queued_before_publish_uses_newer_weights(self):
+        policy = LinearPolicy()
+        old_version = policy_ref(self.pool, policy)
+        policy.weights[:] = 1.0
+        new_version = policy_ref(self.pool, policy)
+        self.assertEqual(list(self.pool.map(_worker_version_used, [old_version] * 4)), [new_version] * 4)
+        self.assertEqual(list(self.pool.map(_worker_weights_sum, [old_version] * 2)), [float(policy.weights.sum())] * 2)
+
+    def test_collect_and_evaluate(self):
+        policy = LinearPolicy()
+        buffer, stats = SelfPlayRunner.collect_experience_parallel(
+            policy, num_games=4, num_turns=2, pool=self.pool, workers=2
+        )
+        self.assertEqual(stats["wins"] + stats["losses"] + stats["ties"], 4)
+        self.assertGreater(buffer.num_actions, 0)
+        results = evaluate_parallel(policy, num_games=4, num_turns=2, pool=self.pool, workers=2, backend="batch")
+        self.assertIn("win_rate", results)
+
+
+if __name__ == "__main__":
+    unittest.main()
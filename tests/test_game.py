@@ -1,6 +1,9 @@
+import random
 import unittest
 from unittest.mock import Mock, patch
 
+import numpy as np
+
 from data.bird_list import birds as bird_list
 from src.entities.player import BotPlayer, HumanPlayer
 from src.game import WingspanGame
@@ -89,6 +92,23 @@ class TestWingspanGame(unittest.TestCase):
         self.assertEqual(factory.call_count, 2)
         self.assertIsNot(players[0].policy, players[1].policy)
 
+    def test_rng_deals_and_plays_reproducibly(self):
+        results = []
+        for _ in range(2):
+            game = WingspanGame(num_players=2, num_turns=5, rng=np.random.default_rng(11))
+            hands = [p.get_bird_hand().get_card_names_in_hand() for p in game.game_state.get_players()]
+            game.play()
+            boards = [[b.get_name() for b in p.get_game_board().get_birds()] for p in game.game_state.get_players()]
+            results.append((hands, boards, game.get_player_scores()))
+        self.assertEqual(results[0], results[1])
+
+    def test_rng_leaves_global_random_state_alone(self):
+        py_state = random.getstate()
+        np_state = np.random.get_state()[1].copy()
+        WingspanGame(num_players=2, num_turns=3, rng=np.random.default_rng(0)).play()
+        self.assertEqual(random.getstate(), py_state)
+        np.testing.assert_array_equal(np.random.get_state()[1], np_state)
+
 
 if __name__ == "__main__":
     unittest.main()
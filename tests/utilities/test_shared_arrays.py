@@ -0,0 +1,86 @@
+import os
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from src.rl.experience import ExperienceBuffer
+from src.utilities.shared_arrays import SharedArrays, attach_arrays, export_arrays, map_exported
+
+_SHM_DIR = "/dev/shm"
+
+
+def _export_or_fail(i):
+    if i == 1:
+        raise RuntimeError("chunk failed")
+    return i, export_arrays({"x": np.full(1000, i)})
+
+
+def _segments():
+    return set(os.listdir(_SHM_DIR))
+
+
+class TestSharedArrays(unittest.TestCase):
+    def test_round_trip(self):
+        arrays = {
+            "features": np.arange(12.0).reshape(4, 3),
+            "indices": np.array([3, 1, 2], dtype=np.int64),
+            "empty": np.zeros((0, 5)),
+        }
+        descriptor = pickle.loads(pickle.dumps(export_arrays(arrays)))
+        with attach_arrays(descriptor) as shared:
+            self.assertEqual(set(shared), set(arrays))
+            for key, array in arrays.items():
+                self.assertEqual(shared[key].dtype, array.dtype)
+                np.testing.assert_array_equal(shared[key], array)
+
+    def test_segment_is_freed_after_attach(self):
+        descriptor = export_arrays({"x": np.ones(3)})
+        with attach_arrays(descriptor) as shared:
+            self.assertEqual(shared["x"].sum(), 3.0)
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(name=descriptor.name)
+
+    def test_descriptor_is_small(self):
+        descriptor = export_arrays({"x": np.ones((10_000, 50))})
+        try:
+            self.assertLess(len(pickle.dumps(descriptor)), 500)
+        finally:
+            with attach_arrays(descriptor):
+                pass
+
+
+@unittest.skipUnless(os.path.isdir(_SHM_DIR), "needs /dev/shm to list segments")
+class TestNoLeakedSegments(unittest.TestCase):
+    def test_map_exported_returns_results_in_order(self):
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = map_exported(pool, _export_or_fail, [0, 2, 3], descriptor=lambda r: r[1])
+        self.assertEqual([i for i, _ in results], [0, 2, 3])
+        for i, descriptor in results:
+            with attach_arrays(descriptor) as arrays:
+                self.assertEqual(arrays["x"][0], i)
+
+    def test_failed_task_releases_the_others(self):
+        before = _segments()
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            with self.assertRaises(RuntimeError):
+                map_exported(pool, _export_or_fail, range(6), descriptor=lambda r: r[1])
+        self.assertEqual(_segments(), before)
+
+    def test_failed_merge_releases_the_rest(self):
+        buffers = [ExperienceBuffer() for _ in range(3)]
+        for buffer in buffers:
+            buffer.add_actions(np.ones((2, buffer._action_features.shape[1])), [0, 1], 1.0)
+        before = _segments()
+        descriptors = [buffer.to_shared() for buffer in buffers]
+        # A descriptor whose segment is gone makes the merge fail after the first buffer
+        descriptors.insert(1, SharedArrays(name="wsp_missing_segment", layout=descriptors[0].layout))
+        with self.assertRaises(FileNotFoundError):
+            ExperienceBuffer.merge_shared(descriptors)
+        self.assertEqual(_segments(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
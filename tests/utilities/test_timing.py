@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import patch
+
+from src.utilities.timing import PhaseTimer
+
+
+class TestPhaseTimer(unittest.TestCase):
+    @patch("src.utilities.timing.time.perf_counter", side_effect=[0.0, 2.0, 2.0, 2.5, 3.0, 4.0])
+    def test_accumulates_per_phase_in_order(self, _):
+        timer = PhaseTimer()
+        with timer.phase("self_play"):
+            pass
+        with timer.phase("train"):
+            pass
+        with timer.phase("self_play"):
+            pass
+        self.assertEqual(timer.seconds, {"self_play": 3.0, "train": 0.5})
+        self.assertEqual(list(timer.seconds), ["self_play", "train"])
+        self.assertEqual(timer.total(), 3.5)
+
+    def test_records_phase_that_raises(self):
+        timer = PhaseTimer()
+        with self.assertRaises(RuntimeError), timer.phase("eval"):
+            raise RuntimeError
+        self.assertIn("eval", timer.seconds)
+
+    def test_reset(self):
+        timer = PhaseTimer()
+        with timer.phase("log"):
+            pass
+        timer.reset()
+        self.assertEqual(timer.seconds, {})
+        self.assertEqual(timer.total(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()